@@ -1,5 +1,6 @@
 import argparse
 from argparse import ArgumentParser
+from typing import get_args
 
 import pandas
 from pydantic import ValidationError
@@ -11,6 +12,8 @@ from rfantasy_bingo_stats.cli import (
     BingoArgs,
     PollArgs,
 )
+from rfantasy_bingo_stats.constants import STATE_DB_FILEPATH
+from rfantasy_bingo_stats.data_operations.state_store import StateStore
 from rfantasy_bingo_stats.git_operations import (
     commit_push_pr,
     synchronize_github,
@@ -32,9 +35,14 @@ def model_to_args(parser: ArgumentParser, model: type[BaseModel]) -> None:
                 help=field.description,
             )
         else:
+            # Parse `Optional` fields as their underlying type
+            arg_type = next(
+                (arg for arg in get_args(field.annotation) if arg is not type(None)),
+                field.annotation,
+            )
             parser.add_argument(
                 f"--{name.replace('_', '-')}",
-                type=field.annotation,
+                type=arg_type,
                 default=field.default,
                 help=field.description,
             )
@@ -64,8 +72,15 @@ def cli() -> None:
     except ValidationError:
         bingo_args = None
 
+    # The JSON records are what is committed, so they are kept in step with any SQLite store
+    state_store = StateStore(STATE_DB_FILEPATH) if STATE_DB_FILEPATH.exists() else None
+
     if args.github_pat is not None:
+        if state_store is not None:
+            state_store.export_json()
         synchronize_github(args.github_pat)
+        if state_store is not None:
+            state_store.import_json()
 
     # There are no required args for bingo, but one arg is required for polls
     # Abuse this fact to determine which path to execute
@@ -76,6 +91,8 @@ def cli() -> None:
         poll_main(args, poll_args)
 
     if args.github_pat is not None:
+        if state_store is not None:
+            state_store.export_json()
         LOGGER.info("Pushing changes and opening pull request.")
         commit_push_pr(args.github_pat)
 
@@ -15,6 +15,10 @@ from rfantasy_bingo_stats.cli import (
     BingoArgs,
 )
 from rfantasy_bingo_stats.constants import BingoYearDataPaths
+from rfantasy_bingo_stats.data_operations.card_index import (
+    get_card_summaries,
+    write_card_index,
+)
 from rfantasy_bingo_stats.data_operations.get_data import (
     get_bingo_dataframe,
     get_existing_states,
@@ -49,13 +53,19 @@ def collect_statistics(
     yearly_paths: BingoYearDataPaths,
     card_data: CardData,
     author_data: Mapping[Author, AuthorInfo],
+    stats_workers: int = 1,
 ) -> None:
     """Collect statistics on normalized books and create a rough draft post"""
 
-    bingo_stats = get_bingo_stats(cards, recorded_states, card_data, author_data)
+    bingo_stats = get_bingo_stats(cards, recorded_states, card_data, author_data, stats_workers)
 
     with yearly_paths.output_stats.open("w", encoding="utf8") as stats_file:
         stats_file.write(bingo_stats.model_dump_json(indent=2))
+    write_card_index(
+        get_card_summaries(cards, bingo_stats, recorded_states.get_book_dedupe_map()),
+        yearly_paths.card_index,
+        yearly_paths.card_index_offsets,
+    )
 
     create_markdown(
         bingo_stats,
@@ -89,6 +99,8 @@ def bingo_main(args: Args, bingo_args: BingoArgs) -> None:
             recorded_duplicates,
             recorded_ignores,
             args.skip_authors,
+            args.author_max_edits,
+            args.auto_accept_score,
         )
         LOGGER.info("Updating Bingo authors.")
         updated_data, author_dedupes = update_bingo_authors(
@@ -108,6 +120,8 @@ def bingo_main(args: Args, bingo_args: BingoArgs) -> None:
             args.rescan_keys,
             recorded_duplicates,
             recorded_ignores,
+            args.block_books_by_author,
+            args.auto_accept_score,
         )
 
         LOGGER.info("Updating Bingo books.")
@@ -132,4 +146,5 @@ def bingo_main(args: Args, bingo_args: BingoArgs) -> None:
         data_paths,
         card_data,
         author_data,
+        bingo_args.stats_workers,
     )
@@ -0,0 +1,114 @@
+from collections import defaultdict
+from collections.abc import (
+    Hashable,
+    Sequence,
+)
+from dataclasses import dataclass
+from typing import (
+    Optional,
+    TypeVar,
+)
+
+import numpy as np
+
+from rfantasy_bingo_stats.calculate_statistics.interned_cards import (
+    IntArray,
+    count_in_order,
+)
+from rfantasy_bingo_stats.models.author_info import (
+    AuthorInfo,
+    Ethnicity,
+    Gender,
+    Nationality,
+)
+from rfantasy_bingo_stats.models.author_statistics import AuthorStatistics
+
+Demographic = TypeVar("Demographic", bound=Hashable)
+
+# Every possible value of each demographic, indexed by its code
+GENDERS = tuple(Gender)
+ETHNICITIES = tuple(Ethnicity)
+QUEER_VALUES: tuple[Optional[bool], ...] = (None, True, False)
+NATIONALITIES = tuple(Nationality)
+
+
+@dataclass(frozen=True)
+class DemographicCodes:
+    """The code of each demographic of each author, indexed by author id"""
+
+    gender_codes: IntArray
+    ethnicity_codes: IntArray
+    queer_codes: IntArray
+    nationality_codes: IntArray
+
+
+def get_demographic_codes(author_infos: Sequence[AuthorInfo]) -> DemographicCodes:
+    """Turn the info of each author into demographic codes"""
+    gender_codes = {gender: code for code, gender in enumerate(GENDERS)}
+    ethnicity_codes = {ethnicity: code for code, ethnicity in enumerate(ETHNICITIES)}
+    queer_codes = {queer: code for code, queer in enumerate(QUEER_VALUES)}
+    nationality_codes = {nationality: code for code, nationality in enumerate(NATIONALITIES)}
+    return DemographicCodes(
+        gender_codes=np.array(
+            [gender_codes[author_info.gender] for author_info in author_infos], dtype=np.int64
+        ),
+        ethnicity_codes=np.array(
+            [ethnicity_codes[author_info.ethnicity] for author_info in author_infos],
+            dtype=np.int64,
+        ),
+        queer_codes=np.array(
+            [queer_codes[author_info.queer] for author_info in author_infos], dtype=np.int64
+        ),
+        nationality_codes=np.array(
+            [nationality_codes[author_info.nationality] for author_info in author_infos],
+            dtype=np.int64,
+        ),
+    )
+
+
+def get_author_stats(
+    group_ids: IntArray,
+    author_ids: IntArray,
+    demographic_codes: DemographicCodes,
+    counts: Optional[IntArray] = None,
+) -> dict[int, AuthorStatistics]:
+    """
+    Count the demographics of the authors in each group, optionally counting each author more
+
+    Groups, and the demographics within each group, are in order of first appearance.
+    """
+    author_stats: defaultdict[int, AuthorStatistics] = defaultdict(AuthorStatistics)
+    for group_id, gender, count in count_demographic(
+        group_ids, demographic_codes.gender_codes[author_ids], GENDERS, counts
+    ):
+        author_stats[group_id].gender_count[gender] = count
+    for group_id, ethnicity, count in count_demographic(
+        group_ids, demographic_codes.ethnicity_codes[author_ids], ETHNICITIES, counts
+    ):
+        author_stats[group_id].ethnicity_count[ethnicity] = count
+    for group_id, queer, count in count_demographic(
+        group_ids, demographic_codes.queer_codes[author_ids], QUEER_VALUES, counts
+    ):
+        author_stats[group_id].queer_count[queer] = count
+    for group_id, nationality, count in count_demographic(
+        group_ids, demographic_codes.nationality_codes[author_ids], NATIONALITIES, counts
+    ):
+        author_stats[group_id].nationality_count[nationality] = count
+    return dict(author_stats)
+
+
+def count_demographic(
+    group_ids: IntArray,
+    codes: IntArray,
+    values: Sequence[Demographic],
+    counts: Optional[IntArray],
+) -> list[tuple[int, Demographic, int]]:
+    """Count each demographic value in each group, in order of first appearance"""
+    group_code_keys, group_code_counts = count_in_order(group_ids * len(values) + codes, counts)
+    key_group_ids, key_codes = np.divmod(group_code_keys, len(values))
+    return [
+        (group_id, values[code], count)
+        for group_id, code, count in zip(
+            key_group_ids.tolist(), key_codes.tolist(), group_code_counts.tolist()
+        )
+    ]
@@ -2,11 +2,20 @@ from collections import (
     Counter,
     defaultdict,
 )
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from itertools import (
+    batched,
+    repeat,
+)
+from math import ceil
 from numbers import Number
 from types import MappingProxyType as MAP
 from typing import (
+    Iterable,
     Mapping,
     Optional,
+    Sequence,
     cast,
 )
 
@@ -14,9 +23,21 @@ import inflect
 import numpy as np
 import pandas
 
-from rfantasy_bingo_stats.data_operations.author_title_book_operations import (
-    book_to_title_author,
-    title_author_to_book,
+from rfantasy_bingo_stats.calculate_statistics.author_demographics import (
+    get_author_stats,
+    get_demographic_codes,
+)
+from rfantasy_bingo_stats.calculate_statistics.interned_cards import (
+    NO_ID,
+    BoolArray,
+    Interner,
+    count_pairs_in_order,
+    get_card_counter,
+    get_counter,
+    get_first_occurrences,
+    get_pair_keys,
+    get_square_masks,
+    intern_cards,
 )
 from rfantasy_bingo_stats.models.author_info import AuthorInfo
 from rfantasy_bingo_stats.models.author_statistics import AuthorStatistics
@@ -39,11 +60,15 @@ from rfantasy_bingo_stats.models.defined_types import (
     Title,
     TitleCol,
 )
+from rfantasy_bingo_stats.models.partial_bingo_statistics import PartialBingoStatistics
 from rfantasy_bingo_stats.models.recorded_states import RecordedDupes
 from rfantasy_bingo_stats.models.unique_statistics import UniqueStatistics
 
 BINGO_SIZE = 5
 
+# Each statistics process keeps the mappings it needs for every shard, in `init_stats_worker`
+STATS_WORKER_STATE: dict[str, object] = {}
+
 
 def get_possible_bingos() -> Mapping[BingoName, frozenset[int]]:
     inflector = inflect.engine()
@@ -69,80 +94,104 @@ def get_possible_bingos() -> Mapping[BingoName, frozenset[int]]:
 
 
 POSSIBLE_BINGOS = get_possible_bingos()
+# Each bingo as a bitmask of its square numbers, to match against the squares of every card at once
+BINGO_MASKS = np.array(
+    [sum(1 << int(square_num) for square_num in bingo) for bingo in POSSIBLE_BINGOS.values()],
+    dtype=np.int64,
+)
 
 
-def get_short_story_square(  # type: ignore[explicit-any]
-    row: pandas.Series,
+def get_card_columns(
+    data: pandas.DataFrame,
     card_data: CardData,
-) -> Optional[ShortStorySquare]:
-    """Get a square of five short stories"""
-    shorts = []
-    for ss_title_col, ss_author_col, _ in card_data.short_story_title_author_hm_cols:
-        ss_title = row[ss_title_col]
-        ss_author = row[ss_author_col]
-
-        if ss_title and ss_author:
-            shorts.append(
-                (
-                    Title(ss_title),
-                    Author(ss_author),
+) -> Mapping[str, list[Optional[str]]]:
+    """Extract every column a card is built from, once, as plain lists"""
+    card_columns: list[str] = [
+        col
+        for title_author_hm_cols in card_data.all_title_author_hm_columns
+        for col in title_author_hm_cols
+        if len(col) > 0
+    ]
+    if card_data.subbed_by_square:
+        card_columns.extend(
+            f"SQUARE {square_num+1}: SUBSTITUTION"
+            for square_num in range(len(card_data.square_names))
+        )
+    else:
+        card_columns.extend(("SUBBED OUT", "SUBBED IN"))
+
+    return {col: data[col].tolist() for col in card_columns if col in data.columns}
+
+
+def get_short_story_squares(
+    card_columns: Mapping[str, list[Optional[str]]],
+    card_data: CardData,
+) -> list[Optional[ShortStorySquare]]:
+    """Get the square of five short stories on each card, if it was completed that way"""
+    story_columns = tuple(
+        zip(card_columns[ss_title_col], card_columns[ss_author_col])
+        for ss_title_col, ss_author_col, _ in card_data.short_story_title_author_hm_cols
+    )
+
+    squares: list[Optional[ShortStorySquare]] = []
+    for shorts in zip(*story_columns):
+        if all(ss_title and ss_author for ss_title, ss_author in shorts):
+            squares.append(
+                ShortStorySquare(
+                    title=Title(""),
+                    author=Author(""),
+                    hard_mode=False,
+                    stories=tuple(
+                        (Title(ss_title), Author(ss_author)) for ss_title, ss_author in shorts
+                    ),
                 )
             )
         else:
-            return None
-
-    return ShortStorySquare(
-        title=Title(""),
-        author=Author(""),
-        hard_mode=False,
-        stories=tuple(shorts),
-    )
+            squares.append(None)
+    return squares
 
 
-def get_bingo_square(  # type: ignore[explicit-any]
-    row: pandas.Series,
+def get_bingo_squares(
+    card_columns: Mapping[str, list[Optional[str]]],
     title_col: TitleCol,
     author_col: AuthorCol,
     hm_col: HardModeCol,
-    card_data: CardData,
-) -> Optional[BingoSquare]:
-    """Get a single bingo square"""
-    title = row[title_col]
-    author = row[author_col]
-    if len(hm_col) > 0:
-        hard_mode = bool(row[hm_col])
-    else:
-        hard_mode = True
-
-    # This captures hard mode short story squares (collections/anthologies)
-    if title and author:
-        return BingoSquare(
-            title=Title(title),
-            author=Author(author),
-            hard_mode=hard_mode,
+    fallback_squares: Iterable[Optional[BingoSquare]],
+) -> list[Optional[BingoSquare]]:
+    """Get one square of every card, or its fallback if no book was given"""
+    hard_modes: Iterable[object] = card_columns[hm_col] if len(hm_col) > 0 else repeat(True)
+
+    # Titles and authors given together also capture hard mode short story squares
+    # (collections/anthologies)
+    return [
+        (
+            BingoSquare(
+                title=Title(title),
+                author=Author(author),
+                hard_mode=bool(hard_mode),
+            )
+            if title and author
+            else fallback_square
         )
-
-    if str(card_data.short_story_square_num) in title_col:
-        return get_short_story_square(row, card_data)
-
-    return None
+        for title, author, hard_mode, fallback_square in zip(
+            card_columns[title_col],
+            card_columns[author_col],
+            hard_modes,
+            fallback_squares,
+        )
+    ]
 
 
-def get_bingo_card(  # type: ignore[explicit-any]
-    row: pandas.Series,
+def get_bingo_card(
+    squares: Iterable[tuple[SquareName, Optional[BingoSquare]]],
     subbed_square_map: Mapping[SquareName, SquareName],
-    card_data: CardData,
 ) -> BingoCard:
-    """Get a single bingo card"""
+    """Get a single bingo card from its squares, in order"""
     final_sub_map = dict(subbed_square_map)
     card: dict[SquareName, Optional[BingoSquare]] = {}
-    for title_col, author_col, hm_col in card_data.novel_title_author_hm_cols:
-        square_name = card_data.square_names[title_col]
-
+    for square_name, square in squares:
         real_square_name = subbed_square_map.get(square_name, square_name)
 
-        square = get_bingo_square(row, title_col, author_col, hm_col, card_data)
-
         card[real_square_name] = square
 
         if square is None and square_name != real_square_name:
@@ -151,7 +200,39 @@ def get_bingo_card(  # type: ignore[explicit-any]
     return BingoCard(MAP(card), final_sub_map)
 
 
+def get_subbed_square_maps(
+    card_columns: Mapping[str, list[Optional[str]]],
+    card_data: CardData,
+    card_count: int,
+) -> list[dict[SquareName, SquareName]]:
+    """Get the squares each card substituted, by the square they replaced"""
+    if not card_data.subbed_by_square:
+        return [
+            (
+                {SquareName(subbed_out): SquareName(subbed_in)}
+                if subbed_out is not None and subbed_in is not None
+                else {}
+            )
+            for subbed_out, subbed_in in zip(card_columns["SUBBED OUT"], card_columns["SUBBED IN"])
+        ]
+
+    subbed_square_maps: list[dict[SquareName, SquareName]] = [{} for _ in range(card_count)]
+    for square_num, square_name in enumerate(card_data.square_names.values()):
+        subbed_vals = card_columns.get(f"SQUARE {square_num+1}: SUBSTITUTION")
+        if subbed_vals is None:
+            continue
+        for subbed_square_map, subbed_val in zip(subbed_square_maps, subbed_vals):
+            if subbed_val is not None and len(subbed_val) > 0:
+                subbed_square_map[square_name] = SquareName(subbed_val)
+    return subbed_square_maps
+
+
 def get_bingo_cards(data: pandas.DataFrame, card_data: CardData) -> Mapping[CardID, BingoCard]:
+    """
+    Get every bingo card in the data, by card number
+
+    Each square is built for every card at once from its columns, rather than card by card.
+    """
     missing = sum(
         f"SQUARE {square_num+1}: SUBSTITUTION" not in data.columns
         for square_num in range(len(card_data.square_names))
@@ -162,243 +243,380 @@ def get_bingo_cards(data: pandas.DataFrame, card_data: CardData) -> Mapping[Card
             f"Missing {missing} substitution squares, more than the expected {card_data.expected_unsubbable}"
         )
 
+    card_columns = get_card_columns(data, card_data)
+    card_count = len(data.index)
+
+    short_story_squares = get_short_story_squares(card_columns, card_data)
+    square_columns = tuple(
+        (
+            card_data.square_names[title_col],
+            get_bingo_squares(
+                card_columns,
+                title_col,
+                author_col,
+                hm_col,
+                (
+                    short_story_squares
+                    if str(card_data.short_story_square_num) in title_col
+                    else repeat(None, card_count)
+                ),
+            ),
+        )
+        for title_col, author_col, hm_col in card_data.novel_title_author_hm_cols
+    )
+    subbed_square_maps = get_subbed_square_maps(card_columns, card_data, card_count)
+
     cards: dict[CardID, BingoCard] = {}
-    for index, row in data.iterrows():
+    for position, index in enumerate(data.index.tolist()):
         if index is None:
             continue
-        card_id = CardID(str(index))
-
-        if card_data.subbed_by_square:
-            subbed_square_map = {}
-            for square_num, square_name in enumerate(card_data.square_names.values()):
-                subbed_val = row.get(f"SQUARE {square_num+1}: SUBSTITUTION")
-                if subbed_val is not None and len(subbed_val) > 0:
-                    subbed_square_map[square_name] = SquareName(subbed_val)
-        else:
-            if row["SUBBED OUT"] is not None and row["SUBBED IN"] is not None:
-                subbed_square_map = {SquareName(row["SUBBED OUT"]): SquareName(row["SUBBED IN"])}
-            else:
-                subbed_square_map = {}
 
-        bingo_card = get_bingo_card(row, subbed_square_map, card_data)
-
-        cards[card_id] = bingo_card
+        cards[CardID(str(index))] = get_bingo_card(
+            ((square_name, squares[position]) for square_name, squares in square_columns),
+            subbed_square_maps[position],
+        )
 
     return MAP(cards)
 
 
+def init_stats_worker(
+    book_dedupe_map: Mapping[Book, Book],
+    author_data: Mapping[Author, AuthorInfo],
+) -> None:
+    """Keep the mappings used by every shard of cards a worker process handles"""
+    STATS_WORKER_STATE["book_dedupe_map"] = book_dedupe_map
+    STATS_WORKER_STATE["author_data"] = author_data
+
+
+def get_shard_stats(shard: tuple[tuple[CardID, BingoCard], ...]) -> PartialBingoStatistics:
+    """Get the statistics of a shard of cards in a worker process"""
+    return get_partial_bingo_stats(
+        dict(shard),
+        cast(Mapping[Book, Book], STATS_WORKER_STATE["book_dedupe_map"]),
+        cast(Mapping[Author, AuthorInfo], STATS_WORKER_STATE["author_data"]),
+    )
+
+
 def get_bingo_stats(
     cards: Mapping[CardID, BingoCard],
     recorded_states: RecordedDupes,
     card_data: CardData,
     author_data: Mapping[Author, AuthorInfo],
+    workers: int = 1,
 ) -> BingoStatistics:
-    """Get tuple of bingo cards with substituted names"""
-
-    subbed_count: Counter[tuple[SquareName, SquareName]] = Counter()
-    subbed_out_squares: Counter[SquareName] = Counter()
-    incomplete_card_count: Counter[CardID] = Counter()
-    incomplete_square_count: Counter[SquareName] = Counter()
-    square_uniques: defaultdict[SquareName, UniqueStatistics] = defaultdict(UniqueStatistics)
-    unique_square_book_usage: defaultdict[Book, set[SquareName]] = defaultdict(set)
-    unique_square_author_usage: defaultdict[Author, set[SquareName]] = defaultdict(set)
-    dedupes_by_card: Counter[CardID] = Counter()
-    dedupes_by_book: defaultdict[Book, set[Book]] = defaultdict(set)
-    all_books: Counter[Book] = Counter()
-    all_authors: Counter[Author] = Counter()
-    total_story_count = 0
-    card_uniques: Counter[CardID] = Counter()
-    hard_mode_by_card: Counter[CardID] = Counter()
-    hard_mode_by_square: Counter[SquareName] = Counter()
-    books_by_author: defaultdict[Author, set[Book]] = defaultdict(set)
-    complete_bingos_by_card: Counter[CardID] = Counter()
-    incomplete_squares_by_bingo: Counter[BingoName] = Counter()
-    incomplete_bingos: Counter[BingoName] = Counter()
-    complete_hardmode_bingos_by_card: Counter[CardID] = Counter()
-    incomplete_hardmode_squares_by_bingo: Counter[BingoName] = Counter()
-    incomplete_hardmode_bingos: Counter[BingoName] = Counter()
-
-    overall_author_stats: AuthorStatistics = AuthorStatistics()
-    square_author_stats: defaultdict[SquareName, AuthorStatistics] = defaultdict(AuthorStatistics)
-    unique_author_stats: AuthorStatistics = AuthorStatistics()
-    unique_square_author_stats: defaultdict[SquareName, AuthorStatistics] = defaultdict(
-        AuthorStatistics
-    )
+    """
+    Get tuple of bingo cards with substituted names
 
+    With more than one worker, the cards are split into a shard per worker process,
+    and the statistics of each shard are merged in card order.
+    """
     book_dedupe_map = recorded_states.get_book_dedupe_map()
+    if workers <= 1 or len(cards) <= 1:
+        return resolve_bingo_stats(
+            get_partial_bingo_stats(cards, book_dedupe_map, author_data), card_data, author_data
+        )
 
-    current_square_names = frozenset(card_data.square_names.values())
-    for square_name in current_square_names:
-        subbed_out_squares[square_name] += 0
+    # Cards are rebuilt from plain dicts, as mapping proxies cannot be sent to other processes
+    picklable_cards = (
+        (card_id, BingoCard(dict(bingo_card.squares), dict(bingo_card.subbed_square_map)))
+        for card_id, bingo_card in cards.items()
+    )
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_stats_worker,
+        initargs=(dict(book_dedupe_map), dict(author_data)),
+    ) as executor:
+        partial_stats = reduce(
+            PartialBingoStatistics.merge,
+            executor.map(get_shard_stats, batched(picklable_cards, ceil(len(cards) / workers))),
+        )
+    return resolve_bingo_stats(partial_stats, card_data, author_data)
 
-    for card_id, bingo_card in cards.items():
 
+def get_partial_bingo_stats(
+    cards: Mapping[CardID, BingoCard],
+    book_dedupe_map: Mapping[Book, Book],
+    author_data: Mapping[Author, AuthorInfo],
+) -> PartialBingoStatistics:
+    """
+    Get the statistics of some consecutive bingo cards
+
+    Squares, books and authors are counted by interned id, with every count kept in the order
+    its key first appeared on the cards.
+    """
+    interned = intern_cards(cards, book_dedupe_map, BINGO_SIZE**2)
+    card_ids = interned.card_ids
+    square_names = interned.square_names.values
+    books = interned.books.values
+    misspellings = interned.misspellings.values
+    authors = interned.authors.values
+
+    subbed_squares: Counter[tuple[SquareName, SquareName]] = Counter()
+    subbed_out_squares: Counter[SquareName] = Counter()
+    for bingo_card in cards.values():
         for subbed_out_square, subbed_in_square in bingo_card.subbed_square_map.items():
-            subbed_count[(subbed_out_square, subbed_in_square)] += 1
+            subbed_squares[(subbed_out_square, subbed_in_square)] += 1
             subbed_out_squares[subbed_out_square] += 1
 
-        hard_mode_by_card[card_id] += 0
-        completed_square_nums = set()
-        completed_hardmode_square_nums = set()
-        for square_num, (square_name, square) in enumerate(bingo_card.squares.items()):
-            if square is not None:
-                completed_square_nums.add(square_num)
-                if square.hard_mode:
-                    completed_hardmode_square_nums.add(square_num)
-                if not isinstance(square, ShortStorySquare):
-                    book = title_author_to_book((square.title, square.author))
-                    _, author = book_to_title_author(book)
-
-                    if book in book_dedupe_map:
-                        orig_book = book
-                        book = book_dedupe_map[book]
-
-                        _, author = book_to_title_author(book)
-
-                        dedupes_by_card[card_id] += 1
-                        dedupes_by_book[book].add(orig_book)
-
-                    square_uniques[square_name].unique_books[book] += 1
-                    unique_square_book_usage[book].add(square_name)
-
-                    all_books[book] += 1
-
-                    for split_author in author.split(", "):  # pylint: disable=no-member
-                        single_author = Author(split_author)
-                        new_author = False
-                        new_square_author = False
-                        if author not in all_authors:
-                            new_author = True
-                        if author not in square_uniques[square_name].unique_authors:
-                            new_square_author = True
-
-                        all_authors[single_author] += 1
-                        square_uniques[square_name].unique_authors[single_author] += 1
-                        unique_square_author_usage[single_author].add(square_name)
-                        books_by_author[single_author].add(book)
-
-                        author_info = author_data.get(single_author, AuthorInfo())
-
-                        overall_author_stats.gender_count[author_info.gender] += 1
-                        overall_author_stats.ethnicity_count[author_info.ethnicity] += 1
-                        overall_author_stats.queer_count[author_info.queer] += 1
-                        overall_author_stats.nationality_count[author_info.nationality] += 1
-
-                        square_author_stats[square_name].gender_count[author_info.gender] += 1
-                        square_author_stats[square_name].ethnicity_count[
-                            author_info.ethnicity
-                        ] += 1
-                        square_author_stats[square_name].queer_count[author_info.queer] += 1
-                        square_author_stats[square_name].nationality_count[
-                            author_info.nationality
-                        ] += 1
-
-                        if new_author:
-                            unique_author_stats.gender_count[author_info.gender] += 1
-                            unique_author_stats.ethnicity_count[author_info.ethnicity] += 1
-                            unique_author_stats.queer_count[author_info.queer] += 1
-                            unique_author_stats.nationality_count[author_info.nationality] += 1
-                        if new_square_author:
-                            unique_square_author_stats[square_name].gender_count[
-                                author_info.gender
-                            ] += 1
-                            unique_square_author_stats[square_name].ethnicity_count[
-                                author_info.ethnicity
-                            ] += 1
-                            unique_square_author_stats[square_name].queer_count[
-                                author_info.queer
-                            ] += 1
-                            unique_square_author_stats[square_name].nationality_count[
-                                author_info.nationality
-                            ] += 1
-
-                    total_story_count += 1
-
-                    if square.hard_mode:
-                        hard_mode_by_card[card_id] += 1
-                        hard_mode_by_square[square_name] += 1
-
-                else:
-                    total_story_count += len(square.stories)
-            else:
-                incomplete_card_count[card_id] += 1
-                incomplete_square_count[square_name] += 1
-
-        complete_bingos_by_card[card_id] += 0
-        complete_hardmode_bingos_by_card[card_id] += 0
-        for bingo_name, square_nums in POSSIBLE_BINGOS.items():
-            squares_completed = len(completed_square_nums & square_nums)
-            if squares_completed == BINGO_SIZE:
-                complete_bingos_by_card[card_id] += 1
-            else:
-                incomplete_squares_by_bingo[bingo_name] += BINGO_SIZE - squares_completed
-                incomplete_bingos[bingo_name] += 1
-
-            hardmode_squares_completed = len(completed_hardmode_square_nums & square_nums)
-            if hardmode_squares_completed == BINGO_SIZE:
-                complete_hardmode_bingos_by_card[card_id] += 1
-            else:
-                incomplete_hardmode_squares_by_bingo[bingo_name] += (
-                    BINGO_SIZE - hardmode_squares_completed
-                )
-                incomplete_hardmode_bingos[bingo_name] += 1
+    incomplete = (interned.square_name_ids != NO_ID) & ~interned.completed
 
-    # Loop again after collecting `all_books` to determine uniques
-    for card_id, card in cards.items():
-        card_uniques[card_id] += 0
-        for square_name, square in card.squares.items():
-            if square is not None:
-                book = title_author_to_book((square.title, square.author))
-                if book in book_dedupe_map:
-                    book = book_dedupe_map[book]
+    # Every square with a book, in card order
+    book_rows, book_cols = np.nonzero(interned.book_ids != NO_ID)
+    book_ids = interned.book_ids[book_rows, book_cols]
+    book_square_ids = interned.square_name_ids[book_rows, book_cols]
+    book_misspelling_ids = interned.misspelling_ids[book_rows, book_cols]
+    book_hard_mode = interned.hard_mode[book_rows, book_cols]
+
+    square_uniques: defaultdict[SquareName, UniqueStatistics] = defaultdict(UniqueStatistics)
+    for square_id, book_id, count in zip(
+        *(
+            pair_ids.tolist()
+            for pair_ids in count_pairs_in_order(book_square_ids, book_ids, len(books))
+        )
+    ):
+        square_uniques[square_names[square_id]].unique_books[books[book_id]] = count
+
+    misspelled = book_misspelling_ids != NO_ID
+    misspelled_book_ids, misspelling_ids, misspelling_counts = count_pairs_in_order(
+        book_ids[misspelled], book_misspelling_ids[misspelled], len(misspellings)
+    )
+
+    book_counts = np.bincount(book_ids, minlength=len(books))
+    single = book_counts[book_ids] == 1
+
+    # Every author of every square with a book, in card order
+    occurrences = interned.get_author_occurrences()
+    square_author_square_ids, square_author_ids, square_author_counts = count_pairs_in_order(
+        occurrences.square_name_ids, occurrences.author_ids, len(authors)
+    )
+    for square_id, author_id, count in zip(
+        square_author_square_ids.tolist(),
+        square_author_ids.tolist(),
+        square_author_counts.tolist(),
+    ):
+        square_uniques[square_names[square_id]].unique_authors[authors[author_id]] = count
+    author_book_author_ids, author_book_book_ids, author_book_counts = count_pairs_in_order(
+        occurrences.author_ids, occurrences.book_ids, len(books)
+    )
+
+    # An author is always counted as new when they share a book,
+    # as authors are looked up by the book's full author string
+    first_authors = get_first_occurrences(occurrences.author_ids)
+    first_square_authors = get_first_occurrences(
+        get_pair_keys(occurrences.square_name_ids, occurrences.author_ids, len(authors))
+    )
+    new_authors = occurrences.shared_book | first_authors
+    new_square_authors = occurrences.shared_book | first_square_authors
+    first_new_authors = first_authors & ~occurrences.shared_book
+    first_new_square_authors = first_square_authors & ~occurrences.shared_book
+
+    unknown_author_info = AuthorInfo()
+    demographic_codes = get_demographic_codes(
+        [author_data.get(author, unknown_author_info) for author in authors]
+    )
+    overall_author_stats = get_author_stats(
+        np.zeros_like(occurrences.author_ids), occurrences.author_ids, demographic_codes
+    ).get(0, AuthorStatistics())
+    square_author_stats = {
+        square_names[square_id]: author_stats
+        for square_id, author_stats in get_author_stats(
+            occurrences.square_name_ids, occurrences.author_ids, demographic_codes
+        ).items()
+    }
+
+    return PartialBingoStatistics(
+        card_ids=card_ids,
+        story_count=int(interned.story_counts.sum()),
+        incomplete_cards=get_card_counter(card_ids, np.nonzero(incomplete)[0], False),
+        incomplete_squares=get_counter(square_names, interned.square_name_ids[incomplete]),
+        subbed_squares=subbed_squares,
+        subbed_out_squares=subbed_out_squares,
+        overall_uniques=UniqueStatistics(
+            unique_books=get_counter(books, book_ids),
+            unique_authors=get_counter(authors, occurrences.author_ids),
+        ),
+        square_uniques=dict(square_uniques),
+        book_misspellings=Counter(
+            {
+                (books[book_id], misspellings[misspelling_id]): count
+                for book_id, misspelling_id, count in zip(
+                    misspelled_book_ids.tolist(),
+                    misspelling_ids.tolist(),
+                    misspelling_counts.tolist(),
+                )
+            }
+        ),
+        author_books=Counter(
+            {
+                (authors[author_id], books[book_id]): count
+                for author_id, book_id, count in zip(
+                    author_book_author_ids.tolist(),
+                    author_book_book_ids.tolist(),
+                    author_book_counts.tolist(),
+                )
+            }
+        ),
+        bad_spellings_by_card=get_card_counter(card_ids, book_rows[misspelled], False),
+        hard_mode_by_card=get_card_counter(card_ids, book_rows[book_hard_mode], True),
+        hard_mode_by_square=get_counter(square_names, book_square_ids[book_hard_mode]),
+        overall_author_stats=overall_author_stats,
+        square_author_stats=dict(square_author_stats),
+        single_book_cards={
+            books[book_id]: card_ids[card_num]
+            for book_id, card_num in zip(book_ids[single].tolist(), book_rows[single].tolist())
+        },
+        new_authors=get_counter(authors, occurrences.author_ids[new_authors]),
+        first_new_authors=frozenset(
+            authors[author_id] for author_id in occurrences.author_ids[first_new_authors].tolist()
+        ),
+        new_square_authors=Counter(
+            {
+                (square_names[square_id], authors[author_id]): count
+                for square_id, author_id, count in zip(
+                    *(
+                        pair_ids.tolist()
+                        for pair_ids in count_pairs_in_order(
+                            occurrences.square_name_ids[new_square_authors],
+                            occurrences.author_ids[new_square_authors],
+                            len(authors),
+                        )
+                    )
+                )
+            }
+        ),
+        first_new_square_authors=frozenset(
+            zip(
+                (
+                    square_names[square_id]
+                    for square_id in occurrences.square_name_ids[first_new_square_authors].tolist()
+                ),
+                (
+                    authors[author_id]
+                    for author_id in occurrences.author_ids[first_new_square_authors].tolist()
+                ),
+            )
+        ),
+        normal_bingo_type_stats=get_bingo_type_stats(card_ids, interned.completed),
+        hardmode_bingo_type_stats=get_bingo_type_stats(
+            card_ids, interned.completed & interned.hard_mode
+        ),
+    )
 
-                if all_books[book] == 1:
-                    card_uniques[card_id] += 1
 
+def resolve_bingo_stats(
+    partial_stats: PartialBingoStatistics,
+    card_data: CardData,
+    author_data: Mapping[Author, AuthorInfo],
+) -> BingoStatistics:
+    """Get the statistics of every card from their merged statistics"""
+    # Current squares are listed even if they were never substituted
+    subbed_out_squares: Counter[SquareName] = Counter(
+        dict.fromkeys(frozenset(card_data.square_names.values()), 0)
+    )
+    subbed_out_squares.update(partial_stats.subbed_out_squares)
+
+    squares_by_book: Counter[Book] = Counter()
+    squares_by_author: Counter[Author] = Counter()
+    for square_uniques in partial_stats.square_uniques.values():
+        squares_by_book.update(square_uniques.unique_books.keys())
+        squares_by_author.update(square_uniques.unique_authors.keys())
+
+    card_uniques: Counter[CardID] = Counter(dict.fromkeys(partial_stats.card_ids, 0))
+    card_uniques.update(partial_stats.single_book_cards.values())
+
+    # Every author appears in the new authors, as their first appearance is always new
+    authors = tuple(partial_stats.new_authors)
+    author_ids = {author: author_id for author_id, author in enumerate(authors)}
+    unknown_author_info = AuthorInfo()
+    demographic_codes = get_demographic_codes(
+        [author_data.get(author, unknown_author_info) for author in authors]
+    )
+    unique_author_stats = get_author_stats(
+        np.zeros(len(authors), dtype=np.int64),
+        np.arange(len(authors), dtype=np.int64),
+        demographic_codes,
+        np.array(list(partial_stats.new_authors.values()), dtype=np.int64),
+    ).get(0, AuthorStatistics())
+    square_names: Interner[SquareName] = Interner()
+    square_ids = [
+        square_names.get_id(square_name) for square_name, _ in partial_stats.new_square_authors
+    ]
+    unique_square_author_stats = {
+        square_names.values[square_id]: author_stats
+        for square_id, author_stats in get_author_stats(
+            np.array(square_ids, dtype=np.int64),
+            np.array(
+                [author_ids[author] for _, author in partial_stats.new_square_authors],
+                dtype=np.int64,
+            ),
+            demographic_codes,
+            np.array(list(partial_stats.new_square_authors.values()), dtype=np.int64),
+        ).items()
+    }
+
+    incomplete_card_count = partial_stats.incomplete_cards
     return BingoStatistics(
-        total_card_count=len(cards),
-        total_story_count=total_story_count,
+        total_card_count=len(partial_stats.card_ids),
+        total_story_count=partial_stats.story_count,
         incomplete_cards=incomplete_card_count,
-        incomplete_squares=incomplete_square_count,
+        incomplete_squares=partial_stats.incomplete_squares,
         max_incomplete_squares=max(
             incomplete
             for incomplete in incomplete_card_count.values()
             if incomplete != BINGO_SIZE**2
         ),
         incomplete_squares_per_card=Counter(incomplete_card_count.values()),
-        subbed_squares=subbed_count,
+        subbed_squares=partial_stats.subbed_squares,
         subbed_out_squares=subbed_out_squares,
-        avoided_squares=incomplete_square_count + subbed_out_squares,
-        overall_uniques=UniqueStatistics(unique_books=all_books, unique_authors=all_authors),
-        square_uniques=MAP(square_uniques),
+        avoided_squares=partial_stats.incomplete_squares + subbed_out_squares,
+        overall_uniques=partial_stats.overall_uniques,
+        square_uniques=MAP(partial_stats.square_uniques),
         unique_squares_by_book=Counter(
-            {book: len(squares) for book, squares in unique_square_book_usage.items()}
+            {book: squares_by_book[book] for book in partial_stats.overall_uniques.unique_books}
         ),
         unique_squares_by_author=Counter(
-            {author: len(squares) for author, squares in unique_square_author_usage.items()}
-        ),
-        bad_spellings_by_card=dedupes_by_card,
-        bad_spellings_by_book=Counter(
-            {book: len(variations) for book, variations in dedupes_by_book.items()}
+            {
+                author: squares_by_author[author]
+                for author in partial_stats.overall_uniques.unique_authors
+            }
         ),
+        bad_spellings_by_card=partial_stats.bad_spellings_by_card,
+        bad_spellings_by_book=Counter(book for book, _ in partial_stats.book_misspellings),
         card_uniques=card_uniques,
-        hard_mode_by_card=hard_mode_by_card,
-        hard_mode_by_square=hard_mode_by_square,
-        books_per_author=Counter(
-            {author: len(books) for author, books in books_by_author.items()}
-        ),
-        overall_author_stats=overall_author_stats,
-        square_author_stats=square_author_stats,
+        hard_mode_by_card=partial_stats.hard_mode_by_card,
+        hard_mode_by_square=partial_stats.hard_mode_by_square,
+        books_per_author=Counter(author for author, _ in partial_stats.author_books),
+        overall_author_stats=partial_stats.overall_author_stats,
+        square_author_stats=partial_stats.square_author_stats,
         unique_author_stats=unique_author_stats,
         unique_square_author_stats=unique_square_author_stats,
-        normal_bingo_type_stats=BingoTypeStatistics(
-            complete_bingos_by_card=complete_bingos_by_card,
-            incomplete_bingos=incomplete_bingos,
-            incomplete_squares_by_bingo=incomplete_squares_by_bingo,
-        ),
-        hardmode_bingo_type_stats=BingoTypeStatistics(
-            complete_bingos_by_card=complete_hardmode_bingos_by_card,
-            incomplete_bingos=incomplete_hardmode_bingos,
-            incomplete_squares_by_bingo=incomplete_hardmode_squares_by_bingo,
-        ),
+        normal_bingo_type_stats=partial_stats.normal_bingo_type_stats,
+        hardmode_bingo_type_stats=partial_stats.hardmode_bingo_type_stats,
+    )
+
+
+def get_bingo_type_stats(card_ids: Sequence[CardID], completed: BoolArray) -> BingoTypeStatistics:
+    """Count the complete and incomplete bingos of each card, from its completed squares"""
+    # Squares completed in each bingo of each card, with a row per card and a column per bingo
+    squares_completed = np.bitwise_count(get_square_masks(completed)[:, np.newaxis] & BINGO_MASKS)
+    is_incomplete = squares_completed != BINGO_SIZE
+    complete_bingos = (~is_incomplete).sum(axis=1)
+    incomplete_counts = is_incomplete.sum(axis=0)
+    missing_square_counts = (BINGO_SIZE - squares_completed).sum(axis=0)
+
+    incomplete_bingos: Counter[BingoName] = Counter()
+    incomplete_squares_by_bingo: Counter[BingoName] = Counter()
+    bingo_names = tuple(POSSIBLE_BINGOS)
+    # Bingos are counted in the order they were first left incomplete
+    for bingo_num in np.argsort(is_incomplete.argmax(axis=0), kind="stable").tolist():
+        if incomplete_counts[bingo_num]:
+            incomplete_bingos[bingo_names[bingo_num]] = int(incomplete_counts[bingo_num])
+            incomplete_squares_by_bingo[bingo_names[bingo_num]] = int(
+                missing_square_counts[bingo_num]
+            )
+
+    return BingoTypeStatistics(
+        complete_bingos_by_card=Counter(dict(zip(card_ids, complete_bingos.tolist()))),
+        incomplete_bingos=incomplete_bingos,
+        incomplete_squares_by_bingo=incomplete_squares_by_bingo,
     )
@@ -0,0 +1,245 @@
+from collections import Counter
+from collections.abc import (
+    Hashable,
+    Mapping,
+    Sequence,
+)
+from dataclasses import dataclass
+from typing import (
+    Generic,
+    Optional,
+    TypeVar,
+)
+
+import numpy as np
+import numpy.typing as npt
+
+from rfantasy_bingo_stats.data_operations.author_title_book_operations import (
+    book_to_title_author,
+    title_author_to_book,
+)
+from rfantasy_bingo_stats.models.bingo_card import (
+    BingoCard,
+    ShortStorySquare,
+)
+from rfantasy_bingo_stats.models.defined_types import (
+    Author,
+    Book,
+    CardID,
+    SquareName,
+)
+
+Interned = TypeVar("Interned", bound=Hashable)
+
+IntArray = npt.NDArray[np.int64]
+BoolArray = npt.NDArray[np.bool_]
+
+# Stands in for the id of a square, book or misspelling that is not there
+NO_ID = -1
+
+
+class Interner(Generic[Interned]):
+    """Dense integer ids for distinct values, numbered in order of first appearance"""
+
+    def __init__(self) -> None:
+        self.values: list[Interned] = []
+        self._ids: dict[Interned, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def get_id(self, value: Interned) -> int:
+        """Get the id of a value, giving it the next id if it is new"""
+        value_id = self._ids.get(value)
+        if value_id is None:
+            value_id = len(self.values)
+            self._ids[value] = value_id
+            self.values.append(value)
+        return value_id
+
+
+@dataclass(frozen=True)
+class AuthorOccurrences:
+    """Every author of every book square, in the order the cards and squares were read"""
+
+    author_ids: IntArray
+    book_ids: IntArray
+    square_name_ids: IntArray
+    # Whether each author shares their book with another author
+    shared_book: BoolArray
+
+
+@dataclass(frozen=True)
+class InternedCards:
+    """
+    Bingo cards as arrays of ids, with a row per card and a column per square position
+
+    Positions past the last square of a card are not present.
+    Books are deduplicated, and each keeps the id of its misspelling if it had one.
+    """
+
+    card_ids: tuple[CardID, ...]
+    square_names: Interner[SquareName]
+    books: Interner[Book]
+    misspellings: Interner[Book]
+    authors: Interner[Author]
+    # The authors of each book are `book_author_ids[book_author_starts[book]:...[book + 1]]`
+    book_author_ids: IntArray
+    book_author_starts: IntArray
+    square_name_ids: IntArray
+    book_ids: IntArray
+    misspelling_ids: IntArray
+    completed: BoolArray
+    hard_mode: BoolArray
+    story_counts: IntArray
+
+    def get_author_occurrences(self) -> AuthorOccurrences:
+        """Expand every book square into one entry per author of its book"""
+        book_rows, book_cols = np.nonzero(self.book_ids != NO_ID)
+        book_ids = self.book_ids[book_rows, book_cols]
+        author_counts = np.diff(self.book_author_starts)[book_ids]
+
+        book_occurrences = np.repeat(np.arange(len(book_ids)), author_counts)
+        ends = np.cumsum(author_counts)
+        within_book = np.arange(len(book_occurrences)) - (ends - author_counts)[book_occurrences]
+        return AuthorOccurrences(
+            author_ids=self.book_author_ids[
+                self.book_author_starts[book_ids][book_occurrences] + within_book
+            ],
+            book_ids=book_ids[book_occurrences],
+            square_name_ids=self.square_name_ids[book_rows, book_cols][book_occurrences],
+            shared_book=author_counts[book_occurrences] > 1,
+        )
+
+
+def intern_cards(
+    cards: Mapping[CardID, BingoCard],
+    book_dedupe_map: Mapping[Book, Book],
+    square_count: int,
+) -> InternedCards:
+    """Give each square name, deduplicated book and author an id, and lay out the cards by id"""
+    square_names: Interner[SquareName] = Interner()
+    books: Interner[Book] = Interner()
+    misspellings: Interner[Book] = Interner()
+    authors: Interner[Author] = Interner()
+    book_author_ids: list[int] = []
+    book_author_starts = [0]
+
+    # Filled in as flat lists, which are much faster to set one item at a time than arrays
+    cell_count = len(cards) * square_count
+    square_name_ids = [NO_ID] * cell_count
+    book_ids = [NO_ID] * cell_count
+    misspelling_ids = [NO_ID] * cell_count
+    completed = [False] * cell_count
+    hard_mode = [False] * cell_count
+    story_counts = [0] * cell_count
+
+    for card_num, bingo_card in enumerate(cards.values()):
+        for square_num, (square_name, square) in enumerate(bingo_card.squares.items()):
+            cell = card_num * square_count + square_num
+            square_name_ids[cell] = square_names.get_id(square_name)
+            if square is None:
+                continue
+
+            completed[cell] = True
+            hard_mode[cell] = square.hard_mode
+            if isinstance(square, ShortStorySquare):
+                story_counts[cell] = len(square.stories)
+                continue
+
+            story_counts[cell] = 1
+            book = title_author_to_book((square.title, square.author))
+            if book in book_dedupe_map:
+                misspelling_ids[cell] = misspellings.get_id(book)
+                book = book_dedupe_map[book]
+
+            book_id = books.get_id(book)
+            book_ids[cell] = book_id
+            if book_id == len(book_author_starts) - 1:
+                _, author = book_to_title_author(book)
+                book_author_ids.extend(
+                    authors.get_id(Author(split_author)) for split_author in author.split(", ")
+                )
+                book_author_starts.append(len(book_author_ids))
+
+    shape = (len(cards), square_count)
+    return InternedCards(
+        card_ids=tuple(cards),
+        square_names=square_names,
+        books=books,
+        misspellings=misspellings,
+        authors=authors,
+        book_author_ids=np.array(book_author_ids, dtype=np.int64),
+        book_author_starts=np.array(book_author_starts, dtype=np.int64),
+        square_name_ids=np.array(square_name_ids, dtype=np.int64).reshape(shape),
+        book_ids=np.array(book_ids, dtype=np.int64).reshape(shape),
+        misspelling_ids=np.array(misspelling_ids, dtype=np.int64).reshape(shape),
+        completed=np.array(completed, dtype=np.bool_).reshape(shape),
+        hard_mode=np.array(hard_mode, dtype=np.bool_).reshape(shape),
+        story_counts=np.array(story_counts, dtype=np.int64).reshape(shape),
+    )
+
+
+def count_in_order(
+    keys: IntArray, weights: Optional[IntArray] = None
+) -> tuple[IntArray, IntArray]:
+    """Count each distinct key, or total its weights, in order of first appearance"""
+    unique_keys, first_positions, inverse, counts = np.unique(
+        keys, return_index=True, return_inverse=True, return_counts=True
+    )
+    if weights is not None:
+        counts = np.bincount(inverse, weights=weights, minlength=len(unique_keys)).astype(np.int64)
+    order = np.argsort(first_positions, kind="stable")
+    return unique_keys[order], counts[order]
+
+
+def get_first_occurrences(keys: IntArray) -> BoolArray:
+    """Get whether each key is the first of its value"""
+    first_occurrences = np.zeros(len(keys), dtype=np.bool_)
+    first_occurrences[np.unique(keys, return_index=True)[1]] = True
+    return first_occurrences
+
+
+def count_pairs_in_order(
+    first_ids: IntArray,
+    second_ids: IntArray,
+    second_count: int,
+) -> tuple[IntArray, IntArray, IntArray]:
+    """Count each distinct pair of ids, in order of first appearance"""
+    pair_keys, counts = count_in_order(get_pair_keys(first_ids, second_ids, second_count))
+    pair_first_ids, pair_second_ids = np.divmod(pair_keys, second_count)
+    return pair_first_ids, pair_second_ids, counts
+
+
+def get_pair_keys(first_ids: IntArray, second_ids: IntArray, second_count: int) -> IntArray:
+    """Combine pairs of ids into single keys, to count or deduplicate them together"""
+    return first_ids * second_count + second_ids
+
+
+def get_square_masks(squares: BoolArray) -> IntArray:
+    """Pack the squares of each card into a bitmask, with a bit set per square number"""
+    return squares.astype(np.int64) @ (1 << np.arange(squares.shape[1], dtype=np.int64))
+
+
+def get_counter(values: Sequence[Interned], ids: IntArray) -> Counter[Interned]:
+    """Count the values by id, in order of first appearance"""
+    unique_ids, counts = count_in_order(ids)
+    return Counter(
+        {values[value_id]: count for value_id, count in zip(unique_ids.tolist(), counts.tolist())}
+    )
+
+
+def get_card_counter(
+    card_ids: Sequence[CardID],
+    card_nums: IntArray,
+    keep_zeros: bool,
+) -> Counter[CardID]:
+    """Count the cards by position, in card order, optionally including cards never counted"""
+    card_counts = np.bincount(card_nums, minlength=len(card_ids)).tolist()
+    return Counter(
+        {
+            card_id: count
+            for card_id, count in zip(card_ids, card_counts)
+            if keep_zeros or count > 0
+        }
+    )
@@ -11,6 +11,13 @@ class BingoArgs(BaseModel):
         default=CURRENT_YEAR - 1,
         description="Pass to process a year other than the current.",
     )
+    stats_workers: int = Field(
+        default=1,
+        description="""
+        Pass to split the cards across this many processes when collecting statistics.
+        Only worth it for far more cards than a year of Bingo, as each process has to start up.
+        """,
+    )
 
 
 class PollArgs(BaseModel):
@@ -46,6 +53,26 @@ class Args(BaseModel):
     skip_authors: bool = Field(
         description="Skip deduplicating authors, go straight to books",
     )
+    block_books_by_author: bool = Field(
+        description="""
+        Only match books against books by the same canonical author or a close variant.
+        Much faster, but misses duplicates whose authors differ by more than `match-score`.
+        """,
+    )
+    author_max_edits: Optional[int] = Field(
+        default=None,
+        description="""
+        Pass to only match authors within this many edits of each other, e.g. 2.
+        Much faster, but misses duplicates that need more edits, such as reordered names.
+        """,
+    )
+    auto_accept_score: Optional[int] = Field(
+        default=None,
+        description="""
+        Pass to record a lone match scoring at least this much without prompting.
+        Automatic matches are logged, and can be reverted with `revert-auto-matches`.
+        """,
+    )
     github_pat: Optional[str] = Field(
         default=None,
         description="Pass to automatically commit and push changes to GitHub",
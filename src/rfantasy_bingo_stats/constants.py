@@ -18,6 +18,17 @@ IGNORED_RECORD_FILEPATH: Path = BINGO_DATA_PATH / "ignored_duplicates.json"
 AUTHOR_INFO_FILEPATH: Path = BINGO_DATA_PATH / "author_records.json"
 BOOK_INFO_FILEPATH: Path = BINGO_DATA_PATH / "book_records.json"
 YOY_DATA_FILEPATH: Path = BINGO_DATA_PATH / "year_over_year_stats.json"
+AUTO_MATCH_LOG_FILEPATH: Path = BINGO_DATA_PATH / "auto_matches.jsonl"
+# Decisions made since the duplicate and ignore records were last saved in full
+DECISION_JOURNAL_FILEPATH: Path = BINGO_DATA_PATH / "decision_journal.jsonl"
+# Optional SQLite copy of the records above, used instead of them when present
+STATE_DB_FILEPATH: Path = BINGO_DATA_PATH / "state.sqlite"
+
+# Regenerable working files, not committed
+CACHE_PATH = BINGO_DATA_PATH / "cache"
+AUTHOR_CANDIDATES_FILEPATH: Path = CACHE_PATH / "author_candidates.json"
+BOOK_CANDIDATES_FILEPATH: Path = CACHE_PATH / "book_candidates.json"
+MODEL_CACHE_PATH: Path = CACHE_PATH / "models"
 
 
 @dataclass(frozen=True)
@@ -52,6 +63,14 @@ class BingoYearDataPaths:
     def card_info(self) -> Path:
         return self.data_root / "card_data.json"
 
+    @property
+    def card_index(self) -> Path:
+        return self.data_root / "card_index.jsonl"
+
+    @property
+    def card_index_offsets(self) -> Path:
+        return self.data_root / "card_index_offsets.json"
+
 
 @dataclass(frozen=True)
 class PollDataPaths:
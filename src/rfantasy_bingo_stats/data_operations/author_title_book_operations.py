@@ -1,7 +1,8 @@
 from collections import Counter
-from typing import Iterable
-
-import pandas
+from typing import (
+    TYPE_CHECKING,
+    Iterable,
+)
 
 from rfantasy_bingo_stats.constants import TITLE_AUTHOR_SEPARATOR
 from rfantasy_bingo_stats.models.defined_types import (
@@ -12,9 +13,13 @@ from rfantasy_bingo_stats.models.defined_types import (
     TitleAuthorHMCols,
 )
 
+# Only used in annotations, so that reading books and authors does not have to load pandas
+if TYPE_CHECKING:
+    import pandas
+
 
 def get_all_authors(
-    data: pandas.DataFrame,
+    data: "pandas.DataFrame",
     all_cols: tuple[TitleAuthorHMCols, ...],
 ) -> tuple[Author, ...]:
     """Get every author in data"""
@@ -22,7 +27,7 @@ def get_all_authors(
 
 
 def get_all_title_author_combos(
-    data: pandas.DataFrame,
+    data: "pandas.DataFrame",
     all_cols: tuple[TitleAuthorHMCols, ...],
 ) -> tuple[TitleAuthor, ...]:
     """Get every title/author pair in data"""
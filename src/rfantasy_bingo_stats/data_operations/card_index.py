@@ -0,0 +1,90 @@
+from collections.abc import (
+    Iterable,
+    Iterator,
+    Mapping,
+)
+from pathlib import Path
+
+from rfantasy_bingo_stats.data_operations.author_title_book_operations import title_author_to_book
+from rfantasy_bingo_stats.models.bingo_card import BingoCard
+from rfantasy_bingo_stats.models.bingo_statistics import BingoStatistics
+from rfantasy_bingo_stats.models.card_summary import (
+    CardOffsetsAdapter,
+    CardSummary,
+    SquareBookUses,
+)
+from rfantasy_bingo_stats.models.defined_types import (
+    Book,
+    CardID,
+)
+
+
+def get_card_summaries(
+    cards: Mapping[CardID, BingoCard],
+    bingo_stats: BingoStatistics,
+    book_dedupe_map: Mapping[Book, Book],
+) -> list[CardSummary]:
+    """Look up how often the deduplicated book of every filled square was read"""
+    card_summaries = []
+    for card_id, card in cards.items():
+        square_books = []
+        for square_name, square in card.squares.items():
+            if square is None:
+                continue
+            book = title_author_to_book((square.title, square.author))
+            book = book_dedupe_map.get(book, book)
+            square_books.append(
+                SquareBookUses(
+                    square_name=square_name,
+                    book=book,
+                    total_uses=bingo_stats.overall_uniques.unique_books[book],
+                    square_uses=bingo_stats.square_uniques[square_name].unique_books[book],
+                )
+            )
+        card_summaries.append(CardSummary(card_id=card_id, square_books=tuple(square_books)))
+    return card_summaries
+
+
+def write_card_index(
+    card_summaries: Iterable[CardSummary],
+    index_filepath: Path,
+    offsets_filepath: Path,
+) -> None:
+    """
+    Write one summary per line, and where each card's line starts
+
+    Each file replaces the old one only once it is completely written.
+    """
+    offsets: dict[CardID, int] = {}
+    partial_index_filepath = index_filepath.with_suffix(".partial")
+    with partial_index_filepath.open("wb") as index_file:
+        for card_summary in card_summaries:
+            offsets[card_summary.card_id] = index_file.tell()
+            index_file.write(card_summary.model_dump_json().encode("utf8") + b"\n")
+
+    partial_offsets_filepath = offsets_filepath.with_suffix(".partial")
+    partial_offsets_filepath.write_bytes(CardOffsetsAdapter.dump_json(offsets, indent=2))
+
+    partial_index_filepath.replace(index_filepath)
+    partial_offsets_filepath.replace(offsets_filepath)
+
+
+def read_card_summary(
+    card_id: CardID, index_filepath: Path, offsets_filepath: Path
+) -> CardSummary:
+    """Read the summary of a single card, without reading any other card"""
+    offsets = CardOffsetsAdapter.validate_json(offsets_filepath.read_bytes())
+    with index_filepath.open("rb") as index_file:
+        index_file.seek(offsets[card_id])
+        card_summary = CardSummary.model_validate_json(index_file.readline())
+
+    if card_summary.card_id != card_id:
+        raise ValueError(f"Card index {index_filepath.name} needs rebuilding to match its offsets")
+    return card_summary
+
+
+def read_card_summaries(index_filepath: Path) -> Iterator[CardSummary]:
+    """Read the summary of every card, in card order"""
+    with index_filepath.open("rb") as index_file:
+        for line in index_file:
+            yield CardSummary.model_validate_json(line)
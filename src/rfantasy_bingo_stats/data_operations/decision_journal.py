@@ -0,0 +1,127 @@
+from pathlib import Path
+from typing import Literal
+
+from rfantasy_bingo_stats.constants import (
+    DECISION_JOURNAL_FILEPATH,
+    DUPE_RECORD_FILEPATH,
+    IGNORED_RECORD_FILEPATH,
+    STATE_DB_FILEPATH,
+)
+from rfantasy_bingo_stats.logger import LOGGER
+from rfantasy_bingo_stats.models.defined_types import (
+    Author,
+    Book,
+    BookOrAuthor,
+)
+from rfantasy_bingo_stats.models.dupe_groups import DupeGroups
+from rfantasy_bingo_stats.models.ignored_matches import IgnoredMatches
+from rfantasy_bingo_stats.models.journal_entry import (
+    JournalEntry,
+    JournalOperation,
+    JournalRecorder,
+)
+from rfantasy_bingo_stats.models.recorded_ignores import RecordedIgnores
+from rfantasy_bingo_stats.models.recorded_states import RecordedDupes
+
+
+def record_entry(entry: JournalEntry, journal_filepath: Path) -> None:
+    """Append an entry to the decision journal"""
+    with journal_filepath.open("a", encoding="utf8") as journal_file:
+        journal_file.write(entry.model_dump_json() + "\n")
+
+
+def read_journal(journal_filepath: Path) -> tuple[JournalEntry, ...]:
+    """Read every entry in the decision journal, oldest first"""
+    if not journal_filepath.exists():
+        return ()
+    with journal_filepath.open("r", encoding="utf8") as journal_file:
+        return tuple(
+            JournalEntry.model_validate_json(line) for line in journal_file if line.strip() != ""
+        )
+
+
+def get_recorder(match_type: Literal["Author", "Book"], journal_filepath: Path) -> JournalRecorder:
+    """Get a recorder that journals changes to the authors or books"""
+
+    def record(operation: JournalOperation, item: str, others: tuple[str, ...]) -> None:
+        record_entry(
+            JournalEntry(operation=operation, match_type=match_type, item=item, others=others),
+            journal_filepath,
+        )
+
+    return record
+
+
+def attach_journal(
+    recorded_dupes: RecordedDupes,
+    recorded_ignores: RecordedIgnores,
+    journal_filepath: Path,
+) -> None:
+    """Journal every later change to the duplicates and ignores"""
+    recorded_dupes.author_groups.set_journal(get_recorder("Author", journal_filepath))
+    recorded_ignores.author_ignores.set_journal(get_recorder("Author", journal_filepath))
+    recorded_dupes.book_groups.set_journal(get_recorder("Book", journal_filepath))
+    recorded_ignores.book_ignores.set_journal(get_recorder("Book", journal_filepath))
+
+
+def replay_journal(
+    recorded_dupes: RecordedDupes,
+    recorded_ignores: RecordedIgnores,
+    journal_filepath: Path,
+) -> int:
+    """Apply each journaled change to the duplicates and ignores, returning the number applied"""
+    entries = read_journal(journal_filepath)
+    for entry in entries:
+        if entry.match_type == "Author":
+            apply_entry(
+                entry, Author, recorded_dupes.author_groups, recorded_ignores.author_ignores
+            )
+        else:
+            apply_entry(entry, Book, recorded_dupes.book_groups, recorded_ignores.book_ignores)
+    return len(entries)
+
+
+def apply_entry(
+    entry: JournalEntry,
+    item_type: type[BookOrAuthor],
+    dupes: DupeGroups[BookOrAuthor],
+    all_matches_to_ignore: IgnoredMatches[BookOrAuthor],
+) -> None:
+    """Apply one journaled change"""
+    item = item_type(entry.item)
+    others = frozenset(item_type(other) for other in entry.others)
+
+    if entry.operation == JournalOperation.ADD_CANONICAL:
+        dupes.add_canonical(item)
+    elif entry.operation == JournalOperation.ADD_DUPES:
+        dupes.add_dupes(item, others)
+    elif entry.operation == JournalOperation.MERGE_CANONICAL:
+        (new_canonical,) = others
+        dupes.merge_canonical(item, new_canonical)
+    elif entry.operation == JournalOperation.REMOVE_DUPE:
+        # The snapshot may already include the removal, if saving it was interrupted
+        if dupes.is_dupe(item):
+            dupes.remove_dupe(item)
+    else:
+        all_matches_to_ignore.ignore(item, others)
+
+
+def write_snapshots(recorded_dupes: RecordedDupes, recorded_ignores: RecordedIgnores) -> None:
+    """Save the duplicates and ignores in full"""
+    with DUPE_RECORD_FILEPATH.open("w", encoding="utf8") as dupe_file:
+        dupe_file.write(recorded_dupes.model_dump_json(indent=2))
+    with IGNORED_RECORD_FILEPATH.open("w", encoding="utf8") as ignore_file:
+        ignore_file.write(recorded_ignores.model_dump_json(indent=2))
+
+
+def compact_journal(recorded_dupes: RecordedDupes, recorded_ignores: RecordedIgnores) -> None:
+    """
+    Save the duplicates and ignores in full, and clear the journal of changes they include
+
+    Does nothing with the SQLite state store, which saves every change as it is made.
+    """
+    if STATE_DB_FILEPATH.exists():
+        return
+    write_snapshots(recorded_dupes, recorded_ignores)
+    DECISION_JOURNAL_FILEPATH.unlink(missing_ok=True)
+    LOGGER.info("Updated duplicates saved.")
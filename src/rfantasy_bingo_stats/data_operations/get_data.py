@@ -6,8 +6,10 @@ import numpy as np
 import pandas
 
 from rfantasy_bingo_stats.constants import (
+    DECISION_JOURNAL_FILEPATH,
     DUPE_RECORD_FILEPATH,
     IGNORED_RECORD_FILEPATH,
+    STATE_DB_FILEPATH,
 )
 from rfantasy_bingo_stats.data_operations.author_title_book_operations import (
     get_all_authors,
@@ -15,6 +17,14 @@ from rfantasy_bingo_stats.data_operations.author_title_book_operations import (
     get_unique_authors,
     get_unique_books,
 )
+from rfantasy_bingo_stats.data_operations.decision_journal import (
+    attach_journal,
+    compact_journal,
+    replay_journal,
+)
+from rfantasy_bingo_stats.data_operations.model_cache import load_validated
+from rfantasy_bingo_stats.data_operations.state_store import StateStore
+from rfantasy_bingo_stats.logger import LOGGER
 from rfantasy_bingo_stats.models.card_data import CardData
 from rfantasy_bingo_stats.models.defined_types import (
     Author,
@@ -25,20 +35,38 @@ from rfantasy_bingo_stats.models.recorded_states import RecordedDupes
 
 
 def get_existing_states() -> tuple[RecordedDupes, RecordedIgnores]:
-    """Attempt to retrieve existing RecordedDupes, returning empty on failure"""
-    try:
-        with DUPE_RECORD_FILEPATH.open("r", encoding="utf8") as dupe_file:
-            dupes = RecordedDupes.model_validate_json(dupe_file.read())
-        with IGNORED_RECORD_FILEPATH.open("r", encoding="utf8") as ignore_file:
-            ignores = RecordedIgnores.model_validate_json(ignore_file.read())
+    """
+    Attempt to retrieve existing RecordedDupes, starting empty on failure
+
+    Uses the SQLite state store if there is one. Otherwise, decisions journaled since the records
+    were last saved are replayed. Either way, every later change is saved as it is made.
+    """
+    if STATE_DB_FILEPATH.exists():
+        state_store = StateStore(STATE_DB_FILEPATH)
+        dupes, ignores = state_store.load_states()
+        state_store.attach(dupes, ignores)
         return dupes, ignores
+
+    try:
+        dupes = load_validated(
+            DUPE_RECORD_FILEPATH, "RecordedDupes", RecordedDupes.model_validate_json
+        )
+        ignores = load_validated(
+            IGNORED_RECORD_FILEPATH, "RecordedIgnores", RecordedIgnores.model_validate_json
+        )
     except IOError:
-        return RecordedDupes(
-            author_dupes=defaultdict(set), book_dupes=defaultdict(set)
-        ), RecordedIgnores(
+        dupes = RecordedDupes(author_dupes=defaultdict(set), book_dupes=defaultdict(set))
+        ignores = RecordedIgnores(
             ignored_author_dupes=defaultdict(set), ignored_book_dupes=defaultdict(set)
         )
 
+    replayed_count = replay_journal(dupes, ignores, DECISION_JOURNAL_FILEPATH)
+    if replayed_count > 0:
+        LOGGER.info(f"Recovered {replayed_count} unsaved decisions.")
+        compact_journal(dupes, ignores)
+    attach_journal(dupes, ignores, DECISION_JOURNAL_FILEPATH)
+    return dupes, ignores
+
 
 def get_unique_bingo_authors(
     bingo_data: pandas.DataFrame,
@@ -0,0 +1,96 @@
+import gc
+import pickle
+from hashlib import sha256
+from pathlib import Path
+from typing import (
+    Callable,
+    Optional,
+    TypeVar,
+    cast,
+)
+
+from rfantasy_bingo_stats.constants import MODEL_CACHE_PATH
+from rfantasy_bingo_stats.logger import LOGGER
+
+# Increase whenever a cached model's fields or validators change, so older results are revalidated
+MODEL_CACHE_VERSION = 1
+
+Validated = TypeVar("Validated")
+
+# Raised by unpickling a truncated file, or one written by different code
+CACHE_READ_ERRORS = (
+    OSError,
+    EOFError,
+    pickle.UnpicklingError,
+    AttributeError,
+    ImportError,
+    ValueError,
+)
+
+
+def get_cache_filepath(source_filepath: Path) -> Path:
+    """Get where the validated contents of a source file are cached"""
+    return MODEL_CACHE_PATH / f"{source_filepath.parent.name}_{source_filepath.stem}.pickle"
+
+
+def load_validated(
+    source_filepath: Path,
+    validated_name: str,
+    validate: Callable[[bytes], Validated],
+    cache_filepath: Optional[Path] = None,
+) -> Validated:
+    """
+    Validate the contents of a source file, reusing the result from the last run if unchanged
+
+    The cache is keyed on the source's content hash, the cache version and the validated type,
+    and is rebuilt by validating in full on any mismatch.
+    """
+    if cache_filepath is None:
+        cache_filepath = get_cache_filepath(source_filepath)
+
+    source = source_filepath.read_bytes()
+    cache_key = {
+        "version": MODEL_CACHE_VERSION,
+        "validated_name": validated_name,
+        "source_digest": sha256(source).hexdigest(),
+    }
+
+    cached = read_cache(cache_filepath, cache_key)
+    if cached is not None:
+        return cast(Validated, cached[0])
+
+    validated = validate(source)
+    write_cache(cache_filepath, cache_key, validated)
+    return validated
+
+
+def read_cache(cache_filepath: Path, cache_key: dict[str, object]) -> Optional[tuple[object]]:
+    """Read a cached result, if it was saved with the same key"""
+    try:
+        with cache_filepath.open("rb") as cache_file:
+            # The key is read first, so that stale results are never unpickled
+            if pickle.load(cache_file) != cache_key:
+                return None
+            # Unpickling allocates many objects at once, without making any cycles to collect
+            gc_was_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                return (pickle.load(cache_file),)
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
+    except FileNotFoundError:
+        return None
+    except CACHE_READ_ERRORS as exc:
+        LOGGER.warning(f"Ignoring unreadable cache {cache_filepath.name}: {exc!r}")
+        return None
+
+
+def write_cache(cache_filepath: Path, cache_key: dict[str, object], validated: object) -> None:
+    """Save a validated result, replacing the old one only once it is completely written"""
+    cache_filepath.parent.mkdir(parents=True, exist_ok=True)
+    partial_filepath = cache_filepath.with_suffix(".partial")
+    with partial_filepath.open("wb") as cache_file:
+        pickle.dump(cache_key, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle.dump(validated, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+    partial_filepath.replace(cache_filepath)
@@ -0,0 +1,295 @@
+import sqlite3
+from collections import defaultdict
+from pathlib import Path
+from typing import (
+    Literal,
+    Mapping,
+    TypeVar,
+)
+
+from pydantic.main import BaseModel
+
+from rfantasy_bingo_stats.constants import (
+    AUTHOR_INFO_FILEPATH,
+    BOOK_INFO_FILEPATH,
+    DUPE_RECORD_FILEPATH,
+    IGNORED_RECORD_FILEPATH,
+)
+from rfantasy_bingo_stats.data_operations.decision_journal import write_snapshots
+from rfantasy_bingo_stats.logger import LOGGER
+from rfantasy_bingo_stats.models.author_info import (
+    AuthorInfo,
+    AuthorInfoAdapter,
+)
+from rfantasy_bingo_stats.models.book_info import (
+    BookInfo,
+    BookInfoAdapter,
+)
+from rfantasy_bingo_stats.models.defined_types import (
+    Author,
+    Book,
+    BookOrAuthor,
+)
+from rfantasy_bingo_stats.models.dupe_groups import DupeGroups
+from rfantasy_bingo_stats.models.journal_entry import (
+    JournalOperation,
+    JournalRecorder,
+)
+from rfantasy_bingo_stats.models.recorded_ignores import RecordedIgnores
+from rfantasy_bingo_stats.models.recorded_states import RecordedDupes
+
+MatchType = Literal["Author", "Book"]
+Info = TypeVar("Info", bound=BaseModel)
+
+INFO_TABLES = ("author_info", "book_info")
+
+# Stands in for the ignored item of a recorded item with no ignores, so that it is kept
+NO_IGNORES = ""
+
+
+class StateStore:
+    """
+    SQLite copy of the duplicate, ignore, author and book records
+
+    Changes are saved one row at a time as they are made, rather than by rewriting whole files.
+    The JSON records can be imported from and exported to, e.g. for review in git.
+    """
+
+    def __init__(self, db_filepath: Path) -> None:
+        db_filepath.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(db_filepath)
+        with self._connection:
+            # Canonical versions are recorded as their own variant
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS dupes (
+                    match_type TEXT NOT NULL,
+                    variant TEXT NOT NULL,
+                    canonical TEXT NOT NULL,
+                    PRIMARY KEY (match_type, variant)
+                )
+                """
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS dupes_canonical ON dupes (match_type, canonical)"
+            )
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ignores (
+                    match_type TEXT NOT NULL,
+                    item TEXT NOT NULL,
+                    ignored TEXT NOT NULL,
+                    PRIMARY KEY (match_type, item, ignored)
+                )
+                """
+            )
+            for table in INFO_TABLES:
+                self._connection.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table} (item TEXT PRIMARY KEY, info TEXT NOT NULL)"
+                )
+
+    def load_states(self) -> tuple[RecordedDupes, RecordedIgnores]:
+        """
+        Load the duplicates and ignores
+
+        Every row was validated before it was saved, so validation is skipped.
+        """
+        return RecordedDupes.from_validated(
+            self._load_dupes("Author", Author),
+            self._load_dupes("Book", Book),
+        ), RecordedIgnores.from_validated(
+            self._load_ignores("Author", Author),
+            self._load_ignores("Book", Book),
+        )
+
+    def _load_dupes(
+        self,
+        match_type: MatchType,
+        item_type: type[BookOrAuthor],
+    ) -> defaultdict[BookOrAuthor, set[BookOrAuthor]]:
+        dupes: defaultdict[BookOrAuthor, set[BookOrAuthor]] = defaultdict(set)
+        for variant, canonical in self._connection.execute(
+            "SELECT variant, canonical FROM dupes WHERE match_type = ?",
+            (match_type,),
+        ):
+            canonical_dupes = dupes[item_type(canonical)]
+            if variant != canonical:
+                canonical_dupes.add(item_type(variant))
+        return dupes
+
+    def _load_ignores(
+        self,
+        match_type: MatchType,
+        item_type: type[BookOrAuthor],
+    ) -> defaultdict[BookOrAuthor, set[BookOrAuthor]]:
+        ignores: defaultdict[BookOrAuthor, set[BookOrAuthor]] = defaultdict(set)
+        for item, ignored in self._connection.execute(
+            "SELECT item, ignored FROM ignores WHERE match_type = ?",
+            (match_type,),
+        ):
+            ignored_items = ignores[item_type(item)]
+            if ignored != NO_IGNORES:
+                ignored_items.add(item_type(ignored))
+        return ignores
+
+    def save_states(
+        self, recorded_dupes: RecordedDupes, recorded_ignores: RecordedIgnores
+    ) -> None:
+        """Replace the duplicates and ignores in full"""
+        with self._connection:
+            self._connection.execute("DELETE FROM dupes")
+            self._connection.execute("DELETE FROM ignores")
+            for match_type, all_dupes, all_ignores in (
+                ("Author", recorded_dupes.author_dupes, recorded_ignores.ignored_author_dupes),
+                ("Book", recorded_dupes.book_dupes, recorded_ignores.ignored_book_dupes),
+            ):
+                self._connection.executemany(
+                    "INSERT INTO dupes VALUES (?, ?, ?)",
+                    (
+                        (match_type, variant, canonical)
+                        for canonical, canonical_dupes in all_dupes.items()
+                        for variant in (canonical, *canonical_dupes)
+                    ),
+                )
+                self._connection.executemany(
+                    "INSERT INTO ignores VALUES (?, ?, ?)",
+                    (
+                        (match_type, item, ignored)
+                        for item, ignored_items in all_ignores.items()
+                        for ignored in (ignored_items or {NO_IGNORES})
+                    ),
+                )
+
+    def attach(self, recorded_dupes: RecordedDupes, recorded_ignores: RecordedIgnores) -> None:
+        """Save every later change to the duplicates and ignores as it is made"""
+        recorded_dupes.author_groups.set_journal(
+            self.get_dupe_recorder("Author", Author, recorded_dupes.author_groups)
+        )
+        recorded_dupes.book_groups.set_journal(
+            self.get_dupe_recorder("Book", Book, recorded_dupes.book_groups)
+        )
+        recorded_ignores.author_ignores.set_journal(self.get_ignore_recorder("Author"))
+        recorded_ignores.book_ignores.set_journal(self.get_ignore_recorder("Book"))
+
+    def get_dupe_recorder(
+        self,
+        match_type: MatchType,
+        item_type: type[BookOrAuthor],
+        dupes: DupeGroups[BookOrAuthor],
+    ) -> JournalRecorder:
+        """Get a recorder that updates the rows of each item changed in `dupes`"""
+
+        def record(_: JournalOperation, item: str, others: tuple[str, ...]) -> None:
+            with self._connection:
+                for changed_item in map(item_type, (item, *others)):
+                    if dupes.is_canonical(changed_item):
+                        self._set_canonical(match_type, changed_item, changed_item)
+                    elif dupes.is_dupe(changed_item):
+                        self._set_canonical(
+                            match_type, changed_item, dupes.get_canonical(changed_item)
+                        )
+                    else:
+                        # Removed from its group
+                        self._connection.execute(
+                            "DELETE FROM dupes WHERE match_type = ? AND variant = ?",
+                            (match_type, changed_item),
+                        )
+
+        return record
+
+    def _set_canonical(self, match_type: MatchType, variant: str, canonical: str) -> None:
+        """Record the canonical version of a variant, moving the rest of its old group with it"""
+        row = self._connection.execute(
+            "SELECT canonical FROM dupes WHERE match_type = ? AND variant = ?",
+            (match_type, variant),
+        ).fetchone()
+        if row is not None and row[0] != canonical:
+            self._connection.execute(
+                "UPDATE dupes SET canonical = ? WHERE match_type = ? AND canonical = ?",
+                (canonical, match_type, row[0]),
+            )
+        self._connection.execute(
+            "INSERT OR REPLACE INTO dupes VALUES (?, ?, ?)",
+            (match_type, variant, canonical),
+        )
+
+    def get_ignore_recorder(self, match_type: MatchType) -> JournalRecorder:
+        """Get a recorder that adds each new ignored pair, both ways around"""
+
+        def record(_: JournalOperation, item: str, others: tuple[str, ...]) -> None:
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT OR IGNORE INTO ignores VALUES (?, ?, ?)",
+                    (
+                        (match_type, pair_item, pair_ignored)
+                        for other in others
+                        for pair_item, pair_ignored in ((item, other), (other, item))
+                    ),
+                )
+
+        return record
+
+    def load_author_info(self) -> dict[Author, AuthorInfo]:
+        return {
+            Author(author): info
+            for author, info in self._load_info("author_info", AuthorInfo).items()
+        }
+
+    def load_book_info(self) -> dict[Book, BookInfo]:
+        return {Book(book): info for book, info in self._load_info("book_info", BookInfo).items()}
+
+    def _load_info(self, table: str, info_type: type[Info]) -> dict[str, Info]:
+        return {
+            item: info_type.model_validate_json(info)
+            for item, info in self._connection.execute(f"SELECT item, info FROM {table}")
+        }
+
+    def update_info(
+        self,
+        table: str,
+        old_info: Mapping[BookOrAuthor, Info],
+        new_info: Mapping[BookOrAuthor, Info],
+    ) -> None:
+        """Save only the rows of `new_info` that differ from `old_info`"""
+        with self._connection:
+            self._connection.executemany(
+                f"DELETE FROM {table} WHERE item = ?",
+                ((item,) for item in old_info.keys() - new_info.keys()),
+            )
+            self._connection.executemany(
+                f"INSERT OR REPLACE INTO {table} VALUES (?, ?)",
+                (
+                    (item, info.model_dump_json())
+                    for item, info in new_info.items()
+                    if old_info.get(item) != info
+                ),
+            )
+
+    def import_json(self) -> None:
+        """Replace everything in the store with the JSON records"""
+        with DUPE_RECORD_FILEPATH.open("r", encoding="utf8") as dupe_file:
+            recorded_dupes = RecordedDupes.model_validate_json(dupe_file.read())
+        with IGNORED_RECORD_FILEPATH.open("r", encoding="utf8") as ignore_file:
+            recorded_ignores = RecordedIgnores.model_validate_json(ignore_file.read())
+        self.save_states(recorded_dupes, recorded_ignores)
+
+        with AUTHOR_INFO_FILEPATH.open("r", encoding="utf8") as author_info_file:
+            author_data = AuthorInfoAdapter.validate_json(author_info_file.read())
+        self.update_info("author_info", self.load_author_info(), author_data)
+        with BOOK_INFO_FILEPATH.open("r", encoding="utf8") as book_info_file:
+            book_data = BookInfoAdapter.validate_json(book_info_file.read())
+        self.update_info("book_info", self.load_book_info(), book_data)
+        LOGGER.info("Imported JSON records.")
+
+    def export_json(self) -> None:
+        """Write everything in the store to the JSON records"""
+        write_snapshots(*self.load_states())
+        with AUTHOR_INFO_FILEPATH.open("w", encoding="utf8") as author_info_file:
+            author_info_file.write(
+                AuthorInfoAdapter.dump_json(self.load_author_info(), indent=2).decode("utf8")
+            )
+        with BOOK_INFO_FILEPATH.open("w", encoding="utf8") as book_info_file:
+            book_info_file.write(
+                BookInfoAdapter.dump_json(self.load_book_info(), indent=2).decode("utf8")
+            )
+        LOGGER.info("Exported JSON records.")
@@ -10,15 +10,14 @@ from typing import (
 import pandas
 from progressbar import progressbar
 
-from rfantasy_bingo_stats.constants import (
-    DUPE_RECORD_FILEPATH,
-    TITLE_AUTHOR_SEPARATOR,
+from rfantasy_bingo_stats.data_operations.author_title_book_operations import (
+    book_to_title_author,
+    title_author_to_book,
 )
-from rfantasy_bingo_stats.data_operations.author_title_book_operations import title_author_to_book
-from rfantasy_bingo_stats.logger import LOGGER
 from rfantasy_bingo_stats.models.defined_types import (
     Author,
     Book,
+    Title,
     TitleAuthor,
     TitleAuthorHMCols,
 )
@@ -34,25 +33,37 @@ def update_bingo_books(
     """
     Update the dataframe with the recorded changes
 
+    Each column's title/author pairs are looked up in one pass, by their combined book.
     Also saves dataframe
     """
 
     new_data = data.copy()
 
     # This makes lookups easier
-    inverted_replacements = {v: key for key, val in books_to_replace.items() for v in val}
+    inverted_replacements = {
+        v: book_to_title_author(key) for key, val in books_to_replace.items() for v in val
+    }
 
     for title_col, author_col, _ in progressbar(all_cols):
-        for old, new in inverted_replacements.items():
-            old_title, old_author = old.split(TITLE_AUTHOR_SEPARATOR)
-            new_title, new_author = new.split(TITLE_AUTHOR_SEPARATOR)
-            paired_cols = (
-                new_data[title_col] == old_title  # pylint: disable=unsubscriptable-object
-            ) & (
-                new_data[author_col] == old_author  # pylint: disable=unsubscriptable-object
+        new_title_authors = [
+            (
+                inverted_replacements.get(title_author_to_book((Title(title), Author(author))))
+                if isinstance(title, str) and isinstance(author, str)
+                else None
             )
-            new_data.loc[paired_cols, title_col] = new_title
-            new_data.loc[paired_cols, author_col] = new_author
+            for title, author in zip(new_data[title_col], new_data[author_col])
+        ]
+        replaced = [new_title_author is not None for new_title_author in new_title_authors]
+        new_data.loc[replaced, title_col] = [
+            new_title_author[0]
+            for new_title_author in new_title_authors
+            if new_title_author is not None
+        ]
+        new_data.loc[replaced, author_col] = [
+            new_title_author[1]
+            for new_title_author in new_title_authors
+            if new_title_author is not None
+        ]
 
     new_data.to_csv(output_path)
 
@@ -68,7 +79,8 @@ def update_bingo_authors(
     """
     Update the dataframe with the recorded changes
 
-    Also saves dataframe
+    Each column's authors are looked up in one pass.
+    Also saves dataframe, and returns the misspelled books implied by each author change
     """
 
     new_data = data.copy()
@@ -78,12 +90,20 @@ def update_bingo_authors(
 
     all_author_dedupes: defaultdict[Book, set[Book]] = defaultdict(set)
     for title_col, author_col, _ in progressbar(all_cols):
-        for old_author, new_author in inverted_replacements.items():
-            for title in new_data.loc[new_data[author_col] == old_author, title_col].unique():
+        new_authors = [
+            inverted_replacements.get(Author(author)) if isinstance(author, str) else None
+            for author in new_data[author_col]
+        ]
+        for title, old_author, new_author in zip(
+            new_data[title_col], new_data[author_col], new_authors
+        ):
+            if new_author is not None:
                 all_author_dedupes[title_author_to_book((title, new_author))].add(
                     title_author_to_book((title, old_author))
                 )
-            new_data.loc[new_data[author_col] == old_author, author_col] = new_author
+        new_data.loc[[new_author is not None for new_author in new_authors], author_col] = [
+            new_author for new_author in new_authors if new_author is not None
+        ]
 
     new_data.to_csv(output_path)
 
@@ -135,14 +155,8 @@ def update_poll_books(
 def comma_separate_authors(recorded_states: RecordedDupes) -> None:
     """Turn all multi-authors into comma-separated"""
 
+    author_groups = recorded_states.author_groups
     for string in (";", " , ", ", & ", " & ", " & & ", ", and ", " and ", ", with ", " with "):
-        for author, author_dedupes in tuple(recorded_states.author_dupes.items()):
+        for author in tuple(author_groups.canonicals()):
             if string in author:
-                updated_author = Author(author.replace(string, ", "))
-                recorded_states.author_dupes[updated_author] |= author_dedupes
-                recorded_states.author_dupes[updated_author].add(author)
-                del recorded_states.author_dupes[author]
-
-    with DUPE_RECORD_FILEPATH.open("w", encoding="utf8") as dupe_file:
-        dupe_file.write(recorded_states.model_dump_json(indent=2))
-    LOGGER.info("Updated duplicates saved.")
+                author_groups.merge_canonical(author, Author(author.replace(string, ", ")))
@@ -0,0 +1,73 @@
+from collections import defaultdict
+from typing import (
+    AbstractSet,
+    Iterable,
+    Mapping,
+)
+
+from rfantasy_bingo_stats.constants import TITLE_AUTHOR_SEPARATOR
+from rfantasy_bingo_stats.match_books.match_scorer import MatchScorer
+from rfantasy_bingo_stats.models.defined_types import (
+    Author,
+    Book,
+)
+
+
+class AuthorBlocks:
+    """
+    Books partitioned by canonical author
+
+    Each book is only matched against books by the same canonical author,
+    or by an author close enough to reach the match score.
+    """
+
+    def __init__(
+        self,
+        books: Iterable[Book],
+        author_dedupe_map: Mapping[Author, Author],
+        match_score: int,
+    ) -> None:
+        self._author_dedupe_map = author_dedupe_map
+        self._books_by_author: defaultdict[Author, set[Book]] = defaultdict(set)
+        for book in books:
+            self._books_by_author[self.get_block(book)].add(book)
+
+        self._author_scorer: MatchScorer[Author] = MatchScorer(
+            self._books_by_author.keys(),
+            match_score,
+            None,
+        )
+        self._neighbours: dict[Author, frozenset[Author]] = {}
+
+    def get_block(self, book: Book) -> Author:
+        """Get the canonical author of a book"""
+        _, _, author = book.rpartition(TITLE_AUTHOR_SEPARATOR)
+        return self._author_dedupe_map.get(Author(author), Author(author))
+
+    def get_neighbours(self, author: Author) -> frozenset[Author]:
+        """Get every canonical author close enough to `author` to reach the match score"""
+        neighbours = self._neighbours.get(author)
+        if neighbours is None:
+            neighbours = frozenset(
+                neighbour for neighbour, _ in self._author_scorer.score(author)
+            ).union({author})
+            self._neighbours[author] = neighbours
+        return neighbours
+
+    def get_candidates(self, book: Book) -> AbstractSet[Book]:
+        """Get every book in the blocks of the book's author and its neighbours"""
+        return frozenset().union(
+            *(
+                self._books_by_author.get(author, frozenset())
+                for author in self.get_neighbours(self.get_block(book))
+            )
+        )
+
+    def add(self, book: Book) -> None:
+        """Add a new book to its author's block"""
+        author = self.get_block(book)
+        if author not in self._books_by_author:
+            self._author_scorer.add_choice(author)
+            # Any author may now have a new neighbour
+            self._neighbours.clear()
+        self._books_by_author[author].add(book)
@@ -0,0 +1,92 @@
+from datetime import datetime
+from pathlib import Path
+
+from rfantasy_bingo_stats.logger import LOGGER
+from rfantasy_bingo_stats.models.auto_match_record import (
+    AutoMatchAction,
+    AutoMatchRecord,
+)
+from rfantasy_bingo_stats.models.defined_types import (
+    Author,
+    Book,
+    BookOrAuthor,
+)
+from rfantasy_bingo_stats.models.dupe_groups import DupeGroups
+from rfantasy_bingo_stats.models.ignored_matches import IgnoredMatches
+from rfantasy_bingo_stats.models.recorded_ignores import RecordedIgnores
+from rfantasy_bingo_stats.models.recorded_states import RecordedDupes
+
+
+def record_auto_match(record: AutoMatchRecord, log_filepath: Path) -> None:
+    """Append a record to the auto-match log"""
+    with log_filepath.open("a", encoding="utf8") as log_file:
+        log_file.write(record.model_dump_json() + "\n")
+
+
+def read_auto_matches(log_filepath: Path) -> tuple[AutoMatchRecord, ...]:
+    """Read every record in the auto-match log, oldest first"""
+    if not log_filepath.exists():
+        return ()
+    with log_filepath.open("r", encoding="utf8") as log_file:
+        return tuple(
+            AutoMatchRecord.model_validate_json(line) for line in log_file if line.strip() != ""
+        )
+
+
+def get_unreverted_matches(records: tuple[AutoMatchRecord, ...]) -> tuple[AutoMatchRecord, ...]:
+    """Get the accepted matches that have not since been reverted"""
+    accepted: dict[tuple[str, str], AutoMatchRecord] = {}
+    for record in records:
+        if record.action == AutoMatchAction.ACCEPT:
+            accepted[(record.match_type, record.dupe)] = record
+        else:
+            accepted.pop((record.match_type, record.dupe), None)
+    return tuple(accepted.values())
+
+
+def revert_auto_match(
+    record: AutoMatchRecord,
+    recorded_dupes: RecordedDupes,
+    recorded_ignores: RecordedIgnores,
+    log_filepath: Path,
+) -> None:
+    """Split an automatically matched duplicate back out, and ignore the match in future"""
+    if record.match_type == "Author":
+        reverted = revert_match(
+            recorded_dupes.author_groups,
+            recorded_ignores.author_ignores,
+            Author(record.dupe),
+            Author(record.canonical),
+        )
+    else:
+        reverted = revert_match(
+            recorded_dupes.book_groups,
+            recorded_ignores.book_ignores,
+            Book(record.dupe),
+            Book(record.canonical),
+        )
+
+    if reverted:
+        record_auto_match(
+            record.model_copy(
+                update={"action": AutoMatchAction.REVERT, "timestamp": datetime.now()}
+            ),
+            log_filepath,
+        )
+
+
+def revert_match(
+    dupes: DupeGroups[BookOrAuthor],
+    all_matches_to_ignore: IgnoredMatches[BookOrAuthor],
+    dupe: BookOrAuthor,
+    canonical: BookOrAuthor,
+) -> bool:
+    """Remove a duplicate from its group and ignore the match, returning whether it was found"""
+    if not dupes.is_dupe(dupe):
+        LOGGER.warning(f"{dupe} is no longer a duplicate. Skipping.")
+        return False
+
+    current_canonical = dupes.remove_dupe(dupe)
+    all_matches_to_ignore.ignore(dupe, {canonical})
+    LOGGER.info(f"{dupe} is no longer recorded as a duplicate of {current_canonical}")
+    return True
@@ -0,0 +1,327 @@
+from collections import (
+    Counter,
+    defaultdict,
+)
+from math import floor
+from typing import (
+    Generic,
+    Iterable,
+    Optional,
+)
+
+from thefuzz import utils  # type: ignore[import-untyped]
+
+from rfantasy_bingo_stats.models.defined_types import BookOrAuthor
+
+NGRAM_SIZE = 2
+
+# Constants used by `WRatio` to weight its component scorers
+UNBASE_SCALE = 0.95
+PARTIAL_LEN_RATIO = 1.5
+LONG_PARTIAL_LEN_RATIO = 8.0
+PARTIAL_SCALE = 0.9
+LONG_PARTIAL_SCALE = 0.6
+
+# Loosens every bound by more than float rounding error, e.g. `(1 - 0.9) * 20 == 1.99...`,
+# and by less than the gap between any two scores of strings this short
+BOUND_TOLERANCE = 1e-9
+
+
+def normalize_choice(choice: str) -> str:
+    """Apply the same processing `thefuzz` applies to each choice before scoring"""
+    return str(utils.full_process(choice, force_ascii=True))
+
+
+def normalize_query(query: str) -> str:
+    """Apply the same processing `thefuzz` applies to a query before scoring"""
+    return normalize_choice(utils.full_process(query))
+
+
+def get_ngrams(normalized: str) -> frozenset[str]:
+    """Get the distinct character n-grams of each word in a normalized string"""
+    return frozenset(
+        word[start : start + NGRAM_SIZE]
+        for word in normalized.split()
+        for start in range(len(word) - NGRAM_SIZE + 1)
+    )
+
+
+def get_distinct_words_len(normalized: str) -> int:
+    """Get the length of the distinct words of a normalized string, as token set scorers join them"""
+    distinct_words = frozenset(normalized.split())
+    return sum(map(len, distinct_words)) + max(len(distinct_words) - 1, 0)
+
+
+def get_required_shared_ngrams(
+    len_1: int,
+    distinct_len_1: int,
+    ngram_count_1: int,
+    len_2: int,
+    distinct_len_2: int,
+    ngram_count_2: int,
+    match_score: int,
+) -> Optional[int]:
+    """
+    Get the number of n-grams two strings must share to possibly reach `match_score`
+
+    Returns `None` if the pair can never reach `match_score`.
+
+    Each edit needed to align the two strings can remove at most `NGRAM_SIZE` n-grams
+    from the set they share, so a bound on the number of edits `WRatio` allows
+    is a bound on the number of n-grams that may be missing.
+    Token set scorers align only the distinct words of each string,
+    which are shorter than the string when it repeats a word.
+    """
+    short_len, long_len = sorted((len_1, len_2))
+    if short_len == 0:
+        return None
+
+    score = match_score / 100
+    len_ratio = long_len / short_len
+
+    if len_ratio < PARTIAL_LEN_RATIO:
+        ratio_edits = get_max_indel_distance(len_1, len_2, score)
+        token_edits = floor_bound((1 - score / UNBASE_SCALE) * (len_1 + len_2))
+        return min(
+            max(
+                ngram_count_1
+                - max(get_max_lost_ngrams(len_1, len_2, ratio_edits), NGRAM_SIZE * token_edits),
+                ngram_count_2
+                - max(get_max_lost_ngrams(len_2, len_1, ratio_edits), NGRAM_SIZE * token_edits),
+            ),
+            get_token_set_required_shared_ngrams(
+                distinct_len_1,
+                ngram_count_1,
+                distinct_len_2,
+                ngram_count_2,
+                score / UNBASE_SCALE,
+            ),
+        )
+
+    partial_scale = get_partial_scale(len_ratio)
+    short_ngram_count = ngram_count_1 if len_1 <= len_2 else ngram_count_2
+    max_lost = []
+    if 2 * short_len / (short_len + long_len) + BOUND_TOLERANCE >= score:
+        ratio_edits = get_max_indel_distance(short_len, long_len, score)
+        max_lost.append(get_max_lost_ngrams(short_len, long_len, ratio_edits))
+    if score <= partial_scale + BOUND_TOLERANCE:
+        max_lost.append(NGRAM_SIZE * floor_bound((1 - score / partial_scale) * 2 * short_len))
+    required = None if len(max_lost) == 0 else short_ngram_count - max(max_lost)
+
+    # With no word in common, `partial_token_ratio` also aligns the distinct words
+    token_score = score / (UNBASE_SCALE * partial_scale)
+    if token_score <= 1 + BOUND_TOLERANCE:
+        distinct_short_len, distinct_short_ngram_count = min(
+            (distinct_len_1, ngram_count_1), (distinct_len_2, ngram_count_2)
+        )
+        token_required = distinct_short_ngram_count - NGRAM_SIZE * floor_bound(
+            (1 - token_score) * 2 * distinct_short_len
+        )
+        required = token_required if required is None else min(required, token_required)
+    return required
+
+
+def get_token_set_required_shared_ngrams(
+    distinct_len_1: int,
+    ngram_count_1: int,
+    distinct_len_2: int,
+    ngram_count_2: int,
+    token_score: float,
+) -> int:
+    """
+    Get the number of n-grams two strings must share to possibly reach `token_score`
+    with `token_set_ratio`
+
+    It compares the words both strings share with the distinct words of either string,
+    which can only reach `token_score` if few enough of that string's words are not shared,
+    and the distinct words of both strings with each other.
+    """
+    shared_words_required = min(
+        ngram_count_1 - NGRAM_SIZE * floor_bound((1 - token_score) * 2 * distinct_len_1),
+        ngram_count_2 - NGRAM_SIZE * floor_bound((1 - token_score) * 2 * distinct_len_2),
+    )
+    distinct_edits = get_max_indel_distance(distinct_len_1, distinct_len_2, token_score)
+    distinct_words_required = max(
+        ngram_count_1 - get_max_lost_ngrams(distinct_len_1, distinct_len_2, distinct_edits),
+        ngram_count_2 - get_max_lost_ngrams(distinct_len_2, distinct_len_1, distinct_edits),
+    )
+    return min(shared_words_required, distinct_words_required)
+
+
+def get_partial_scale(len_ratio: float) -> float:
+    """Get the weight `WRatio` gives partial scorers for strings of very different lengths"""
+    return PARTIAL_SCALE if len_ratio < LONG_PARTIAL_LEN_RATIO else LONG_PARTIAL_SCALE
+
+
+def get_max_score(len_1: int, len_2: int) -> float:
+    """Get the highest `WRatio` possible for normalized strings of these lengths"""
+    short_len, long_len = sorted((len_1, len_2))
+    if short_len == 0:
+        return 0
+    len_ratio = long_len / short_len
+    if len_ratio < PARTIAL_LEN_RATIO:
+        return 100
+    # A perfect `partial_ratio` always beats `ratio` at these length ratios
+    return 100 * get_partial_scale(len_ratio)
+
+
+def requires_substring(len_1: int, len_2: int, match_score: int) -> bool:
+    """
+    Check if only an exact substring can reach `match_score`, for strings of these lengths
+
+    That is, if only a perfect `partial_ratio` can reach it.
+    """
+    short_len, long_len = sorted((len_1, len_2))
+    if short_len == 0 or long_len / short_len < PARTIAL_LEN_RATIO:
+        return False
+    partial_scale = get_partial_scale(long_len / short_len)
+    # The best imperfect `partial_ratio` aligns the shorter string minus one character
+    best_imperfect_partial = 200 * (short_len - 1) / (2 * short_len - 1)
+    return match_score > BOUND_TOLERANCE + max(
+        200 * short_len / (short_len + long_len),
+        100 * UNBASE_SCALE * partial_scale,
+        best_imperfect_partial * partial_scale,
+    )
+
+
+def could_match(normalized_1: str, normalized_2: str, match_score: int) -> bool:
+    """Check if a pair of normalized strings can possibly reach `match_score`"""
+    if get_max_score(len(normalized_1), len(normalized_2)) + BOUND_TOLERANCE < match_score:
+        return False
+    if requires_substring(len(normalized_1), len(normalized_2), match_score):
+        short, long = sorted((normalized_1, normalized_2), key=len)
+        return short in long
+    return True
+
+
+def shared_word_can_match(len_1: int, len_2: int, match_score: int) -> bool:
+    """Check if sharing any single word is enough for a pair to reach `match_score`"""
+    short_len, long_len = sorted((len_1, len_2))
+    if short_len == 0 or long_len / short_len < PARTIAL_LEN_RATIO:
+        return False
+    # `partial_token_set_ratio` is 100 for any pair with a word in common
+    return (
+        match_score / 100
+        <= UNBASE_SCALE * get_partial_scale(long_len / short_len) + BOUND_TOLERANCE
+    )
+
+
+def get_max_indel_distance(len_1: int, len_2: int, score: float) -> int:
+    """Get the largest insertion/deletion distance with a normalized similarity of `score`"""
+    max_edits = floor_bound((1 - score) * (len_1 + len_2))
+    # Indel distance always has the same parity as the combined length
+    return max_edits - (max_edits - len_1 - len_2) % 2
+
+
+def floor_bound(bound: float) -> int:
+    """Round a bound computed in floats down, as if it had been computed exactly"""
+    return floor(bound + BOUND_TOLERANCE)
+
+
+def get_max_lost_ngrams(len_1: int, len_2: int, indel_distance: int) -> int:
+    """Get how many n-grams of the first string can be broken by aligning it with the second"""
+    deletions = (indel_distance + len_1 - len_2) // 2
+    insertions = indel_distance - deletions
+    return NGRAM_SIZE * deletions + (NGRAM_SIZE - 1) * insertions
+
+
+class NgramIndex(Generic[BookOrAuthor]):
+    """
+    Inverted index from character n-grams to the choices containing them
+
+    Also keeps the normalized form of each choice, so that it is only processed once.
+    """
+
+    def __init__(self, choices: Iterable[BookOrAuthor]) -> None:
+        self._normalized_by_choice: dict[BookOrAuthor, str] = {}
+        self._postings: defaultdict[str, set[BookOrAuthor]] = defaultdict(set)
+        self._word_postings: defaultdict[str, set[BookOrAuthor]] = defaultdict(set)
+        self._buckets: defaultdict[tuple[int, int, int], set[BookOrAuthor]] = defaultdict(set)
+        self._bucket_by_choice: dict[BookOrAuthor, tuple[int, int, int]] = {}
+
+        for choice in choices:
+            self.add(choice)
+
+    def __len__(self) -> int:
+        return len(self._normalized_by_choice)
+
+    def __contains__(self, choice: object) -> bool:
+        return choice in self._normalized_by_choice
+
+    def get_normalized(self, choice: BookOrAuthor) -> str:
+        """Get the form of an indexed choice that is used for scoring"""
+        return self._normalized_by_choice[choice]
+
+    def add(self, choice: BookOrAuthor) -> None:
+        """Add a new choice to the index"""
+        if choice in self._normalized_by_choice:
+            return
+
+        normalized = normalize_choice(choice)
+        self._normalized_by_choice[choice] = normalized
+        ngrams = get_ngrams(normalized)
+        for ngram in ngrams:
+            self._postings[ngram].add(choice)
+        for word in normalized.split():
+            self._word_postings[word].add(choice)
+
+        bucket = (len(normalized), get_distinct_words_len(normalized), len(ngrams))
+        self._buckets[bucket].add(choice)
+        self._bucket_by_choice[choice] = bucket
+
+    def get_candidates(self, query: BookOrAuthor, match_score: int) -> frozenset[BookOrAuthor]:
+        """Get every indexed choice that could possibly match `query` at `match_score`"""
+        return self.get_normalized_candidates(normalize_query(query), match_score)
+
+    def get_normalized_candidates(
+        self,
+        normalized: str,
+        match_score: int,
+    ) -> frozenset[BookOrAuthor]:
+        """Get every indexed choice that could possibly match a normalized query"""
+        if match_score <= 0:
+            return frozenset(self._normalized_by_choice)
+
+        ngrams = get_ngrams(normalized)
+        distinct_len = get_distinct_words_len(normalized)
+
+        candidates: set[BookOrAuthor] = set()
+        required_by_bucket: dict[tuple[int, int, int], int] = {}
+        word_match_buckets: set[tuple[int, int, int]] = set()
+        for bucket, bucket_choices in self._buckets.items():
+            choice_len, choice_distinct_len, choice_ngram_count = bucket
+            if shared_word_can_match(len(normalized), choice_len, match_score):
+                word_match_buckets.add(bucket)
+            required = get_required_shared_ngrams(
+                len(normalized),
+                distinct_len,
+                len(ngrams),
+                choice_len,
+                choice_distinct_len,
+                choice_ngram_count,
+                match_score,
+            )
+            if required is None:
+                continue
+            if required <= 0:
+                candidates |= bucket_choices
+            else:
+                required_by_bucket[bucket] = required
+
+        if len(required_by_bucket) > 0:
+            shared_counts: Counter[BookOrAuthor] = Counter()
+            for ngram in ngrams:
+                shared_counts.update(self._postings.get(ngram, ()))
+
+            for choice, shared_count in shared_counts.items():
+                required = required_by_bucket.get(self._bucket_by_choice[choice])
+                if required is not None and shared_count >= required:
+                    candidates.add(choice)
+
+        if len(word_match_buckets) > 0:
+            for word in frozenset(normalized.split()):
+                for choice in self._word_postings.get(word, ()):
+                    if self._bucket_by_choice[choice] in word_match_buckets:
+                        candidates.add(choice)
+
+        return frozenset(candidates)
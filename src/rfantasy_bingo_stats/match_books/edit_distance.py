@@ -0,0 +1,107 @@
+from collections import defaultdict
+from typing import (
+    AbstractSet,
+    Generic,
+    Iterable,
+)
+
+from rapidfuzz.distance import Levenshtein
+
+from rfantasy_bingo_stats.match_books.candidate_index import (
+    normalize_choice,
+    normalize_query,
+)
+from rfantasy_bingo_stats.models.defined_types import BookOrAuthor
+
+
+class BkTree(Generic[BookOrAuthor]):
+    """
+    Burkhard-Keller tree over the normalized forms of choices, by Levenshtein distance
+
+    Finds every choice within some number of edits of a query without comparing it to all of them.
+    Nodes are kept in flat lists so that the tree pickles without deep recursion.
+    """
+
+    def __init__(self, choices: Iterable[BookOrAuthor]) -> None:
+        self._nodes: list[str] = []
+        # Child node position by distance from the parent, for each node
+        self._children: list[dict[int, int]] = []
+        self._choices_by_normalized: defaultdict[str, set[BookOrAuthor]] = defaultdict(set)
+
+        for choice in choices:
+            self.add(choice)
+
+    def __len__(self) -> int:
+        return sum(len(choices) for choices in self._choices_by_normalized.values())
+
+    def add(self, choice: BookOrAuthor) -> None:
+        """Add a new choice to the tree"""
+        normalized = normalize_choice(choice)
+        if normalized not in self._choices_by_normalized:
+            self._add_node(normalized)
+        self._choices_by_normalized[normalized].add(choice)
+
+    def _add_node(self, normalized: str) -> None:
+        self._nodes.append(normalized)
+        self._children.append({})
+        new_position = len(self._nodes) - 1
+        if new_position == 0:
+            return
+
+        position = 0
+        while True:
+            distance = Levenshtein.distance(normalized, self._nodes[position])
+            child_position = self._children[position].get(distance)
+            if child_position is None:
+                self._children[position][distance] = new_position
+                return
+            position = child_position
+
+    def get_within(self, query: BookOrAuthor, max_edits: int) -> frozenset[BookOrAuthor]:
+        """Get every choice whose normalized form is within `max_edits` of the query's"""
+        return self.get_normalized_within(normalize_query(query), max_edits)
+
+    def get_normalized_within(self, normalized: str, max_edits: int) -> frozenset[BookOrAuthor]:
+        """Get every choice whose normalized form is within `max_edits` of a normalized query"""
+        if len(self._nodes) == 0:
+            return frozenset()
+
+        matches: set[BookOrAuthor] = set()
+        to_visit = [0]
+        while len(to_visit) > 0:
+            position = to_visit.pop()
+            distance = Levenshtein.distance(normalized, self._nodes[position])
+            if distance <= max_edits:
+                matches |= self._choices_by_normalized[self._nodes[position]]
+            # By the triangle inequality, only these subtrees can hold close enough choices
+            to_visit.extend(
+                child_position
+                for child_distance, child_position in self._children[position].items()
+                if abs(child_distance - distance) <= max_edits
+            )
+        return frozenset(matches)
+
+
+class EditDistanceBlocks(Generic[BookOrAuthor]):
+    """
+    Limits each item to the choices within a number of edits of it
+
+    Much faster than scoring against every plausible choice for short strings like author names,
+    but misses matches that need more edits, e.g. reordered names.
+    """
+
+    def __init__(self, choices: Iterable[BookOrAuthor], max_edits: int) -> None:
+        self.max_edits = max_edits
+        self._tree: BkTree[BookOrAuthor] = BkTree(choices)
+
+    def get_block(self, choice: BookOrAuthor) -> str:  # pylint: disable=unused-argument
+        """The candidates of every choice depend only on the edit limit"""
+        return f"within {self.max_edits} edits"
+
+    def get_candidates(self, item: BookOrAuthor) -> AbstractSet[BookOrAuthor]:
+        """Get every choice within the edit limit of `item`"""
+        return self._tree.get_within(item, self.max_edits)
+
+    def add(self, choice: BookOrAuthor) -> None:
+        """Add a new choice to the tree"""
+        self._tree.add(choice)
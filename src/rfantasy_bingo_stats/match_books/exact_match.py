@@ -0,0 +1,111 @@
+import unicodedata
+from collections import defaultdict
+from typing import AbstractSet
+
+from rfantasy_bingo_stats.constants import TITLE_AUTHOR_SEPARATOR
+from rfantasy_bingo_stats.logger import LOGGER
+from rfantasy_bingo_stats.match_books.process_match import (
+    choose_canonical,
+    unify_matches,
+)
+from rfantasy_bingo_stats.models.defined_types import (
+    Book,
+    BookOrAuthor,
+)
+from rfantasy_bingo_stats.models.dupe_groups import DupeGroups
+from rfantasy_bingo_stats.models.ignored_matches import IgnoredMatches
+
+QUOTE_TRANSLATION = str.maketrans(
+    {
+        "‘": "'",
+        "’": "'",
+        "‚": "'",
+        "‛": "'",
+        "′": "'",
+        "“": '"',
+        "”": '"',
+        "„": '"',
+        "‟": '"',
+        "″": '"',
+    }
+)
+
+
+def normalize_for_key(text: str) -> str:
+    """Drop differences in case, whitespace, diacritics and quote style"""
+    decomposed = unicodedata.normalize("NFKD", text.translate(QUOTE_TRANSLATION))
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.casefold().split())
+
+
+def get_match_key(item: BookOrAuthor) -> str:
+    """
+    Get a key shared by versions of an item that differ only trivially
+
+    Books also ignore a leading "The" on the title.
+    """
+    if isinstance(item, Book):
+        title, separator, author = item.rpartition(TITLE_AUTHOR_SEPARATOR)
+        if separator != "":
+            title_key = normalize_for_key(title).removeprefix("the ")
+            return title_key + TITLE_AUTHOR_SEPARATOR + normalize_for_key(author)
+    return normalize_for_key(item)
+
+
+def merge_exact_matches(
+    items: AbstractSet[BookOrAuthor],
+    dupes: DupeGroups[BookOrAuthor],
+    all_matches_to_ignore: IgnoredMatches[BookOrAuthor],
+) -> frozenset[BookOrAuthor]:
+    """
+    Record new items as duplicates of anything sharing their match key, without prompting
+
+    New items are only merged into an existing group if all their exact matches are in it.
+    Returns the new canonical versions, which have not been compared to anything else yet.
+    """
+    items_by_key: defaultdict[str, set[BookOrAuthor]] = defaultdict(set)
+    for item in items:
+        if item not in dupes:
+            items_by_key[get_match_key(item)].add(item)
+
+    existing_by_key: defaultdict[str, set[BookOrAuthor]] = defaultdict(set)
+    for item in dupes:
+        key = get_match_key(item)
+        if key in items_by_key:
+            existing_by_key[key].add(dupes.get_canonical(item) if dupes.is_dupe(item) else item)
+
+    new_canonicals = set()
+    merge_count = 0
+    for key, new_items in items_by_key.items():
+        existing_keys = existing_by_key.get(key, set())
+        if len(existing_keys) > 1:
+            # Which group the new items belong to needs a human decision
+            continue
+        if len(existing_keys) == 0 and len(new_items) == 1:
+            continue
+
+        best_match = (
+            choose_canonical(new_items) if len(existing_keys) == 0 else existing_keys.pop()
+        )
+        other_matches = frozenset(
+            item
+            for item in new_items
+            if item != best_match
+            and item not in all_matches_to_ignore.get_ignored(best_match)
+            and best_match not in all_matches_to_ignore.get_ignored(item)
+        )
+        if len(other_matches) == 0:
+            continue
+
+        if best_match not in dupes:
+            new_canonicals.add(best_match)
+        unify_matches(
+            dupes=dupes,
+            best_match=best_match,
+            other_matches=other_matches,
+            existing_match_keys=frozenset(),
+        )
+        merge_count += len(other_matches)
+
+    LOGGER.info(f"Merged {merge_count} exact matches.")
+    return frozenset(new_canonicals)
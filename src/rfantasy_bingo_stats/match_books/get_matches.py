@@ -2,18 +2,24 @@ from typing import (
     AbstractSet,
     Literal,
     Mapping,
+    Optional,
     overload,
 )
 
 from rfantasy_bingo_stats.constants import (
-    DUPE_RECORD_FILEPATH,
-    IGNORED_RECORD_FILEPATH,
+    AUTHOR_CANDIDATES_FILEPATH,
+    BOOK_CANDIDATES_FILEPATH,
 )
 from rfantasy_bingo_stats.logger import LOGGER
-from rfantasy_bingo_stats.match_books.process_match import (
-    find_existing_match,
-    process_new_pair,
+from rfantasy_bingo_stats.match_books.author_blocks import AuthorBlocks
+from rfantasy_bingo_stats.match_books.edit_distance import EditDistanceBlocks
+from rfantasy_bingo_stats.match_books.exact_match import merge_exact_matches
+from rfantasy_bingo_stats.match_books.match_scorer import MatchScorer
+from rfantasy_bingo_stats.match_books.prefetch import (
+    PREFETCH_DEPTH,
+    MatchPrefetcher,
 )
+from rfantasy_bingo_stats.match_books.process_match import process_new_pair
 from rfantasy_bingo_stats.models.defined_types import (
     Author,
     Book,
@@ -31,6 +37,9 @@ def get_possible_matches(
     known_states: RecordedDupes,
     known_ignores: RecordedIgnores,
     ret_type: Literal["Author"],
+    block_books_by_author: Literal[False],
+    author_max_edits: Optional[int],
+    auto_accept_score: Optional[int],
 ) -> None: ...
 
 
@@ -42,6 +51,9 @@ def get_possible_matches(
     known_states: RecordedDupes,
     known_ignores: RecordedIgnores,
     ret_type: Literal["Book"],
+    block_books_by_author: bool,
+    author_max_edits: None,
+    auto_accept_score: Optional[int],
 ) -> None: ...
 
 
@@ -52,6 +64,9 @@ def get_possible_matches(
     known_states: RecordedDupes,
     known_ignores: RecordedIgnores,
     ret_type: Literal["Book", "Author"],
+    block_books_by_author: bool,
+    author_max_edits: Optional[int],
+    auto_accept_score: Optional[int],
 ) -> None:
     """Determine all possible misspellings for each author or book"""
     try:
@@ -62,6 +77,8 @@ def get_possible_matches(
                 rescan_keys,
                 known_states,
                 known_ignores,
+                block_books_by_author,
+                auto_accept_score,
             )
         else:
             get_possible_author_matches(
@@ -70,24 +87,19 @@ def get_possible_matches(
                 rescan_keys,
                 known_states,
                 known_ignores,
+                author_max_edits,
+                auto_accept_score,
             )
 
+    # Every decision is journaled as it is made, so progress is already saved
     except ValueError:
-        LOGGER.info("Saving progress and exiting")
+        LOGGER.info("Exiting")
     except Exception:
-        LOGGER.error("Unexpected error. Saving progress and exiting.")
-        # Note `finally` is executed before `raise`ing
+        LOGGER.error("Unexpected error. Progress so far will be recovered on the next run.")
         raise
     else:
         LOGGER.info(f"All {ret_type}s scanned!")
 
-    finally:
-        with DUPE_RECORD_FILEPATH.open("w", encoding="utf8") as dupe_file:
-            dupe_file.write(known_states.model_dump_json(indent=2))
-        with IGNORED_RECORD_FILEPATH.open("w", encoding="utf8") as ignore_file:
-            ignore_file.write(known_ignores.model_dump_json(indent=2))
-        LOGGER.info("Updated duplicates saved.")
-
 
 def get_possible_book_matches(
     books: AbstractSet[Book],
@@ -95,36 +107,51 @@ def get_possible_book_matches(
     rescan_keys: bool,
     known_states: RecordedDupes,
     known_ignores: RecordedIgnores,
+    block_by_author: bool,
+    auto_accept_score: Optional[int],
 ) -> None:
     """Get possible matches for un-matched books"""
 
-    unscanned_books = set(
-        books
-        - (set(known_states.book_dupes.keys()) | set().union(*(known_states.book_dupes.values())))
-    )
+    book_groups = known_states.book_groups
+    # New canonical versions from exact matches still need to be compared to everything else
+    exact_canonicals = merge_exact_matches(books, book_groups, known_ignores.book_ignores)
+    unscanned_books = {book for book in books if book not in book_groups} | exact_canonicals
 
     if rescan_keys is False:
         non_dupe_str = ""
     else:
-        best_books = set(known_states.book_dupes.keys())
+        best_books = set(book_groups.canonicals())
         unscanned_books |= best_books
         non_dupe_str = f", of which {len(best_books)} are being rescanned"
 
+    all_books = unscanned_books.union(book_groups)
+    author_blocks = (
+        AuthorBlocks(all_books, known_states.get_author_dedupe_map(), match_score)
+        if block_by_author
+        else None
+    )
+
+    # Score everything up front so that review never waits on scoring
+    match_scorer = MatchScorer(all_books, match_score, author_blocks)
+    match_scorer.prescore(unscanned_books, BOOK_CANDIDATES_FILEPATH)
+
     total_to_scan = len(unscanned_books)
     count = 0
     LOGGER.info(f"Scanning {total_to_scan} unscanned books{non_dupe_str}.")
-    while len(unscanned_books) > 0:
-        count += 1
-        print(f"\n{count}/{total_to_scan}")  # noqa: T201
-        new_book = unscanned_books.pop()
-
-        process_new_pair(
-            known_states.book_dupes,
-            known_ignores.ignored_book_dupes,
-            unscanned_books,
-            new_book,
-            match_score,
-        )
+    # Matches for the next few books are looked up while each prompt waits for input
+    with MatchPrefetcher(match_scorer, PREFETCH_DEPTH) as match_prefetcher:
+        for new_book in match_prefetcher.scan(unscanned_books):
+            count += 1
+            print(f"\n{count}/{total_to_scan}")  # noqa: T201
+
+            process_new_pair(
+                book_groups,
+                known_ignores.book_ignores,
+                unscanned_books,
+                new_book,
+                match_prefetcher,
+                auto_accept_score,
+            )
 
 
 def get_possible_author_matches(
@@ -133,37 +160,56 @@ def get_possible_author_matches(
     rescan_keys: bool,
     known_states: RecordedDupes,
     known_ignores: RecordedIgnores,
+    max_edits: Optional[int],
+    auto_accept_score: Optional[int],
 ) -> None:
     """Get possible matches for un-checked authors"""
-    unscanned_authors = set(
-        authors
-        - (
-            set(known_states.author_dupes.keys())
-            | set().union(*(known_states.author_dupes.values()))
-        )
+    author_groups = known_states.author_groups
+    exact_canonicals = merge_exact_matches(
+        authors,
+        author_groups,
+        known_ignores.author_ignores,
     )
+    unscanned_authors = {
+        author for author in authors if author not in author_groups
+    } | exact_canonicals
     if rescan_keys is False:
         non_dupe_str = ""
     else:
-        best_authors = set(known_states.author_dupes.keys())
+        best_authors = set(author_groups.canonicals())
         unscanned_authors |= best_authors
         non_dupe_str = f", of which {len(best_authors)} are being rescanned"
 
+    all_authors = unscanned_authors.union(author_groups)
+    edit_distance_blocks = (
+        None if max_edits is None else EditDistanceBlocks(all_authors, max_edits)
+    )
+
+    # Score everything up front so that review never waits on scoring
+    match_scorer = MatchScorer(
+        all_authors,
+        match_score,
+        edit_distance_blocks,
+    )
+    match_scorer.prescore(unscanned_authors, AUTHOR_CANDIDATES_FILEPATH)
+
     total_to_scan = len(unscanned_authors)
     count = 0
     LOGGER.info(f"Scanning {len(unscanned_authors)} unscanned authors{non_dupe_str}.")
-    while len(unscanned_authors) > 0:
-        count += 1
-        print(f"\n{count}/{total_to_scan}")  # noqa: T201
-        new_author = unscanned_authors.pop()
-
-        process_new_pair(
-            known_states.author_dupes,
-            known_ignores.ignored_author_dupes,
-            unscanned_authors,
-            new_author,
-            match_score,
-        )
+    # Matches for the next few authors are looked up while each prompt waits for input
+    with MatchPrefetcher(match_scorer, PREFETCH_DEPTH) as match_prefetcher:
+        for new_author in match_prefetcher.scan(unscanned_authors):
+            count += 1
+            print(f"\n{count}/{total_to_scan}")  # noqa: T201
+
+            process_new_pair(
+                author_groups,
+                known_ignores.author_ignores,
+                unscanned_authors,
+                new_author,
+                match_prefetcher,
+                auto_accept_score,
+            )
 
 
 def update_dedupes_from_authors(
@@ -171,13 +217,9 @@ def update_dedupes_from_authors(
     author_dedupes: Mapping[Book, AbstractSet[Book]],
 ) -> None:
     """Take recorded Books for each deduped Author, and record to target Book"""
+    book_groups = recorded_states.book_groups
     for author_dedupe, author_dupes in author_dedupes.items():
-        if author_dedupe in recorded_states.book_dupes.keys():
-            recorded_states.book_dupes[author_dedupe] |= author_dupes
-        elif author_dedupe in set().union(*recorded_states.book_dupes.values()):
-            existing_key = find_existing_match(recorded_states.book_dupes, author_dedupe)
-            recorded_states.book_dupes[existing_key] |= author_dupes
-
-    with DUPE_RECORD_FILEPATH.open("w", encoding="utf8") as dupe_file:
-        dupe_file.write(recorded_states.model_dump_json(indent=2))
-    LOGGER.info("Updated duplicates saved.")
+        if book_groups.is_canonical(author_dedupe):
+            book_groups.add_dupes(author_dedupe, author_dupes)
+        elif book_groups.is_dupe(author_dedupe):
+            book_groups.add_dupes(book_groups.get_canonical(author_dedupe), author_dupes)
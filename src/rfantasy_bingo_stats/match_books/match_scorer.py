@@ -0,0 +1,245 @@
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import sha256
+from itertools import batched
+from math import ceil
+from pathlib import Path
+from typing import (
+    AbstractSet,
+    Generic,
+    Iterable,
+    Mapping,
+    Optional,
+    Protocol,
+    cast,
+)
+
+from progressbar import progressbar
+from rapidfuzz import fuzz
+
+from rfantasy_bingo_stats.logger import LOGGER
+from rfantasy_bingo_stats.match_books.candidate_index import (
+    NgramIndex,
+    could_match,
+    normalize_query,
+)
+from rfantasy_bingo_stats.models.defined_types import BookOrAuthor
+from rfantasy_bingo_stats.models.scored_candidates import ScoredCandidates
+
+# Bump whenever a change to scoring could change results, to invalidate saved scores
+SCORER_VERSION = 2
+
+PRESCORE_CHUNK_SIZE = 64
+
+# Each pre-scoring process builds its own scorer once, in `init_prescore_worker`
+WORKER_STATE: dict[str, object] = {}
+
+ScoredMatches = tuple[tuple[BookOrAuthor, int], ...]
+
+
+class ChoiceBlocks(Protocol[BookOrAuthor]):
+    """
+    Limits which choices in the pool each item is scored against
+
+    Saved candidates are only reused while every choice is in the same block.
+    """
+
+    def get_block(self, choice: BookOrAuthor) -> str: ...
+
+    def get_candidates(self, item: BookOrAuthor) -> AbstractSet[BookOrAuthor]: ...
+
+    def add(self, choice: BookOrAuthor) -> None: ...
+
+
+def get_pool_digest(choices: Iterable[str]) -> str:
+    """Get a digest identifying a pool of choices, independent of order"""
+    return sha256("\n".join(sorted(choices)).encode("utf8")).hexdigest()
+
+
+def init_prescore_worker(
+    choices: frozenset[BookOrAuthor],
+    match_score: int,
+    blocks: Optional[ChoiceBlocks[BookOrAuthor]],
+) -> None:
+    """Build the scorer used by every chunk a worker process handles"""
+    WORKER_STATE["scorer"] = MatchScorer(choices, match_score, blocks)
+
+
+def prescore_chunk(
+    items: tuple[BookOrAuthor, ...],
+) -> tuple[tuple[BookOrAuthor, ScoredMatches[BookOrAuthor]], ...]:
+    """Score a chunk of items in a worker process"""
+    scorer = cast(MatchScorer[BookOrAuthor], WORKER_STATE["scorer"])
+    return tuple((item, scorer.score(item)) for item in items)
+
+
+class MatchScorer(Generic[BookOrAuthor]):
+    """
+    Scores items against a pool of choices
+
+    Scores may be computed for many items up front, across all CPUs, with `prescore`.
+    Choices added to the pool afterward are scored when each item is looked up.
+    If blocks are given, items are only scored against the choices in their blocks.
+    """
+
+    def __init__(
+        self,
+        choices: Iterable[BookOrAuthor],
+        match_score: int,
+        blocks: Optional[ChoiceBlocks[BookOrAuthor]],
+    ) -> None:
+        self.match_score = match_score
+        self._blocks: Optional[ChoiceBlocks[BookOrAuthor]] = blocks
+        self._choices: frozenset[BookOrAuthor] = frozenset(choices)
+        self._index: NgramIndex[BookOrAuthor] = NgramIndex(self._choices)
+        self._prescored: dict[BookOrAuthor, ScoredMatches[BookOrAuthor]] = {}
+        self._late_choices: set[BookOrAuthor] = set()
+
+    def add_choice(self, choice: BookOrAuthor) -> bool:
+        """Add a new choice to the pool, returning whether it was new"""
+        if choice in self._index:
+            return False
+        self._index.add(choice)
+        self._late_choices.add(choice)
+        if self._blocks is not None:
+            self._blocks.add(choice)
+        return True
+
+    def score(self, item: BookOrAuthor) -> ScoredMatches[BookOrAuthor]:
+        """Score `item` against every choice in the pool that could reach `match_score`"""
+        normalized_item = normalize_query(item)
+        candidates: AbstractSet[BookOrAuthor]
+        if self._blocks is None:
+            candidates = self._index.get_normalized_candidates(normalized_item, self.match_score)
+        else:
+            candidates = self._blocks.get_candidates(item)
+        return self._score_choices(normalized_item, candidates)
+
+    def _score_choices(
+        self,
+        normalized_item: str,
+        choices: AbstractSet[BookOrAuthor],
+    ) -> ScoredMatches[BookOrAuthor]:
+        """Score an item against each choice, keeping those that reach `match_score`, best first"""
+        # Choices were normalized once, when added to the pool
+        normalized_choices = {choice: self._index.get_normalized(choice) for choice in choices}
+        scores = self._get_scores(normalized_item, frozenset(normalized_choices.values()))
+        matches = sorted(
+            (
+                (choice, scores[normalized_choice])
+                for choice, normalized_choice in normalized_choices.items()
+                # As in `thefuzz`, the cutoff applies before rounding
+                if scores[normalized_choice] >= self.match_score
+            ),
+            key=lambda match: match[1],
+            reverse=True,
+        )
+        return tuple((choice, round(score)) for choice, score in matches)
+
+    def _get_scores(
+        self,
+        normalized_item: str,
+        normalized_choices: AbstractSet[str],
+    ) -> Mapping[str, float]:
+        """
+        Get the `WRatio` of an item against each choice, or 0 if it is below `match_score`
+
+        Pairs that cannot reach `match_score` are never scored.
+        """
+        return {
+            choice: (
+                fuzz.WRatio(normalized_item, choice, score_cutoff=self.match_score)
+                if could_match(normalized_item, choice, self.match_score)
+                else 0.0
+            )
+            for choice in normalized_choices
+        }
+
+    def get_matches(self, item: BookOrAuthor) -> ScoredMatches[BookOrAuthor]:
+        """Get every choice in the pool that reaches `match_score`, best first"""
+        prescored = self._prescored.get(item)
+        if prescored is None:
+            return self.score(item)
+
+        late_choices = (
+            self._late_choices
+            if self._blocks is None
+            else self._late_choices.intersection(self._blocks.get_candidates(item))
+        )
+        late_matches = self._score_choices(normalize_query(item), late_choices)
+        if len(late_matches) == 0:
+            return prescored
+        return tuple(sorted(prescored + late_matches, key=lambda match: match[1], reverse=True))
+
+    def prescore(self, items: AbstractSet[BookOrAuthor], candidate_filepath: Path) -> None:
+        """
+        Score every item against the pool in parallel, and save the ranked candidates
+
+        Candidates saved by an earlier run against the same pool are reused.
+        """
+        pool_digest = get_pool_digest(
+            self._choices
+            if self._blocks is None
+            else (f"{choice}\t{self._blocks.get_block(choice)}" for choice in self._choices)
+        )
+        saved_candidates = self._load_candidates(candidate_filepath, pool_digest)
+        for item in items:
+            saved_matches = saved_candidates.get(item)
+            if saved_matches is not None:
+                self._prescored[item] = tuple(
+                    (type(item)(match), score) for match, score in saved_matches
+                )
+
+        unscored_items = sorted(item for item in items if item not in self._prescored)
+        if len(unscored_items) > 0:
+            LOGGER.info(f"Pre-scoring {len(unscored_items)} items.")
+            try:
+                with ProcessPoolExecutor(
+                    initializer=init_prescore_worker,
+                    initargs=(
+                        self._choices,
+                        self.match_score,
+                        self._blocks,
+                    ),
+                ) as executor:
+                    for chunk_scores in progressbar(
+                        executor.map(
+                            prescore_chunk,
+                            batched(unscored_items, PRESCORE_CHUNK_SIZE),
+                        ),
+                        max_value=ceil(len(unscored_items) / PRESCORE_CHUNK_SIZE),
+                    ):
+                        self._prescored.update(chunk_scores)
+            finally:
+                self._save_candidates(candidate_filepath, pool_digest)
+
+    def _load_candidates(
+        self,
+        candidate_filepath: Path,
+        pool_digest: str,
+    ) -> dict[str, tuple[tuple[str, int], ...]]:
+        """Load saved candidates, if they were scored the same way against the same pool"""
+        if not candidate_filepath.exists():
+            return {}
+
+        with candidate_filepath.open("r", encoding="utf8") as candidate_file:
+            scored_candidates = ScoredCandidates.model_validate_json(candidate_file.read())
+
+        if (
+            scored_candidates.scorer_version != SCORER_VERSION
+            or scored_candidates.match_score != self.match_score
+            or scored_candidates.pool_digest != pool_digest
+        ):
+            LOGGER.info("Saved candidates are out of date and will be rescored.")
+            return {}
+        return dict(scored_candidates.candidates)
+
+    def _save_candidates(self, candidate_filepath: Path, pool_digest: str) -> None:
+        scored_candidates = ScoredCandidates(
+            scorer_version=SCORER_VERSION,
+            match_score=self.match_score,
+            pool_digest=pool_digest,
+            candidates={item: matches for item, matches in self._prescored.items()},
+        )
+        candidate_filepath.parent.mkdir(parents=True, exist_ok=True)
+        with candidate_filepath.open("w", encoding="utf8") as candidate_file:
+            candidate_file.write(scored_candidates.model_dump_json())
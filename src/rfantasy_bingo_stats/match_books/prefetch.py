@@ -0,0 +1,99 @@
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+)
+from itertools import islice
+from threading import Lock
+from types import TracebackType
+from typing import (
+    Generic,
+    Iterable,
+    Iterator,
+    Optional,
+)
+
+from rfantasy_bingo_stats.match_books.match_scorer import (
+    MatchScorer,
+    ScoredMatches,
+)
+from rfantasy_bingo_stats.models.defined_types import BookOrAuthor
+
+PREFETCH_DEPTH = 3
+
+
+class MatchPrefetcher(Generic[BookOrAuthor]):
+    """
+    Looks up matches for the next few items on a background thread, during review of the current one
+
+    Lookups made before a new choice was added to the pool are discarded.
+    Lookups may include items unified or removed since; callers filter these out.
+    """
+
+    def __init__(self, match_scorer: MatchScorer[BookOrAuthor], depth: int) -> None:
+        self.depth = depth
+        self._match_scorer: MatchScorer[BookOrAuthor] = match_scorer
+        # The scorer is not safe to use from two threads at once
+        self._lock = Lock()
+        self._pool_version = 0
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="match-prefetch")
+        self._pending: dict[BookOrAuthor, Future[tuple[int, ScoredMatches[BookOrAuthor]]]] = {}
+
+    def __enter__(self) -> "MatchPrefetcher[BookOrAuthor]":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self._executor.shutdown(cancel_futures=True)
+
+    def scan(self, unscanned_items: set[BookOrAuthor]) -> Iterator[BookOrAuthor]:
+        """
+        Take each item out of `unscanned_items` in turn, skipping any removed in the meantime
+
+        Lookups for the next few items are started before each item is returned.
+        """
+        scan_order = sorted(unscanned_items)
+        for position, item in enumerate(scan_order):
+            if item not in unscanned_items:
+                continue
+            unscanned_items.discard(item)
+            self.prefetch(
+                upcoming
+                for upcoming in (
+                    scan_order[index] for index in range(position + 1, len(scan_order))
+                )
+                if upcoming in unscanned_items
+            )
+            yield item
+
+    def prefetch(self, upcoming_items: Iterable[BookOrAuthor]) -> None:
+        """Start looking up matches for the first `depth` upcoming items, dropping older lookups"""
+        to_prefetch = tuple(islice(upcoming_items, self.depth))
+        for item in set(self._pending).difference(to_prefetch):
+            self._pending.pop(item).cancel()
+        for item in to_prefetch:
+            if item not in self._pending:
+                self._pending[item] = self._executor.submit(self._look_up, item)
+
+    def get_matches(self, item: BookOrAuthor) -> ScoredMatches[BookOrAuthor]:
+        """Get every choice in the pool that reaches the match score, best first"""
+        future = self._pending.pop(item, None)
+        if future is not None and not future.cancel():
+            pool_version, matches = future.result()
+            if pool_version == self._pool_version:
+                return matches
+        return self._look_up(item)[1]
+
+    def add_choice(self, choice: BookOrAuthor) -> None:
+        """Add a new choice to the pool, invalidating lookups made before it"""
+        with self._lock:
+            if self._match_scorer.add_choice(choice):
+                self._pool_version += 1
+
+    def _look_up(self, item: BookOrAuthor) -> tuple[int, ScoredMatches[BookOrAuthor]]:
+        """Get the matches for an item, with the version of the pool they were found in"""
+        with self._lock:
+            return self._pool_version, self._match_scorer.get_matches(item)
@@ -1,4 +1,4 @@
-from collections import defaultdict
+from datetime import datetime
 from typing import (
     AbstractSet,
     Mapping,
@@ -6,14 +6,21 @@ from typing import (
     cast,
 )
 
-from thefuzz import process  # type: ignore[import-untyped]
-
+from rfantasy_bingo_stats.constants import AUTO_MATCH_LOG_FILEPATH
 from rfantasy_bingo_stats.data_operations.author_title_book_operations import split_multi_author
 from rfantasy_bingo_stats.logger import LOGGER
+from rfantasy_bingo_stats.match_books.auto_accept import record_auto_match
+from rfantasy_bingo_stats.match_books.prefetch import MatchPrefetcher
+from rfantasy_bingo_stats.models.auto_match_record import (
+    AutoMatchAction,
+    AutoMatchRecord,
+)
 from rfantasy_bingo_stats.models.defined_types import (
     Author,
     BookOrAuthor,
 )
+from rfantasy_bingo_stats.models.dupe_groups import DupeGroups
+from rfantasy_bingo_stats.models.ignored_matches import IgnoredMatches
 
 BANNED_MATCHES = {
     "âge",
@@ -69,38 +76,44 @@ BANNED_MATCHES = {
 
 
 def process_new_pair(
-    dupes: defaultdict[BookOrAuthor, set[BookOrAuthor]],
-    all_matches_to_ignore: defaultdict[BookOrAuthor, set[BookOrAuthor]],
+    dupes: DupeGroups[BookOrAuthor],
+    all_matches_to_ignore: IgnoredMatches[BookOrAuthor],
     unscanned_items: set[BookOrAuthor],
     item_to_process: BookOrAuthor,
-    match_score: int,
+    match_prefetcher: MatchPrefetcher[BookOrAuthor],
+    auto_accept_score: Optional[int],
 ) -> None:
     """Process an unscanned title/author pair"""
 
-    dedupes = set().union(*(dupes.values()))
-    all_choices = set(dupes.keys()) | dedupes | unscanned_items
     new_matches_to_ignore: AbstractSet[BookOrAuthor] = set()
+    best_match: Optional[BookOrAuthor]
 
-    results = process.extractBests(
-        query=item_to_process,
-        choices=all_choices,
-        score_cutoff=match_score,
-        limit=len(all_choices),
+    # The scorer's pool includes items that have since been unified or removed
+    results = tuple(
+        (item_match, score)
+        for item_match, score in match_prefetcher.get_matches(item_to_process)
+        if item_match in dupes or item_match in unscanned_items
     )
     existing_match_keys = set()
     possible_matches = {item_to_process}
-    if results is not None and len(results) > 0:
+    if len(results) > 0:
         print(f"Matching {item_to_process}:")  # noqa: T201
-        for item_match, _ in results:
-            if item_match in dedupes:
-                existing_match_keys.add(find_existing_match(dupes, item_match))
-            elif item_match in dupes.keys():
+        # Score of the best match in each group
+        match_scores: dict[BookOrAuthor, int] = {}
+        for item_match, score in results:
+            if dupes.is_dupe(item_match):
+                match_key = dupes.get_canonical(item_match)
+                existing_match_keys.add(match_key)
+            elif dupes.is_canonical(item_match):
+                match_key = item_match
                 existing_match_keys.add(item_match)
             else:
+                match_key = item_match
                 possible_matches.add(item_match)
+            match_scores[match_key] = max(score, match_scores.get(match_key, score))
 
-        initial_match_choices = frozenset(possible_matches | existing_match_keys) - (
-            all_matches_to_ignore[item_to_process] | BANNED_MATCHES
+        initial_match_choices = frozenset(possible_matches | existing_match_keys).difference(
+            all_matches_to_ignore.get_ignored(item_to_process), BANNED_MATCHES
         )
 
         filtered_match_choices = set(initial_match_choices)
@@ -111,7 +124,7 @@ def process_new_pair(
             split_item_to_process = set(split_multi_author(item_to_process))
             for match_choice in initial_match_choices:
                 # And the matched item.
-                split_match_choice = set(split_multi_author(cast(Author, match_choice)))
+                split_match_choice = set(split_multi_author(Author(match_choice)))
                 # If either is a proper subset of the other...
                 if (
                     split_item_to_process < split_match_choice
@@ -120,20 +133,50 @@ def process_new_pair(
                     # Remove the matched item from the choices.
                     filtered_match_choices -= {match_choice}
 
-        if len(filtered_match_choices) > 1:
+        auto_match = (
+            None
+            if auto_accept_score is None
+            else get_auto_match(
+                dupes,
+                item_to_process,
+                filtered_match_choices,
+                existing_match_keys,
+                match_scores,
+                auto_accept_score,
+            )
+        )
+
+        if auto_match is not None:
+            best_match, auto_dupe = auto_match
+            other_matches = frozenset({best_match, auto_dupe})
+            new_matches_to_ignore = initial_match_choices.difference(other_matches)
+            record_auto_match(
+                AutoMatchRecord(
+                    action=AutoMatchAction.ACCEPT,
+                    match_type="Author" if isinstance(item_to_process, Author) else "Book",
+                    dupe=auto_dupe,
+                    canonical=best_match,
+                    score=match_scores[auto_dupe if best_match == item_to_process else best_match],
+                    timestamp=datetime.now(),
+                ),
+                AUTO_MATCH_LOG_FILEPATH,
+            )
+            LOGGER.info(f"Automatically matched {auto_dupe} to {best_match}.")
+
+        elif len(filtered_match_choices) > 1:
             best_match, other_matches = get_best_match(
                 original_matched_items=filtered_match_choices,
                 existing_match_keys=existing_match_keys,
             )
 
-            if best_match in dedupes:
+            if best_match is not None and dupes.is_dupe(best_match):
                 old_best = best_match
-                best_match = find_existing_match(dupes, old_best)
+                best_match = dupes.get_canonical(old_best)
                 LOGGER.warning(f"{old_best} already deduped to {best_match}. Using {best_match}.")
 
             # Remove `item_to_process` to prevent issues on reload
-            new_matches_to_ignore = initial_match_choices - (
-                other_matches | {best_match, item_to_process}
+            new_matches_to_ignore = initial_match_choices.difference(
+                other_matches, {best_match, item_to_process}
             )
 
         else:
@@ -149,13 +192,11 @@ def process_new_pair(
         best_match = None
         other_matches = frozenset()
 
-    all_matches_to_ignore[item_to_process] |= new_matches_to_ignore
-    for match_to_ignore in new_matches_to_ignore:
-        all_matches_to_ignore[match_to_ignore].add(item_to_process)
+    all_matches_to_ignore.ignore(item_to_process, new_matches_to_ignore)
 
     if best_match is None:
         LOGGER.info(f"No duplicates found for {item_to_process}")
-        dupes[item_to_process] |= set()
+        dupes.add_canonical(item_to_process)
     else:
         # Intersection discards matches removed in `get_best_match`
         possible_matches &= other_matches
@@ -171,6 +212,8 @@ def process_new_pair(
             other_matches=frozenset(possible_matches),
             existing_match_keys=frozenset(existing_match_keys),
         )
+        # `best_match` may be a new version entered by hand
+        match_prefetcher.add_choice(best_match)
 
         # Drop matches that were just unified
         unscanned_items -= possible_matches
@@ -178,18 +221,54 @@ def process_new_pair(
         unscanned_items.discard(best_match)
 
 
-def find_existing_match(
-    dupes: Mapping[BookOrAuthor, AbstractSet[BookOrAuthor]],
-    current_match: BookOrAuthor,
-) -> BookOrAuthor:
-    """Determine which key to use for existing match"""
-
-    for existing_match_key, dupe_tuples in dupes.items():
-        if current_match in dupe_tuples:
-            return existing_match_key
-
-    raise ValueError(
-        f"{current_match} was found in existing dupes, but matching key could not be found."
+def get_auto_match(
+    dupes: DupeGroups[BookOrAuthor],
+    item_to_process: BookOrAuthor,
+    match_choices: AbstractSet[BookOrAuthor],
+    existing_match_keys: AbstractSet[BookOrAuthor],
+    match_scores: Mapping[BookOrAuthor, int],
+    auto_accept_score: int,
+) -> Optional[tuple[BookOrAuthor, BookOrAuthor]]:
+    """
+    Pick the canonical version and duplicate for a lone match scoring at least `auto_accept_score`
+
+    The existing canonical version is preferred. Returns `None` if the match needs review,
+    including when it would merge two existing groups.
+    """
+    other_choices = set(match_choices)
+    other_choices.discard(item_to_process)
+    if len(other_choices) != 1:
+        return None
+    (match_choice,) = other_choices
+
+    if match_scores.get(match_choice, 0) < auto_accept_score:
+        return None
+
+    if match_choice in existing_match_keys:
+        if dupes.is_canonical(item_to_process):
+            return None
+        return match_choice, item_to_process
+    if dupes.is_canonical(item_to_process):
+        return item_to_process, match_choice
+
+    best_match = choose_canonical({item_to_process, match_choice})
+    return best_match, match_choice if best_match == item_to_process else item_to_process
+
+
+def choose_canonical(items: AbstractSet[BookOrAuthor]) -> BookOrAuthor:
+    """
+    Pick the best-formatted version
+
+    Prefers clean whitespace, then mixed case, then the longest, then the alphabetically first.
+    """
+    return min(
+        items,
+        key=lambda item: (
+            item != " ".join(item.split()),
+            item.islower() or item.isupper(),
+            -len(item),
+            item,
+        ),
     )
 
 
@@ -235,7 +314,7 @@ def get_best_match(
 
 
 def unify_matches(
-    dupes: defaultdict[BookOrAuthor, set[BookOrAuthor]],
+    dupes: DupeGroups[BookOrAuthor],
     best_match: BookOrAuthor,
     other_matches: frozenset[BookOrAuthor],
     existing_match_keys: frozenset[BookOrAuthor],
@@ -243,13 +322,11 @@ def unify_matches(
     """Unify all books associated with other match and existing key to best match"""
 
     for existing_key in existing_match_keys:
-        dupes[best_match] |= dupes[existing_key]
-        dupes[best_match].add(existing_key)
-        del dupes[existing_key]
+        dupes.merge_canonical(existing_key, best_match)
         LOGGER.warning(f"Duplicates of {existing_key} swapped to duplicates of {best_match}")
 
     if len(other_matches) > 0:
-        dupes[best_match] |= other_matches
+        dupes.add_dupes(best_match, other_matches)
         LOGGER.info(
             f"{', '.join(other_matches)} recorded as duplicate{'s'*(len(other_matches) > 1)} of {best_match}"
         )
@@ -16,7 +16,10 @@ from rfantasy_bingo_stats.models.author_info import (
     Gender,
     Nationality,
 )
-from rfantasy_bingo_stats.models.defined_types import SortedCounter
+from rfantasy_bingo_stats.models.defined_types import (
+    SortedCounter,
+    merge_counters,
+)
 
 
 class AuthorStatistics(BaseModel):
@@ -27,6 +30,15 @@ class AuthorStatistics(BaseModel):
     queer_count: Counter[Optional[bool]] = Counter()
     nationality_count: SortedCounter[Nationality] = Counter()
 
+    def merge(self, other: "AuthorStatistics") -> "AuthorStatistics":
+        """Combine with the statistics of later cards"""
+        return AuthorStatistics(
+            gender_count=merge_counters(self.gender_count, other.gender_count),
+            ethnicity_count=merge_counters(self.ethnicity_count, other.ethnicity_count),
+            queer_count=merge_counters(self.queer_count, other.queer_count),
+            nationality_count=merge_counters(self.nationality_count, other.nationality_count),
+        )
+
     @field_serializer("queer_count", mode="plain")
     def sort_ser_none_key(
         self,
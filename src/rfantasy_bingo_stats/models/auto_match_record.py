@@ -0,0 +1,21 @@
+from datetime import datetime
+from enum import StrEnum
+from typing import Literal
+
+from pydantic.main import BaseModel
+
+
+class AutoMatchAction(StrEnum):
+    ACCEPT = "accept"
+    REVERT = "revert"
+
+
+class AutoMatchRecord(BaseModel):
+    """A match unified without review, or the reversal of one"""
+
+    action: AutoMatchAction
+    match_type: Literal["Author", "Book"]
+    dupe: str
+    canonical: str
+    score: int
+    timestamp: datetime
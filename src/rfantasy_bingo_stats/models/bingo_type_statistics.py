@@ -4,6 +4,7 @@ from rfantasy_bingo_stats.models.defined_types import (
     BingoName,
     CardID,
     SortedCounter,
+    merge_counters,
 )
 
 
@@ -13,3 +14,15 @@ class BingoTypeStatistics(BaseModel):
     complete_bingos_by_card: SortedCounter[CardID]
     incomplete_bingos: SortedCounter[BingoName]
     incomplete_squares_by_bingo: SortedCounter[BingoName]
+
+    def merge(self, other: "BingoTypeStatistics") -> "BingoTypeStatistics":
+        """Combine with the statistics of later cards"""
+        return BingoTypeStatistics(
+            complete_bingos_by_card=merge_counters(
+                self.complete_bingos_by_card, other.complete_bingos_by_card
+            ),
+            incomplete_bingos=merge_counters(self.incomplete_bingos, other.incomplete_bingos),
+            incomplete_squares_by_bingo=merge_counters(
+                self.incomplete_squares_by_bingo, other.incomplete_squares_by_bingo
+            ),
+        )
@@ -0,0 +1,34 @@
+from pydantic.main import BaseModel
+from pydantic.type_adapter import TypeAdapter
+
+from rfantasy_bingo_stats.models.defined_types import (
+    Book,
+    CardID,
+    SquareName,
+)
+
+
+class SquareBookUses(BaseModel):
+    """The deduplicated book read for a square, and how often it was read that year"""
+
+    square_name: SquareName
+    book: Book
+    total_uses: int
+    square_uses: int
+
+
+class CardSummary(BaseModel):
+    """Everything needed to report on a single card, without loading the rest of the year"""
+
+    card_id: CardID
+    square_books: tuple[SquareBookUses, ...]
+
+
+class CardReport(BaseModel):
+    """The report on a single card, as written for every card at once"""
+
+    card_id: CardID
+    report: str
+
+
+CardOffsetsAdapter: TypeAdapter[dict[CardID, int]] = TypeAdapter(dict[CardID, int])
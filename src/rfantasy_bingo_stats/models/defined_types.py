@@ -3,6 +3,7 @@ from collections import (
     defaultdict,
 )
 from collections.abc import (
+    Callable,
     Iterable,
     Mapping,
 )
@@ -121,6 +122,25 @@ def sort(data: Mapping[K, V] | Iterable[T] | T) -> dict[K, V] | list[T] | T:
     return cast(T, data)
 
 
+def merge_counters(first: Counter[K], second: Counter[K]) -> Counter[K]:
+    """Add two counters, keeping zero counts and the order their keys first appeared in"""
+    merged = first.copy()
+    merged.update(second)
+    return merged
+
+
+def merge_mappings(
+    first: Mapping[K, V],
+    second: Mapping[K, V],
+    merge: Callable[[V, V], V],
+) -> dict[K, V]:
+    """Combine two mappings, merging the values of keys in both"""
+    merged = dict(first)
+    for key, val in second.items():
+        merged[key] = merge(merged[key], val) if key in merged else val
+    return merged
+
+
 SortedCounter = Annotated[Counter[K], PlainSerializer(sort)]
 SortedDefaultdict = Annotated[defaultdict[K, V], PlainSerializer(sort)]
 SortedMapping = Annotated[Mapping[K, V], PlainSerializer(sort)]
@@ -0,0 +1,70 @@
+from collections import defaultdict
+from collections.abc import Hashable
+from types import MappingProxyType as MAP
+from typing import (
+    Generic,
+    Iterable,
+    Iterator,
+    Mapping,
+    TypeVar,
+)
+
+T = TypeVar("T", bound=Hashable)
+
+
+class DisjointSet(Generic[T]):
+    """Union-find over hashable items, with path compression and union by size"""
+
+    def __init__(self, items: Iterable[T] = ()) -> None:
+        self._parents: dict[T, T] = {}
+        self._sizes: dict[T, int] = {}
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._parents
+
+    def __len__(self) -> int:
+        return len(self._parents)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._parents)
+
+    def add(self, item: T) -> None:
+        """Add an item as its own group, if it is new"""
+        if item not in self._parents:
+            self._parents[item] = item
+            self._sizes[item] = 1
+
+    def find(self, item: T) -> T:
+        """Get the representative of the group containing `item`, adding it if it is new"""
+        self.add(item)
+
+        root = item
+        while self._parents[root] != root:
+            root = self._parents[root]
+
+        while self._parents[item] != root:
+            self._parents[item], item = root, self._parents[item]
+
+        return root
+
+    def union(self, item_1: T, item_2: T) -> T:
+        """Merge the groups containing two items, returning the new representative"""
+        root_1 = self.find(item_1)
+        root_2 = self.find(item_2)
+        if root_1 == root_2:
+            return root_1
+
+        if self._sizes[root_1] < self._sizes[root_2]:
+            root_1, root_2 = root_2, root_1
+        self._parents[root_2] = root_1
+        self._sizes[root_1] += self._sizes.pop(root_2)
+        return root_1
+
+    def groups(self) -> Mapping[T, frozenset[T]]:
+        """Get every group, keyed on its representative"""
+        members: defaultdict[T, set[T]] = defaultdict(set)
+        for item in self._parents:
+            members[self.find(item)].add(item)
+        return MAP({root: frozenset(group) for root, group in members.items()})
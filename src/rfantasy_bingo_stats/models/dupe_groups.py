@@ -0,0 +1,182 @@
+from collections import defaultdict
+from types import MappingProxyType as MAP
+from typing import (
+    AbstractSet,
+    Generic,
+    Iterator,
+    KeysView,
+    Mapping,
+    Optional,
+)
+
+from rfantasy_bingo_stats.logger import LOGGER
+from rfantasy_bingo_stats.models.defined_types import BookOrAuthor
+from rfantasy_bingo_stats.models.disjoint_set import DisjointSet
+from rfantasy_bingo_stats.models.journal_entry import (
+    JournalOperation,
+    JournalRecorder,
+)
+
+
+class DupeGroups(Generic[BookOrAuthor]):
+    """
+    Canonical versions and their duplicates, backed by a disjoint set for constant-time lookups
+
+    Wraps the serialized duplicate mapping; all changes to the mapping should go through here
+    so that the disjoint set stays consistent and changes are journaled.
+    """
+
+    def __init__(self, dupes: defaultdict[BookOrAuthor, set[BookOrAuthor]]) -> None:
+        self._dupes: defaultdict[BookOrAuthor, set[BookOrAuthor]] = dupes
+        self._sets: DisjointSet[BookOrAuthor] = DisjointSet()
+        self._canonical_by_root: dict[BookOrAuthor, BookOrAuthor] = {}
+        self._journal: Optional[JournalRecorder] = None
+        self._index_groups()
+
+    def set_journal(self, journal: Optional[JournalRecorder]) -> None:
+        """Record every later change with `journal`"""
+        self._journal = journal
+
+    def _record(
+        self,
+        operation: JournalOperation,
+        item: BookOrAuthor,
+        others: AbstractSet[BookOrAuthor] = frozenset(),
+    ) -> None:
+        if self._journal is not None:
+            self._journal(operation, item, tuple(sorted(others)))
+
+    def _index_groups(self) -> None:
+        """Build the disjoint set from the duplicate mapping"""
+        self._sets = DisjointSet()
+        for canonical, canonical_dupes in self._dupes.items():
+            self._sets.add(canonical)
+            for dupe in canonical_dupes:
+                self._sets.union(canonical, dupe)
+
+        self._canonical_by_root = {
+            self._sets.find(canonical): canonical for canonical in self._dupes
+        }
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._sets
+
+    def __iter__(self) -> Iterator[BookOrAuthor]:
+        """Iterate over every canonical version and duplicate"""
+        return iter(self._sets)
+
+    def canonicals(self) -> KeysView[BookOrAuthor]:
+        """Get every canonical version"""
+        return self._dupes.keys()
+
+    def is_canonical(self, item: BookOrAuthor) -> bool:
+        return item in self._dupes
+
+    def is_dupe(self, item: BookOrAuthor) -> bool:
+        return item in self._sets and item not in self._dupes
+
+    def get_dupes(self, canonical: BookOrAuthor) -> AbstractSet[BookOrAuthor]:
+        """Get the recorded duplicates of a canonical version"""
+        return self._dupes.get(canonical, frozenset())
+
+    def get_canonical(self, dupe: BookOrAuthor) -> BookOrAuthor:
+        """Determine which canonical version a duplicate belongs to"""
+        if not self.is_dupe(dupe):
+            raise ValueError(
+                f"{dupe} was found in existing dupes, but matching key could not be found."
+            )
+        return self._canonical_by_root[self._sets.find(dupe)]
+
+    def get_dedupe_map(self) -> Mapping[BookOrAuthor, BookOrAuthor]:
+        """Reverse the groups to get duplicates as keys"""
+        return MAP(
+            {
+                dupe: canonical
+                for canonical, canonical_dupes in self._dupes.items()
+                for dupe in canonical_dupes
+            }
+        )
+
+    def add_canonical(self, canonical: BookOrAuthor) -> None:
+        """Record a canonical version, with no duplicates if it is new"""
+        if canonical not in self._sets:
+            self._add_canonical(canonical)
+            self._record(JournalOperation.ADD_CANONICAL, canonical)
+
+    def _add_canonical(self, canonical: BookOrAuthor) -> None:
+        if canonical not in self._sets:
+            self._sets.add(canonical)
+            self._canonical_by_root[canonical] = canonical
+            self._dupes[canonical] = set()
+
+    def add_dupes(self, canonical: BookOrAuthor, dupes: AbstractSet[BookOrAuthor]) -> None:
+        """
+        Record duplicates of a canonical version
+
+        Any duplicate already in another group brings that whole group along with it.
+        """
+        self._add_dupes(canonical, dupes)
+        self._record(JournalOperation.ADD_DUPES, canonical, dupes)
+
+    def _add_dupes(self, canonical: BookOrAuthor, dupes: AbstractSet[BookOrAuthor]) -> None:
+        canonical = self._resolve_canonical(canonical)
+        for dupe in dupes:
+            if dupe == canonical:
+                continue
+            if dupe in self._sets:
+                existing_canonical = self._canonical_by_root[self._sets.find(dupe)]
+                if existing_canonical != canonical:
+                    LOGGER.warning(
+                        f"{dupe} is already grouped with {existing_canonical}."
+                        + f" Duplicates of {existing_canonical} swapped to duplicates of {canonical}"
+                    )
+                    self._merge_groups(existing_canonical, canonical)
+            else:
+                root = self._sets.union(canonical, dupe)
+                self._canonical_by_root[root] = canonical
+                self._dupes[canonical].add(dupe)
+
+    def merge_canonical(self, old_canonical: BookOrAuthor, new_canonical: BookOrAuthor) -> None:
+        """Record an old canonical version and all of its duplicates as duplicates of another"""
+        new_canonical = self._resolve_canonical(new_canonical)
+        if old_canonical in self._dupes and old_canonical != new_canonical:
+            self._merge_groups(old_canonical, new_canonical)
+        else:
+            self._add_dupes(new_canonical, {old_canonical})
+        self._record(JournalOperation.MERGE_CANONICAL, old_canonical, {new_canonical})
+
+    def remove_dupe(self, dupe: BookOrAuthor) -> BookOrAuthor:
+        """
+        Remove a duplicate from its group, returning the canonical version it was removed from
+
+        The disjoint set cannot split groups, so it is rebuilt.
+        """
+        canonical = self.get_canonical(dupe)
+        self._dupes[canonical].discard(dupe)
+        self._index_groups()
+        self._record(JournalOperation.REMOVE_DUPE, dupe)
+        return canonical
+
+    def _resolve_canonical(self, item: BookOrAuthor) -> BookOrAuthor:
+        """Use the existing canonical version if `item` is a duplicate, or record `item` if new"""
+        if self.is_dupe(item):
+            canonical = self.get_canonical(item)
+            LOGGER.warning(f"{item} already deduped to {canonical}. Using {canonical}.")
+            return canonical
+        self._add_canonical(item)
+        return item
+
+    def _merge_groups(self, old_canonical: BookOrAuthor, new_canonical: BookOrAuthor) -> None:
+        """Merge two groups, keeping the canonical version of the second"""
+        self._canonical_by_root.pop(self._sets.find(old_canonical), None)
+        self._canonical_by_root.pop(self._sets.find(new_canonical), None)
+        self._canonical_by_root[self._sets.union(old_canonical, new_canonical)] = new_canonical
+
+        old_dupes = self._dupes.pop(old_canonical)
+        new_dupes = self._dupes[new_canonical]
+        # Add the smaller set to the larger
+        if len(old_dupes) > len(new_dupes):
+            old_dupes, new_dupes = new_dupes, old_dupes
+        new_dupes |= old_dupes
+        new_dupes.add(old_canonical)
+        self._dupes[new_canonical] = new_dupes
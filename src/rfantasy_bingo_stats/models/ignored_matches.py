@@ -0,0 +1,43 @@
+from collections import defaultdict
+from typing import (
+    AbstractSet,
+    Generic,
+    Optional,
+)
+
+from rfantasy_bingo_stats.models.defined_types import BookOrAuthor
+from rfantasy_bingo_stats.models.journal_entry import (
+    JournalOperation,
+    JournalRecorder,
+)
+
+
+class IgnoredMatches(Generic[BookOrAuthor]):
+    """
+    Pairs recorded as not duplicates of each other
+
+    Wraps the serialized ignore mapping; all changes to the mapping should go through here
+    so that they are journaled.
+    """
+
+    def __init__(self, ignores: defaultdict[BookOrAuthor, set[BookOrAuthor]]) -> None:
+        self._ignores: defaultdict[BookOrAuthor, set[BookOrAuthor]] = ignores
+        self._journal: Optional[JournalRecorder] = None
+
+    def set_journal(self, journal: Optional[JournalRecorder]) -> None:
+        """Record every later change with `journal`"""
+        self._journal = journal
+
+    def get_ignored(self, item: BookOrAuthor) -> AbstractSet[BookOrAuthor]:
+        """Get every item recorded as not a duplicate of `item`"""
+        return self._ignores.get(item, frozenset())
+
+    def ignore(self, item: BookOrAuthor, matches: AbstractSet[BookOrAuthor]) -> None:
+        """Record that `item` is not a duplicate of any of `matches`, and vice versa"""
+        if len(matches) == 0:
+            return
+        self._ignores[item] |= matches
+        for match in matches:
+            self._ignores[match].add(item)
+        if self._journal is not None:
+            self._journal(JournalOperation.IGNORE, item, tuple(sorted(matches)))
@@ -0,0 +1,28 @@
+from enum import StrEnum
+from typing import (
+    Callable,
+    Literal,
+)
+
+from pydantic.main import BaseModel
+
+
+class JournalOperation(StrEnum):
+    ADD_CANONICAL = "add_canonical"
+    ADD_DUPES = "add_dupes"
+    MERGE_CANONICAL = "merge_canonical"
+    REMOVE_DUPE = "remove_dupe"
+    IGNORE = "ignore"
+
+
+class JournalEntry(BaseModel):
+    """A change to the recorded duplicates or ignores, made since they were last saved in full"""
+
+    operation: JournalOperation
+    match_type: Literal["Author", "Book"]
+    item: str
+    others: tuple[str, ...] = ()
+
+
+# Records one change to a group of duplicates or ignores, which knows its own match type
+JournalRecorder = Callable[[JournalOperation, str, tuple[str, ...]], None]
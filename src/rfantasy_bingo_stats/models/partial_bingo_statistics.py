@@ -0,0 +1,112 @@
+from collections import Counter
+from collections.abc import Mapping
+from dataclasses import dataclass
+from itertools import chain
+
+from rfantasy_bingo_stats.models.author_statistics import AuthorStatistics
+from rfantasy_bingo_stats.models.bingo_type_statistics import BingoTypeStatistics
+from rfantasy_bingo_stats.models.defined_types import (
+    Author,
+    Book,
+    CardID,
+    SquareName,
+    merge_counters,
+    merge_mappings,
+)
+from rfantasy_bingo_stats.models.unique_statistics import UniqueStatistics
+
+
+@dataclass(frozen=True)
+class PartialBingoStatistics:
+    """
+    Statistics for a run of consecutive bingo cards, which can be merged with the next run
+
+    Every counter is kept in the order its keys first appeared, which merging in card order
+    preserves. Statistics that depend on every card, such as which books were read only once,
+    are kept as the counts needed to resolve them after the last merge.
+    """
+
+    card_ids: tuple[CardID, ...]
+    story_count: int
+    incomplete_cards: Counter[CardID]
+    incomplete_squares: Counter[SquareName]
+    subbed_squares: Counter[tuple[SquareName, SquareName]]
+    subbed_out_squares: Counter[SquareName]
+    overall_uniques: UniqueStatistics
+    square_uniques: Mapping[SquareName, UniqueStatistics]
+    # Each distinct misspelling of each book, and each distinct book of each author
+    book_misspellings: Counter[tuple[Book, Book]]
+    author_books: Counter[tuple[Author, Book]]
+    bad_spellings_by_card: Counter[CardID]
+    hard_mode_by_card: Counter[CardID]
+    hard_mode_by_square: Counter[SquareName]
+    overall_author_stats: AuthorStatistics
+    square_author_stats: Mapping[SquareName, AuthorStatistics]
+    # The card of each book read only once
+    single_book_cards: Mapping[Book, CardID]
+    # Author appearances counted as new, and the authors counted as new only for appearing first
+    new_authors: Counter[Author]
+    first_new_authors: frozenset[Author]
+    new_square_authors: Counter[tuple[SquareName, Author]]
+    first_new_square_authors: frozenset[tuple[SquareName, Author]]
+    normal_bingo_type_stats: BingoTypeStatistics
+    hardmode_bingo_type_stats: BingoTypeStatistics
+
+    def merge(self, later: "PartialBingoStatistics") -> "PartialBingoStatistics":
+        """Combine with the statistics of the cards that follow"""
+        overall_uniques = self.overall_uniques.merge(later.overall_uniques)
+
+        # An author's first appearance in the later cards is no longer their first overall
+        new_authors = merge_counters(self.new_authors, later.new_authors)
+        for author in later.first_new_authors.intersection(self.new_authors):
+            new_authors[author] -= 1
+        new_square_authors = merge_counters(self.new_square_authors, later.new_square_authors)
+        for square_author in later.first_new_square_authors.intersection(self.new_square_authors):
+            new_square_authors[square_author] -= 1
+
+        return PartialBingoStatistics(
+            card_ids=self.card_ids + later.card_ids,
+            story_count=self.story_count + later.story_count,
+            incomplete_cards=merge_counters(self.incomplete_cards, later.incomplete_cards),
+            incomplete_squares=merge_counters(self.incomplete_squares, later.incomplete_squares),
+            subbed_squares=merge_counters(self.subbed_squares, later.subbed_squares),
+            subbed_out_squares=merge_counters(self.subbed_out_squares, later.subbed_out_squares),
+            overall_uniques=overall_uniques,
+            square_uniques=merge_mappings(
+                self.square_uniques, later.square_uniques, UniqueStatistics.merge
+            ),
+            book_misspellings=merge_counters(self.book_misspellings, later.book_misspellings),
+            author_books=merge_counters(self.author_books, later.author_books),
+            bad_spellings_by_card=merge_counters(
+                self.bad_spellings_by_card, later.bad_spellings_by_card
+            ),
+            hard_mode_by_card=merge_counters(self.hard_mode_by_card, later.hard_mode_by_card),
+            hard_mode_by_square=merge_counters(
+                self.hard_mode_by_square, later.hard_mode_by_square
+            ),
+            overall_author_stats=self.overall_author_stats.merge(later.overall_author_stats),
+            square_author_stats=merge_mappings(
+                self.square_author_stats, later.square_author_stats, AuthorStatistics.merge
+            ),
+            single_book_cards={
+                book: card_id
+                for book, card_id in chain(
+                    self.single_book_cards.items(), later.single_book_cards.items()
+                )
+                if overall_uniques.unique_books[book] == 1
+            },
+            new_authors=new_authors,
+            first_new_authors=self.first_new_authors.union(
+                later.first_new_authors.difference(self.new_authors)
+            ),
+            new_square_authors=new_square_authors,
+            first_new_square_authors=self.first_new_square_authors.union(
+                later.first_new_square_authors.difference(self.new_square_authors)
+            ),
+            normal_bingo_type_stats=self.normal_bingo_type_stats.merge(
+                later.normal_bingo_type_stats
+            ),
+            hardmode_bingo_type_stats=self.hardmode_bingo_type_stats.merge(
+                later.hardmode_bingo_type_stats
+            ),
+        )
@@ -1,3 +1,8 @@
+from collections import defaultdict
+from typing import Self
+
+from pydantic.fields import PrivateAttr
+from pydantic.functional_validators import model_validator
 from pydantic.main import BaseModel
 
 from rfantasy_bingo_stats.models.defined_types import (
@@ -6,6 +11,7 @@ from rfantasy_bingo_stats.models.defined_types import (
     SortedDefaultdict,
     SortedSet,
 )
+from rfantasy_bingo_stats.models.ignored_matches import IgnoredMatches
 
 
 class RecordedIgnores(BaseModel):
@@ -13,3 +19,35 @@ class RecordedIgnores(BaseModel):
 
     ignored_author_dupes: SortedDefaultdict[Author, SortedSet[Author]]
     ignored_book_dupes: SortedDefaultdict[Book, SortedSet[Book]]
+    _author_ignores: IgnoredMatches[Author] = PrivateAttr()
+    _book_ignores: IgnoredMatches[Book] = PrivateAttr()
+
+    @model_validator(mode="after")
+    def wrap_ignores(self) -> Self:
+        """Wrap the ignores once they are final"""
+        self._author_ignores = IgnoredMatches(self.ignored_author_dupes)
+        self._book_ignores = IgnoredMatches(self.ignored_book_dupes)
+        return self
+
+    @classmethod
+    def from_validated(
+        cls,
+        ignored_author_dupes: defaultdict[Author, set[Author]],
+        ignored_book_dupes: defaultdict[Book, set[Book]],
+    ) -> "RecordedIgnores":
+        """Skip validation of ignores that were validated before they were saved"""
+        recorded_ignores = cls.model_construct(
+            ignored_author_dupes=ignored_author_dupes,
+            ignored_book_dupes=ignored_book_dupes,
+        )
+        recorded_ignores._author_ignores = IgnoredMatches(ignored_author_dupes)
+        recorded_ignores._book_ignores = IgnoredMatches(ignored_book_dupes)
+        return recorded_ignores
+
+    @property
+    def author_ignores(self) -> IgnoredMatches[Author]:
+        return self._author_ignores
+
+    @property
+    def book_ignores(self) -> IgnoredMatches[Book]:
+        return self._book_ignores
@@ -1,11 +1,11 @@
 from collections import defaultdict
-from types import MappingProxyType as MAP
 from typing import (
-    AbstractSet,
     Mapping,
     Self,
+    Sequence,
 )
 
+from pydantic.fields import PrivateAttr
 from pydantic.functional_validators import (
     field_validator,
     model_validator,
@@ -18,7 +18,6 @@ from rfantasy_bingo_stats.data_operations.author_title_book_operations import (
     title_author_to_book,
 )
 from rfantasy_bingo_stats.logger import LOGGER
-from rfantasy_bingo_stats.match_books.process_match import find_existing_match
 from rfantasy_bingo_stats.models.defined_types import (
     Author,
     Book,
@@ -26,7 +25,8 @@ from rfantasy_bingo_stats.models.defined_types import (
     SortedDefaultdict,
     SortedSet,
 )
-from rfantasy_bingo_stats.models.match_choice import MatchChoice
+from rfantasy_bingo_stats.models.disjoint_set import DisjointSet
+from rfantasy_bingo_stats.models.dupe_groups import DupeGroups
 
 
 class RecordedDupes(BaseModel):
@@ -36,6 +36,8 @@ class RecordedDupes(BaseModel):
     book_dupes: SortedDefaultdict[Book, SortedSet[Book]]
     # Specifically for deserialization checks if the separator needs to change
     title_author_separator: str = TITLE_AUTHOR_SEPARATOR
+    _author_groups: DupeGroups[Author] = PrivateAttr()
+    _book_groups: DupeGroups[Book] = PrivateAttr()
 
     @field_validator("author_dupes", "book_dupes")
     @classmethod
@@ -71,25 +73,40 @@ class RecordedDupes(BaseModel):
 
         return self
 
+    @model_validator(mode="after")
+    def index_dupes(self) -> Self:
+        """Build the reverse indexes once the duplicates are final"""
+        self._author_groups = DupeGroups(self.author_dupes)
+        self._book_groups = DupeGroups(self.book_dupes)
+        return self
+
+    @classmethod
+    def from_validated(
+        cls,
+        author_dupes: defaultdict[Author, set[Author]],
+        book_dupes: defaultdict[Book, set[Book]],
+    ) -> "RecordedDupes":
+        """Skip validation of duplicates that were validated before they were saved"""
+        recorded_dupes = cls.model_construct(author_dupes=author_dupes, book_dupes=book_dupes)
+        recorded_dupes._author_groups = DupeGroups(author_dupes)
+        recorded_dupes._book_groups = DupeGroups(book_dupes)
+        return recorded_dupes
+
+    @property
+    def author_groups(self) -> DupeGroups[Author]:
+        return self._author_groups
+
+    @property
+    def book_groups(self) -> DupeGroups[Book]:
+        return self._book_groups
+
     def get_book_dedupe_map(self) -> Mapping[Book, Book]:
         """Reverse the book dupes to get bad values as keys"""
-        return MAP(
-            {
-                dedupe_book: primary_book
-                for primary_book, dedupe_books in self.book_dupes.items()
-                for dedupe_book in dedupe_books
-            }
-        )
+        return self.book_groups.get_dedupe_map()
 
     def get_author_dedupe_map(self) -> Mapping[Author, Author]:
         """Reverse the author dupes to get bad values as keys"""
-        return MAP(
-            {
-                dedupe_author: primary_author
-                for primary_author, dedupe_authors in self.author_dupes.items()
-                for dedupe_author in dedupe_authors
-            }
-        )
+        return self.author_groups.get_dedupe_map()
 
 
 def convert_title_author_separator(book: Book, old_separator: str) -> Book:
@@ -104,90 +121,44 @@ def convert_title_author_separator(book: Book, old_separator: str) -> Book:
 
 def handle_overlaps(dupes: defaultdict[BookOrAuthor, set[BookOrAuthor]]) -> None:
     """Handle overlapping duplicate key/val and val/val pairs"""
-    # Check for key/value overlaps
-    overlapping_dedupes = set(dupes.keys()) & set().union(*dupes.values())
-    while len(overlapping_dedupes) > 0:
-        unify_key_value_overlaps(dupes, overlapping_dedupes)
-        overlapping_dedupes = set(dupes.keys()) & set().union(*dupes.values())
-
-    # Check for value/value overlaps
-    all_overlaps = get_all_value_overlaps(dupes)
-    while len(all_overlaps) > 0:
-        unify_overlapped_values(dupes, all_overlaps)
-        all_overlaps = get_all_value_overlaps(dupes)
-
-
-def get_all_value_overlaps(
-    dupes: Mapping[BookOrAuthor, AbstractSet[BookOrAuthor]],
-) -> Mapping[tuple[BookOrAuthor, BookOrAuthor], AbstractSet[BookOrAuthor]]:
-    """Get overlaps in value fields"""
-    all_overlaps = {}
-    for dupe_key_num, (dupe_key_1, dupe_vals_1) in enumerate(tuple(dupes.items())):
-        for dupe_key_2, dupe_vals_2 in tuple(dupes.items())[dupe_key_num + 1 :]:
-            overlaps = dupe_vals_1 & dupe_vals_2
-            if len(overlaps) > 0:
-                all_overlaps[(dupe_key_1, dupe_key_2)] = overlaps
-
-    return MAP(all_overlaps)
-
-
-def unify_overlapped_values(
-    dupes: defaultdict[BookOrAuthor, set[BookOrAuthor]],
-    all_overlaps: Mapping[tuple[BookOrAuthor, BookOrAuthor], AbstractSet[BookOrAuthor]],
-) -> None:
-    """Unify books that are duplicated as values"""
-    for (dupe_key_1, dupe_key_2), overlaps in all_overlaps.items():
-        choice_str = [f"{overlaps} are saved as duplicates for both {dupe_key_1} and {dupe_key_2}"]
-
-        choice_str.append("Choose the best version:")
-        choice_str.append(f"[{MatchChoice.MATCH.value}] {dupe_key_1}")
-        choice_str.append(f"[{MatchChoice.NEW.value}] {dupe_key_2}")
-        choice_str.append("Selection: ")
-        choice = MatchChoice(int(input("\n".join(choice_str))))
-
-        if choice == MatchChoice.MATCH:
-            best = dupe_key_1
-            remove = dupe_key_2
-        else:
-            best = dupe_key_1
-            remove = dupe_key_2
-
-        dupes[best] |= dupes[remove]
-        LOGGER.info(f"Duplicates of {remove} swapped to duplicates of {best}")
-        dupes[best].add(remove)
-        LOGGER.info(f"{remove} recorded as duplicate of {best}")
-        del dupes[remove]
-
-
-def unify_key_value_overlaps(
+    groups: DisjointSet[BookOrAuthor] = DisjointSet()
+    for dupe_key, dupe_vals in dupes.items():
+        # A key recorded as its own duplicate needs no decision
+        dupe_vals.discard(dupe_key)
+        groups.add(dupe_key)
+        for dupe_val in dupe_vals:
+            groups.union(dupe_key, dupe_val)
+
+    keys_by_group: defaultdict[BookOrAuthor, list[BookOrAuthor]] = defaultdict(list)
+    for dupe_key in dupes:
+        keys_by_group[groups.find(dupe_key)].append(dupe_key)
+
+    # Only groups that ended up with more than one key need a decision
+    for overlapping_keys in keys_by_group.values():
+        if len(overlapping_keys) > 1:
+            unify_overlapping_keys(dupes, sorted(overlapping_keys))
+
+
+def unify_overlapping_keys(
     dupes: defaultdict[BookOrAuthor, set[BookOrAuthor]],
-    overlapping_dedupes: set[BookOrAuthor],
+    overlapping_keys: Sequence[BookOrAuthor],
 ) -> None:
-    """Unify books that are duplicated as keys and values"""
-    for overlap in overlapping_dedupes:
-        existing_match_key = find_existing_match(dupes, overlap)
-        if overlap == existing_match_key:
-            dupes[existing_match_key].remove(overlap)
-        else:
-            choice_str = [
-                f"{overlap} is a corrected version and a duplicate for {existing_match_key}"
-            ]
-
-            choice_str.append("Choose the best version:")
-            choice_str.append(f"[{MatchChoice.MATCH.value}] {existing_match_key}")
-            choice_str.append(f"[{MatchChoice.NEW.value}] {overlap}")
-            choice_str.append("Selection: ")
-            choice = MatchChoice(int(input("\n".join(choice_str))))
-
-            if choice == MatchChoice.MATCH:
-                best = existing_match_key
-                remove = overlap
-            else:
-                best = overlap
-                remove = existing_match_key
-
+    """Unify keys that share duplicates, or are duplicates of each other"""
+    choice_str = [
+        f"{', '.join(overlapping_keys)} are all saved as corrected versions of the same item"
+    ]
+
+    choice_str.append("Choose the best version:")
+    for choice_num, dupe_key in enumerate(overlapping_keys):
+        choice_str.append(f"[{choice_num}] {dupe_key}")
+    choice_str.append("Selection: ")
+    best = overlapping_keys[int(input("\n".join(choice_str)))]
+
+    for remove in overlapping_keys:
+        if remove != best:
             dupes[best] |= dupes[remove]
             LOGGER.info(f"Duplicates of {remove} swapped to duplicates of {best}")
             dupes[best].add(remove)
             LOGGER.info(f"{remove} recorded as duplicate of {best}")
             del dupes[remove]
+    dupes[best].discard(best)
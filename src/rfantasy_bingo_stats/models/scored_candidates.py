@@ -0,0 +1,12 @@
+from typing import Mapping
+
+from pydantic.main import BaseModel
+
+
+class ScoredCandidates(BaseModel):
+    """Fuzzy matches scored ahead of interactive review, ranked best first"""
+
+    scorer_version: int
+    match_score: int
+    pool_digest: str
+    candidates: Mapping[str, tuple[tuple[str, int], ...]]
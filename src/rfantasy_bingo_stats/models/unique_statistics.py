@@ -6,6 +6,7 @@ from rfantasy_bingo_stats.models.defined_types import (
     Author,
     Book,
     SortedCounter,
+    merge_counters,
 )
 
 
@@ -14,3 +15,10 @@ class UniqueStatistics(BaseModel):
 
     unique_books: SortedCounter[Book] = Counter()
     unique_authors: SortedCounter[Author] = Counter()
+
+    def merge(self, other: "UniqueStatistics") -> "UniqueStatistics":
+        """Combine with the statistics of later cards"""
+        return UniqueStatistics(
+            unique_books=merge_counters(self.unique_books, other.unique_books),
+            unique_authors=merge_counters(self.unique_authors, other.unique_authors),
+        )
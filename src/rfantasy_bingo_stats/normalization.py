@@ -1,11 +1,17 @@
 from collections.abc import Mapping
-from typing import AbstractSet
+from typing import (
+    AbstractSet,
+    Optional,
+)
 
 from rfantasy_bingo_stats.constants import (
     AUTHOR_INFO_FILEPATH,
     BOOK_INFO_FILEPATH,
-    DUPE_RECORD_FILEPATH,
+    STATE_DB_FILEPATH,
 )
+from rfantasy_bingo_stats.data_operations.decision_journal import compact_journal
+from rfantasy_bingo_stats.data_operations.model_cache import load_validated
+from rfantasy_bingo_stats.data_operations.state_store import StateStore
 from rfantasy_bingo_stats.data_operations.update_data import comma_separate_authors
 from rfantasy_bingo_stats.logger import LOGGER
 from rfantasy_bingo_stats.match_books.get_matches import get_possible_matches
@@ -32,6 +38,8 @@ def normalize_authors(
     recorded_dupes: RecordedDupes,
     recorded_ignores: RecordedIgnores,
     skip_authors: bool,
+    max_edits: Optional[int],
+    auto_accept_score: Optional[int],
 ) -> None:
     """Normalize book titles and authors"""
 
@@ -50,6 +58,9 @@ def normalize_authors(
             recorded_dupes,
             recorded_ignores,
             "Author",
+            False,
+            max_edits,
+            auto_accept_score,
         )
 
     comma_separate_authors(recorded_dupes)
@@ -58,7 +69,7 @@ def normalize_authors(
         unique_single_authors = frozenset(
             {
                 Author(single_author)
-                for author in recorded_dupes.author_dupes.keys()
+                for author in recorded_dupes.author_groups.canonicals()
                 for single_author in author.split(", ")
             }
         )
@@ -70,24 +81,25 @@ def normalize_authors(
             recorded_dupes,
             recorded_ignores,
             "Author",
+            False,
+            max_edits,
+            auto_accept_score,
         )
 
+    author_groups = recorded_dupes.author_groups
     author_dedupe_map = recorded_dupes.get_author_dedupe_map()
 
     # Correct multi-author groups
-    for author in tuple(recorded_dupes.author_dupes.keys()):
+    for author in tuple(author_groups.canonicals()):
         final_author = author
         for single_author in author.split(", "):
             single_author = Author(single_author)
             updated_single_author = author_dedupe_map.get(single_author, single_author)
             final_author = Author(final_author.replace(single_author, updated_single_author))
         if final_author != author:
-            recorded_dupes.author_dupes[final_author] |= recorded_dupes.author_dupes[author]
-            recorded_dupes.author_dupes[final_author].add(author)
-            del recorded_dupes.author_dupes[author]
+            author_groups.merge_canonical(author, final_author)
 
-    with DUPE_RECORD_FILEPATH.open("w", encoding="utf8") as dupe_file:
-        dupe_file.write(recorded_dupes.model_dump_json(indent=2))
+    compact_journal(recorded_dupes, recorded_ignores)
 
 
 def normalize_books(
@@ -96,6 +108,8 @@ def normalize_books(
     rescan_non_dupes: bool,
     recorded_dupes: RecordedDupes,
     recorded_ignores: RecordedIgnores,
+    block_by_author: bool,
+    auto_accept_score: Optional[int],
 ) -> None:
 
     LOGGER.info(
@@ -112,39 +126,66 @@ def normalize_books(
         recorded_dupes,
         recorded_ignores,
         "Book",
+        block_by_author,
+        None,
+        auto_accept_score,
     )
 
+    compact_journal(recorded_dupes, recorded_ignores)
+
 
 def update_author_info_map(recorded_duplicates: RecordedDupes) -> Mapping[Author, AuthorInfo]:
     """If an author in the current info map has been corrected, swap the info key"""
-    with AUTHOR_INFO_FILEPATH.open("r", encoding="utf8") as author_info_file:
-        author_data = AuthorInfoAdapter.validate_json(author_info_file.read())
+    state_store = StateStore(STATE_DB_FILEPATH) if STATE_DB_FILEPATH.exists() else None
+    if state_store is None:
+        old_author_data = load_validated(
+            AUTHOR_INFO_FILEPATH, "AuthorInfoAdapter", AuthorInfoAdapter.validate_json
+        )
+    else:
+        old_author_data = state_store.load_author_info()
 
-    # Correct author info keys as necessary
+    # Correct author info keys as necessary, leaving the records alone if none need it
     author_dedupe_map = recorded_duplicates.get_author_dedupe_map()
+    if old_author_data.keys().isdisjoint(author_dedupe_map):
+        return old_author_data
     author_data = {
         author_dedupe_map.get(author, author): author_info
-        for author, author_info in author_data.items()
+        for author, author_info in old_author_data.items()
     }
 
-    with AUTHOR_INFO_FILEPATH.open("w", encoding="utf8") as author_info_file:
-        author_info_file.write(AuthorInfoAdapter.dump_json(author_data, indent=2).decode("utf8"))
+    if state_store is None:
+        with AUTHOR_INFO_FILEPATH.open("w", encoding="utf8") as author_info_file:
+            author_info_file.write(
+                AuthorInfoAdapter.dump_json(author_data, indent=2).decode("utf8")
+            )
+    else:
+        state_store.update_info("author_info", old_author_data, author_data)
 
     return author_data
 
 
 def update_book_info_map(recorded_duplicates: RecordedDupes) -> Mapping[Book, BookInfo]:
     """If a book in the current info map has been corrected, swap the info key"""
-    with BOOK_INFO_FILEPATH.open("r", encoding="utf8") as book_info_file:
-        book_data = BookInfoAdapter.validate_json(book_info_file.read())
+    state_store = StateStore(STATE_DB_FILEPATH) if STATE_DB_FILEPATH.exists() else None
+    if state_store is None:
+        old_book_data = load_validated(
+            BOOK_INFO_FILEPATH, "BookInfoAdapter", BookInfoAdapter.validate_json
+        )
+    else:
+        old_book_data = state_store.load_book_info()
 
-    # Correct author info keys as necessary
+    # Correct book info keys as necessary, leaving the records alone if none need it
     book_dedupe_map = recorded_duplicates.get_book_dedupe_map()
+    if old_book_data.keys().isdisjoint(book_dedupe_map):
+        return old_book_data
     book_data = {
-        book_dedupe_map.get(book, book): book_info for book, book_info in book_data.items()
+        book_dedupe_map.get(book, book): book_info for book, book_info in old_book_data.items()
     }
 
-    with BOOK_INFO_FILEPATH.open("w", encoding="utf8") as book_info_file:
-        book_info_file.write(BookInfoAdapter.dump_json(book_data, indent=2).decode("utf8"))
+    if state_store is None:
+        with BOOK_INFO_FILEPATH.open("w", encoding="utf8") as book_info_file:
+            book_info_file.write(BookInfoAdapter.dump_json(book_data, indent=2).decode("utf8"))
+    else:
+        state_store.update_info("book_info", old_book_data, book_data)
 
     return book_data
@@ -130,6 +130,8 @@ def poll_main(args: Args, poll_args: PollArgs) -> None:
             recorded_duplicates,
             recorded_ignores,
             args.skip_authors,
+            args.author_max_edits,
+            args.auto_accept_score,
         )
         LOGGER.info("Updating vote authors.")
         updated_votes = update_poll_authors(
@@ -147,6 +149,8 @@ def poll_main(args: Args, poll_args: PollArgs) -> None:
             args.rescan_keys,
             recorded_duplicates,
             recorded_ignores,
+            args.block_books_by_author,
+            args.auto_accept_score,
         )
 
         LOGGER.info("Updating vote books.")
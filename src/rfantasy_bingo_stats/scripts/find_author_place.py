@@ -1,52 +1,60 @@
 import argparse
 from datetime import date
 
-import numpy as np
-
 from rfantasy_bingo_stats.constants import BingoYearDataPaths
+from rfantasy_bingo_stats.data_operations.model_cache import load_validated
 from rfantasy_bingo_stats.models.bingo_statistics import BingoStatistics
 from rfantasy_bingo_stats.models.defined_types import Author
-from rfantasy_bingo_stats.scripts.utils import calc_percentiles
+from rfantasy_bingo_stats.scripts.utils import (
+    Rank,
+    RankIndex,
+)
+
+
+def format_rank(rank: Rank[Author]) -> str:
+    """Describe where an author places"""
+    return (
+        f"{rank.value}: Place {rank.place} | Read count {rank.count} |"
+        + f" Percentile by count {rank.count_percentile:.1f} | Percentile by total place {rank.place_percentile:.1f}"
+    )
 
 
 def main(args: argparse.Namespace) -> None:
-    with BingoYearDataPaths(args.year).output_stats.open("r", encoding="utf8") as stats_file:
-        bingo_stats = BingoStatistics.model_validate_json(stats_file.read())
-
-    percentiles = {
-        author: percentile
-        for percentile, author in calc_percentiles(
-            bingo_stats.overall_uniques.unique_authors,
-            np.arange(0, 100, 100 / (len(bingo_stats.overall_uniques.unique_authors) * 10)),
-        )
-    }
-
-    place = 0
-    last_count = -1
-    for total_place, (author, count) in enumerate(
-        bingo_stats.overall_uniques.unique_authors.most_common()
-    ):
-        if count != last_count:
-            place += 1
-            last_count = count
-
-        if author == args.author:
-            print(  # noqa: T201
-                f" \t -----> {author}: Place {place} | Read count {count} |"
-                + f" Percentile by count {percentiles[author]:.1f} | Percentile by total place {100*total_place/len(bingo_stats.overall_uniques.unique_authors):.1f} <-----"
-            )
+    bingo_stats = load_validated(
+        BingoYearDataPaths(args.year).output_stats,
+        "BingoStatistics",
+        BingoStatistics.model_validate_json,
+    )
+    rank_index = RankIndex(bingo_stats.overall_uniques.unique_authors)
+
+    if args.full_list:
+        authors = set(args.authors)
+        for position in range(len(rank_index)):
+            rank = rank_index.get_rank_at(position)
+            if rank.value in authors:
+                print(f" \t -----> {format_rank(rank)} <-----")  # noqa: T201
+            else:
+                print(format_rank(rank))  # noqa: T201
+        return
+
+    for author in args.authors:
+        author_rank = rank_index.get_rank(author)
+        if author_rank is None:
+            print(f"{author}: Not read in {args.year}")  # noqa: T201
         else:
-            print(  # noqa: T201
-                f"{author}: Place {place} | Read count {count} |"
-                + f" Percentile {percentiles[author]:.1f} | Percentile by total place {100*total_place/len(bingo_stats.overall_uniques.unique_authors):.1f}"
-            )
+            print(format_rank(author_rank))  # noqa: T201
 
 
 def cli() -> None:
     parser = argparse.ArgumentParser()
 
-    parser.add_argument("author", type=Author)
+    parser.add_argument("authors", type=Author, nargs="+")
     parser.add_argument("--year", type=int, default=date.today().year - 1)
+    parser.add_argument(
+        "--full-list",
+        action="store_true",
+        help="Print every author in order, highlighting the ones asked for",
+    )
 
     args = parser.parse_args()
     main(args)
@@ -1,23 +1,45 @@
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
+from math import ceil
+from pathlib import Path
 
-from rfantasy_bingo_stats.calculate_statistics.get_bingo_cards import get_bingo_cards
 from rfantasy_bingo_stats.calculate_statistics.stats_format_utils import format_book
 from rfantasy_bingo_stats.constants import BingoYearDataPaths
-from rfantasy_bingo_stats.data_operations.author_title_book_operations import title_author_to_book
-from rfantasy_bingo_stats.data_operations.get_data import (
-    get_bingo_dataframe,
-    get_existing_states,
+from rfantasy_bingo_stats.data_operations.card_index import (
+    get_card_summaries,
+    read_card_summaries,
+    read_card_summary,
+    write_card_index,
 )
+from rfantasy_bingo_stats.logger import LOGGER
 from rfantasy_bingo_stats.models.bingo_statistics import BingoStatistics
 from rfantasy_bingo_stats.models.card_data import CardData
+from rfantasy_bingo_stats.models.card_summary import (
+    CardReport,
+    CardSummary,
+)
 from rfantasy_bingo_stats.models.defined_types import CardID
 
 
-def main(args: argparse.Namespace) -> None:
-    year_data_paths = BingoYearDataPaths(args.year)
-    with year_data_paths.output_stats.open("r", encoding="utf8") as stats_file:
-        bingo_stats = BingoStatistics.model_validate_json(stats_file.read())
+def build_card_index(year_data_paths: BingoYearDataPaths) -> None:
+    """Summarize every card from the year's statistics, for years run before cards were indexed"""
+    # Only needed to build the index, and slow to import compared to reading a card from it
+    # pylint: disable-next=import-outside-toplevel
+    from rfantasy_bingo_stats.calculate_statistics.get_bingo_cards import get_bingo_cards
+
+    # pylint: disable-next=import-outside-toplevel
+    from rfantasy_bingo_stats.data_operations.get_data import (
+        get_bingo_dataframe,
+        get_existing_states,
+    )
+
+    # pylint: disable-next=import-outside-toplevel
+    from rfantasy_bingo_stats.data_operations.model_cache import load_validated
+
+    bingo_stats = load_validated(
+        year_data_paths.output_stats, "BingoStatistics", BingoStatistics.model_validate_json
+    )
 
     with year_data_paths.card_info.open("r", encoding="utf8") as card_data_file:
         card_data = CardData.model_validate_json(card_data_file.read())
@@ -28,35 +50,56 @@ def main(args: argparse.Namespace) -> None:
 
     cards = get_bingo_cards(bingo_data, card_data)
 
-    book_dedupe_map = recorded_duplicates.get_book_dedupe_map()
+    write_card_index(
+        get_card_summaries(cards, bingo_stats, recorded_duplicates.get_book_dedupe_map()),
+        year_data_paths.card_index,
+        year_data_paths.card_index_offsets,
+    )
+
+
+def update_card_index(year_data_paths: BingoYearDataPaths) -> None:
+    """Build the year's card index if it is missing or older than the statistics"""
+    if (
+        not year_data_paths.card_index_offsets.exists()
+        or year_data_paths.card_index_offsets.stat().st_mtime
+        < year_data_paths.output_stats.stat().st_mtime
+    ):
+        LOGGER.info("Indexing cards.")
+        build_card_index(year_data_paths)
+
+
+def get_card_summary(year_data_paths: BingoYearDataPaths, card_id: CardID) -> CardSummary:
+    """Read a card from the year's card index"""
+    update_card_index(year_data_paths)
+    return read_card_summary(
+        card_id, year_data_paths.card_index, year_data_paths.card_index_offsets
+    )
+
 
-    card_to_process = cards[args.card_id]
+def format_card_report(card_summary: CardSummary) -> str:
+    """Describe which books on a card nobody else read, and how often the rest were read"""
     overall_uniques = []
     square_uniques = []
     nonuniques = []
-    for square_name, square in card_to_process.squares.items():
-        if square is not None:
-            book = title_author_to_book((square.title, square.author))
-            if book in book_dedupe_map.keys():
-                book = book_dedupe_map[book]
-
-            total_uses = bingo_stats.overall_uniques.unique_books[book]
-            square_uses = bingo_stats.square_uniques[square_name].unique_books[book]
-            if total_uses == 1:
-                overall_uniques.append(f"- {format_book(book)}, for {square_name}")
-            elif square_uses == 1:
-                square_uniques.append(f"- {format_book(book)}, for {square_name}")
-            else:
-                nonuniques.append(
-                    f"- {format_book(book)} was used {total_uses} times total, {square_uses} times for the {square_name} square"
-                )
+    for square_book in card_summary.square_books:
+        book = square_book.book
+        square_name = square_book.square_name
+        total_uses = square_book.total_uses
+        square_uses = square_book.square_uses
+        if total_uses == 1:
+            overall_uniques.append(f"- {format_book(book)}, for {square_name}")
+        elif square_uses == 1:
+            square_uniques.append(f"- {format_book(book)}, for {square_name}")
+        else:
+            nonuniques.append(
+                f"- {format_book(book)} was used {total_uses} times total, {square_uses} times for the {square_name} square"
+            )
 
     formatted_overall_uniques = "\n".join(overall_uniques)
     formatted_square_uniques = "\n".join(square_uniques)
     formatted_nonuniques = "\n".join(nonuniques)
 
-    print(  # noqa: T201
-        f"""
+    return f"""
 Your card had {len(overall_uniques)} unique books:
 
 {formatted_overall_uniques}
@@ -69,7 +112,55 @@ For the remaining books:
 
 {formatted_nonuniques}
 """
-    )
+
+
+def write_card_reports(
+    year_data_paths: BingoYearDataPaths,
+    reports_filepath: Path,
+    workers: int = 1,
+) -> None:
+    """
+    Write the report of every card in the year as JSONL, in card order
+
+    With more than one worker, the cards are split into a batch per worker process.
+    """
+    update_card_index(year_data_paths)
+    card_summaries = list(read_card_summaries(year_data_paths.card_index))
+
+    if workers <= 1 or len(card_summaries) <= 1:
+        reports = [format_card_report(card_summary) for card_summary in card_summaries]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            reports = list(
+                executor.map(
+                    format_card_report,
+                    card_summaries,
+                    chunksize=ceil(len(card_summaries) / workers),
+                )
+            )
+
+    with reports_filepath.open("w", encoding="utf8") as reports_file:
+        for card_summary, report in zip(card_summaries, reports):
+            card_report = CardReport(card_id=card_summary.card_id, report=report)
+            reports_file.write(card_report.model_dump_json() + "\n")
+
+
+def positive_int(value: str) -> int:
+    """Parse a command line argument that must be a positive integer"""
+    parsed = int(value)
+    if parsed < 1:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive integer")
+    return parsed
+
+
+def main(args: argparse.Namespace) -> None:
+    year_data_paths = BingoYearDataPaths(args.year)
+    if args.all_cards is not None:
+        write_card_reports(year_data_paths, args.all_cards, args.workers)
+        return
+
+    card_summary = get_card_summary(year_data_paths, args.card_id)
+    print(format_card_report(card_summary))  # noqa: T201
 
 
 def cli() -> None:
@@ -77,6 +168,18 @@ def cli() -> None:
 
     parser.add_argument("--card-id", type=CardID, default="1")
     parser.add_argument("--year", type=int, default=date.today().year - 1)
+    parser.add_argument(
+        "--all-cards",
+        type=Path,
+        default=None,
+        help="Write the report of every card to this JSONL file, instead of printing one card",
+    )
+    parser.add_argument(
+        "--workers",
+        type=positive_int,
+        default=1,
+        help="Processes to render the reports of every card in",
+    )
 
     args = parser.parse_args()
     main(args)
@@ -6,8 +6,12 @@ from typing import Optional
 import pandas
 import requests
 
-from rfantasy_bingo_stats.constants import AUTHOR_INFO_FILEPATH
+from rfantasy_bingo_stats.constants import (
+    AUTHOR_INFO_FILEPATH,
+    STATE_DB_FILEPATH,
+)
 from rfantasy_bingo_stats.data_operations.get_data import get_existing_states
+from rfantasy_bingo_stats.data_operations.state_store import StateStore
 from rfantasy_bingo_stats.models.author_info import (
     AuthorInfo,
     AuthorInfoAdapter,
@@ -54,6 +58,8 @@ def main(_: argparse.Namespace) -> None:
         recorded_dupes=recorded_dupes,
         recorded_ignores=recorded_ignores,
         skip_authors=False,
+        max_edits=None,
+        auto_accept_score=None,
     )
     author_dedupe_map = recorded_dupes.get_author_dedupe_map()
 
@@ -84,6 +90,10 @@ def main(_: argparse.Namespace) -> None:
         author_info_file.write(
             AuthorInfoAdapter.dump_json(final_book_data, indent=2).decode("utf8")
         )
+    # The store is exported over the JSON records, so it needs the new data as well
+    if STATE_DB_FILEPATH.exists():
+        state_store = StateStore(STATE_DB_FILEPATH)
+        state_store.update_info("author_info", state_store.load_author_info(), final_book_data)
 
     pandas.DataFrame.from_dict(
         dict(
@@ -1,8 +1,12 @@
 import argparse
 from collections import defaultdict
 
-from rfantasy_bingo_stats.constants import BOOK_INFO_FILEPATH
+from rfantasy_bingo_stats.constants import (
+    BOOK_INFO_FILEPATH,
+    STATE_DB_FILEPATH,
+)
 from rfantasy_bingo_stats.data_operations.get_data import get_existing_states
+from rfantasy_bingo_stats.data_operations.state_store import StateStore
 from rfantasy_bingo_stats.models.book_info import (
     BookInfo,
     BookInfoAdapter,
@@ -27,6 +31,10 @@ def main(_: argparse.Namespace) -> None:
 
     with BOOK_INFO_FILEPATH.open("w", encoding="utf8") as book_info_file:
         book_info_file.write(BookInfoAdapter.dump_json(final_book_data, indent=2).decode("utf8"))
+    # The store is exported over the JSON records, so it needs the new data as well
+    if STATE_DB_FILEPATH.exists():
+        state_store = StateStore(STATE_DB_FILEPATH)
+        state_store.update_info("book_info", state_store.load_book_info(), final_book_data)
 
 
 def cli() -> None:
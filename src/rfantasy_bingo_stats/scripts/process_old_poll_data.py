@@ -47,6 +47,8 @@ def main(_: argparse.Namespace) -> None:
         recorded_dupes=recorded_dupes,
         recorded_ignores=recorded_ignores,
         skip_authors=False,
+        max_edits=None,
+        auto_accept_score=None,
     )
 
     update_author_info_map(recorded_dupes)
@@ -70,6 +72,8 @@ def main(_: argparse.Namespace) -> None:
         rescan_non_dupes=False,
         recorded_dupes=recorded_dupes,
         recorded_ignores=recorded_ignores,
+        block_by_author=False,
+        auto_accept_score=None,
     )
 
     book_dedupe_map = recorded_dupes.get_book_dedupe_map()
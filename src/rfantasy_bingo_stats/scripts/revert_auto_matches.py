@@ -0,0 +1,63 @@
+import argparse
+from datetime import datetime
+
+from rfantasy_bingo_stats.constants import AUTO_MATCH_LOG_FILEPATH
+from rfantasy_bingo_stats.data_operations.decision_journal import compact_journal
+from rfantasy_bingo_stats.data_operations.get_data import get_existing_states
+from rfantasy_bingo_stats.match_books.auto_accept import (
+    get_unreverted_matches,
+    read_auto_matches,
+    revert_auto_match,
+)
+
+
+def main(args: argparse.Namespace) -> None:
+    unreverted = get_unreverted_matches(read_auto_matches(AUTO_MATCH_LOG_FILEPATH))
+
+    if args.since is None and len(args.match) == 0:
+        for record in unreverted:
+            print(  # noqa: T201
+                f"{record.timestamp:%Y-%m-%d %H:%M:%S} | {record.match_type} | {record.score} |"
+                + f" {record.dupe} -> {record.canonical}"
+            )
+        return
+
+    to_revert = tuple(
+        record
+        for record in unreverted
+        if (args.since is not None and record.timestamp >= args.since)
+        or record.dupe in args.match
+        or record.canonical in args.match
+    )
+
+    recorded_duplicates, recorded_ignores = get_existing_states()
+    for record in to_revert:
+        revert_auto_match(record, recorded_duplicates, recorded_ignores, AUTO_MATCH_LOG_FILEPATH)
+
+    compact_journal(recorded_duplicates, recorded_ignores)
+
+
+def cli() -> None:
+    parser = argparse.ArgumentParser(
+        description="List automatic matches, or revert them. Pass no options to list."
+    )
+
+    parser.add_argument(
+        "--match",
+        action="append",
+        default=[],
+        help="Revert automatic matches involving this author or book. May be repeated.",
+    )
+    parser.add_argument(
+        "--since",
+        type=datetime.fromisoformat,
+        default=None,
+        help="Revert every automatic match made at or after this ISO timestamp",
+    )
+
+    args = parser.parse_args()
+    main(args)
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,33 @@
+import argparse
+
+from rfantasy_bingo_stats.constants import STATE_DB_FILEPATH
+from rfantasy_bingo_stats.data_operations.state_store import StateStore
+
+
+def main(args: argparse.Namespace) -> None:
+    state_store = StateStore(STATE_DB_FILEPATH)
+    if args.direction == "import":
+        state_store.import_json()
+    else:
+        state_store.export_json()
+
+
+def cli() -> None:
+    parser = argparse.ArgumentParser(
+        description="Copy the duplicate, ignore, author and book records"
+        + " between their JSON files and the SQLite state store."
+        + " Once imported, the store is used instead of the JSON files."
+    )
+
+    parser.add_argument(
+        "direction",
+        choices=("import", "export"),
+        help="`import` replaces the store with the JSON files, `export` the reverse",
+    )
+
+    args = parser.parse_args()
+    main(args)
+
+
+if __name__ == "__main__":
+    cli()
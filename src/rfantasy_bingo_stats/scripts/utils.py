@@ -1,34 +1,64 @@
 from collections import Counter
+from collections.abc import Hashable
+from dataclasses import dataclass
 from typing import (
-    Iterable,
+    Generic,
+    Optional,
     TypeVar,
 )
 
-T = TypeVar("T")
-
-
-def calc_percentiles(
-    cnts_dict: Counter[T],
-    percentiles_to_calc: Iterable[float] = range(101),
-) -> list[tuple[float, T]]:
-    """Returns [(percentile, value)] with nearest rank percentiles.
-    Percentile 0: <min_value>, 100: <max_value>.
-    cnts_dict: { <value>: <count> }
-    percentiles_to_calc: iterable for percentiles to calculate; 0 <= ~ <= 100
-    """
-    assert all(0 <= percentile <= 100 for percentile in percentiles_to_calc)
-    percentiles = []
-    num = sum(cnts_dict.values())
-    cnts = sorted(cnts_dict.items(), key=lambda x: -x[1])
-    curr_cnts_pos = 0  # current position in cnts
-    curr_pos = cnts[0][1]  # sum of freqs up to current_cnts_pos
-    for percentile in sorted(percentiles_to_calc):
-        if percentile < 100:
-            percentile_pos = percentile / 100.0 * num
-            while curr_pos <= percentile_pos and curr_cnts_pos < len(cnts):
-                curr_cnts_pos += 1
-                curr_pos += cnts[curr_cnts_pos][1]
-            percentiles.append((percentile, cnts[curr_cnts_pos][0]))
-        else:
-            percentiles.append((percentile, cnts[-1][0]))  # we could add a small value
-    return percentiles
+import numpy as np
+
+from rfantasy_bingo_stats.calculate_statistics.interned_cards import IntArray
+
+T = TypeVar("T", bound=Hashable)
+
+
+@dataclass(frozen=True)
+class Rank(Generic[T]):
+    """Where a value places among every counted value"""
+
+    value: T
+    count: int
+    # 1 for the most counted values, increasing by 1 for each smaller count
+    place: int
+    # Percentage of all counts that went to this value or to values ranked before it
+    count_percentile: float
+    # Percentage of values ranked before this one
+    place_percentile: float
+
+
+class RankIndex(Generic[T]):
+    """Counted values ranked by count, most first, with ties in order of first appearance"""
+
+    def __init__(self, counter: Counter[T]) -> None:
+        ranked = counter.most_common()
+        self.values = tuple(value for value, _ in ranked)
+        self.counts: IntArray = np.array([count for _, count in ranked], dtype=np.int64)
+        self.places: IntArray = np.cumsum(
+            np.diff(self.counts, prepend=self.counts[:1] + 1) != 0, dtype=np.int64
+        )
+        self.cumulative_counts: IntArray = np.cumsum(self.counts, dtype=np.int64)
+        self._positions = {value: position for position, value in enumerate(self.values)}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def get_rank(self, value: T) -> Optional[Rank[T]]:
+        """Get the rank of a value, if it was counted at all"""
+        position = self._positions.get(value)
+        if position is None:
+            return None
+        return self.get_rank_at(position)
+
+    def get_rank_at(self, position: int) -> Rank[T]:
+        """Get the rank of the value at a position in the ranking"""
+        return Rank(
+            value=self.values[position],
+            count=int(self.counts[position]),
+            place=int(self.places[position]),
+            count_percentile=float(
+                100 * self.cumulative_counts[position] / self.cumulative_counts[-1]
+            ),
+            place_percentile=100 * position / len(self.values),
+        )
@@ -0,0 +1,43 @@
+from rfantasy_bingo_stats.match_books.author_blocks import AuthorBlocks
+from rfantasy_bingo_stats.match_books.match_scorer import MatchScorer
+from rfantasy_bingo_stats.models.defined_types import (
+    Author,
+    Book,
+)
+
+BOOKS = frozenset(
+    {
+        Book("Dune /// Frank Herbert"),
+        Book("Dune /// Brian Herbert"),
+        Book("Mistborn /// Brandon Sanderson"),
+        Book("Mistborn /// Brandon Sandersen"),
+        Book("Mistborn /// B. Sanderson"),
+    }
+)
+AUTHOR_DEDUPE_MAP = {Author("B. Sanderson"): Author("Brandon Sanderson")}
+
+
+def test_blocks_follow_canonical_authors() -> None:
+    author_blocks = AuthorBlocks(BOOKS, AUTHOR_DEDUPE_MAP, 90)
+
+    assert author_blocks.get_block(Book("Mistborn /// B. Sanderson")) == Author(
+        "Brandon Sanderson"
+    )
+    # Near-author neighbours share candidates
+    assert author_blocks.get_candidates(Book("Mistborn /// Brandon Sandersen")) == {
+        Book("Mistborn /// Brandon Sanderson"),
+        Book("Mistborn /// Brandon Sandersen"),
+        Book("Mistborn /// B. Sanderson"),
+    }
+
+
+def test_blocked_scorer_skips_other_authors() -> None:
+    unblocked_scorer = MatchScorer(BOOKS, 85, None)
+    blocked_scorer = MatchScorer(BOOKS, 85, AuthorBlocks(BOOKS, AUTHOR_DEDUPE_MAP, 85))
+
+    dune = Book("Dune /// Frank Herbert")
+    assert Book("Dune /// Brian Herbert") in dict(unblocked_scorer.get_matches(dune))
+    assert Book("Dune /// Brian Herbert") not in dict(blocked_scorer.get_matches(dune))
+
+    blocked_scorer.add_choice(Book("Dune /// Frank Herbertt"))
+    assert Book("Dune /// Frank Herbertt") in dict(blocked_scorer.get_matches(dune))
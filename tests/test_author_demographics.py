@@ -0,0 +1,30 @@
+import numpy as np
+
+from rfantasy_bingo_stats.calculate_statistics.author_demographics import (
+    get_author_stats,
+    get_demographic_codes,
+)
+from rfantasy_bingo_stats.models.author_info import (
+    AuthorInfo,
+    Gender,
+    Nationality,
+)
+
+
+def test_demographics_counted_per_group() -> None:
+    codes = get_demographic_codes(
+        [
+            AuthorInfo(gender=Gender.W, queer=True, nationality=Nationality.CAN),
+            AuthorInfo(gender=Gender.M),
+        ]
+    )
+
+    author_stats = get_author_stats(
+        np.array([3, 1, 3, 3]), np.array([1, 0, 0, 1]), codes, counts=np.array([1, 2, 1, 4])
+    )
+
+    assert list(author_stats) == [3, 1]
+    assert list(author_stats[3].gender_count.items()) == [(Gender.M, 5), (Gender.W, 1)]
+    assert list(author_stats[3].queer_count.items()) == [(None, 5), (True, 1)]
+    assert author_stats[1].gender_count == {Gender.W: 2}
+    assert author_stats[1].nationality_count == {Nationality.CAN: 2}
@@ -0,0 +1,89 @@
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+
+from rfantasy_bingo_stats.match_books.auto_accept import (
+    get_unreverted_matches,
+    read_auto_matches,
+    record_auto_match,
+    revert_match,
+)
+from rfantasy_bingo_stats.match_books.process_match import get_auto_match
+from rfantasy_bingo_stats.models.auto_match_record import (
+    AutoMatchAction,
+    AutoMatchRecord,
+)
+from rfantasy_bingo_stats.models.defined_types import Author
+from rfantasy_bingo_stats.models.dupe_groups import DupeGroups
+from rfantasy_bingo_stats.models.ignored_matches import IgnoredMatches
+
+
+def test_auto_match_prefers_existing_canonical() -> None:
+    dupes = DupeGroups(defaultdict(set, {Author("Ursula K. Le Guin"): {Author("Ursula Le Guin")}}))
+    item = Author("ursula k le guin")
+
+    assert get_auto_match(
+        dupes,
+        item,
+        {item, Author("Ursula K. Le Guin")},
+        {Author("Ursula K. Le Guin")},
+        {Author("Ursula K. Le Guin"): 98},
+        95,
+    ) == (Author("Ursula K. Le Guin"), item)
+    # Below the threshold, or with several candidates, a human decides
+    assert (
+        get_auto_match(
+            dupes,
+            item,
+            {item, Author("Ursula K. Le Guin")},
+            {Author("Ursula K. Le Guin")},
+            {Author("Ursula K. Le Guin"): 94},
+            95,
+        )
+        is None
+    )
+    assert (
+        get_auto_match(
+            dupes,
+            item,
+            {item, Author("Ursula K. Le Guin"), Author("Ursula K Le Guin")},
+            {Author("Ursula K. Le Guin")},
+            {Author("Ursula K. Le Guin"): 98, Author("Ursula K Le Guin"): 98},
+            95,
+        )
+        is None
+    )
+
+
+def test_revert_auto_match(tmp_path: Path) -> None:
+    dupes = DupeGroups(
+        defaultdict(set, {Author("Naomi Novik"): {Author("naomi novik"), Author("Naomi Novak")}})
+    )
+    ignores: defaultdict[Author, set[Author]] = defaultdict(set)
+    all_matches_to_ignore = IgnoredMatches(ignores)
+
+    assert revert_match(dupes, all_matches_to_ignore, Author("Naomi Novak"), Author("Naomi Novik"))
+    assert not dupes.is_dupe(Author("Naomi Novak"))
+    assert dupes.get_canonical(Author("naomi novik")) == Author("Naomi Novik")
+    assert ignores == {
+        Author("Naomi Novik"): {Author("Naomi Novak")},
+        Author("Naomi Novak"): {Author("Naomi Novik")},
+    }
+    assert not revert_match(
+        dupes, all_matches_to_ignore, Author("Naomi Novak"), Author("Naomi Novik")
+    )
+
+    log_filepath = tmp_path / "auto_matches.jsonl"
+    record = AutoMatchRecord(
+        action=AutoMatchAction.ACCEPT,
+        match_type="Author",
+        dupe="Naomi Novak",
+        canonical="Naomi Novik",
+        score=96,
+        timestamp=datetime(2024, 1, 1),
+    )
+    record_auto_match(record, log_filepath)
+    assert get_unreverted_matches(read_auto_matches(log_filepath)) == (record,)
+
+    record_auto_match(record.model_copy(update={"action": AutoMatchAction.REVERT}), log_filepath)
+    assert get_unreverted_matches(read_auto_matches(log_filepath)) == ()
@@ -0,0 +1,183 @@
+import numpy as np
+import pandas
+
+from rfantasy_bingo_stats.calculate_statistics.get_bingo_cards import (
+    get_bingo_cards,
+    get_bingo_type_stats,
+    get_partial_bingo_stats,
+    resolve_bingo_stats,
+)
+from rfantasy_bingo_stats.models.author_info import AuthorInfo
+from rfantasy_bingo_stats.models.bingo_card import (
+    BingoCard,
+    BingoSquare,
+    ShortStorySquare,
+)
+from rfantasy_bingo_stats.models.card_data import CardData
+from rfantasy_bingo_stats.models.defined_types import (
+    Author,
+    BingoName,
+    Book,
+    CardID,
+    SquareName,
+    Title,
+)
+
+CARD_DATA = CardData.model_validate(
+    {
+        "sheet_name": "Sheet1",
+        "subbed_by_square": True,
+        "expected_unsubbable": 1,
+        "short_story_square_num": 2,
+        "square_names": {"SQUARE 1: TITLE": "Hidden Gem", "SQUARE 2: TITLE": "Short Stories"},
+        "novel_title_author_hm_cols": [
+            ["SQUARE 1: TITLE", "SQUARE 1: AUTHOR", "SQUARE 1: HARD MODE"],
+            ["SQUARE 2: TITLE", "SQUARE 2: AUTHOR", "SQUARE 2: HARD MODE"],
+        ],
+        "short_story_title_author_hm_cols": [
+            ["SQUARE 2A: TITLE", "SQUARE 2A: AUTHOR", ""],
+            ["SQUARE 2B: TITLE", "SQUARE 2B: AUTHOR", ""],
+        ],
+    }
+)
+
+
+def test_cards_built_from_columns() -> None:
+    data = pandas.DataFrame(
+        {
+            "CARD": ["1", "2", "3"],
+            "SQUARE 1: TITLE": ["Uprooted", None, "Piranesi"],
+            "SQUARE 1: AUTHOR": ["Naomi Novik", None, "Susanna Clarke"],
+            "SQUARE 1: HARD MODE": ["Yes", None, None],
+            "SQUARE 1: SUBSTITUTION": [None, "Book Club", "Book Club"],
+            "SQUARE 2: TITLE": [None, "Exhalation", None],
+            "SQUARE 2: AUTHOR": [None, "Ted Chiang", None],
+            "SQUARE 2: HARD MODE": [None, "Yes", None],
+            "SQUARE 2A: TITLE": ["Story of Your Life", None, "Bloodchild"],
+            "SQUARE 2A: AUTHOR": ["Ted Chiang", None, "Octavia E. Butler"],
+            "SQUARE 2B: TITLE": ["The Paper Menagerie", None, None],
+            "SQUARE 2B: AUTHOR": ["Ken Liu", None, None],
+        }
+    ).set_index("CARD")
+
+    cards = get_bingo_cards(data, CARD_DATA)
+
+    assert list(cards) == [CardID("1"), CardID("2"), CardID("3")]
+    assert dict(cards[CardID("1")].squares) == {
+        SquareName("Hidden Gem"): BingoSquare(
+            title=Title("Uprooted"), author=Author("Naomi Novik"), hard_mode=True
+        ),
+        SquareName("Short Stories"): ShortStorySquare(
+            title=Title(""),
+            author=Author(""),
+            hard_mode=False,
+            stories=(
+                (Title("Story of Your Life"), Author("Ted Chiang")),
+                (Title("The Paper Menagerie"), Author("Ken Liu")),
+            ),
+        ),
+    }
+    # Incomplete squares do not count as substituted
+    assert dict(cards[CardID("2")].squares) == {
+        SquareName("Book Club"): None,
+        SquareName("Short Stories"): BingoSquare(
+            title=Title("Exhalation"), author=Author("Ted Chiang"), hard_mode=True
+        ),
+    }
+    assert not cards[CardID("2")].subbed_square_map
+    assert dict(cards[CardID("3")].squares) == {
+        SquareName("Book Club"): BingoSquare(
+            title=Title("Piranesi"), author=Author("Susanna Clarke"), hard_mode=False
+        ),
+        SquareName("Short Stories"): None,
+    }
+    assert dict(cards[CardID("3")].subbed_square_map) == {
+        SquareName("Hidden Gem"): SquareName("Book Club")
+    }
+
+
+def test_bingo_types_counted() -> None:
+    completed = np.ones((3, 25), dtype=np.bool_)
+    # The second card is missing the centre square, the third the whole first column
+    completed[1, 12] = False
+    completed[2, :5] = False
+
+    bingo_type_stats = get_bingo_type_stats((CardID("1"), CardID("2"), CardID("3")), completed)
+
+    assert dict(bingo_type_stats.complete_bingos_by_card) == {
+        CardID("1"): 12,
+        CardID("2"): 8,
+        CardID("3"): 4,
+    }
+    assert list(bingo_type_stats.incomplete_bingos.items()) == [
+        (BingoName("Third Row"), 2),
+        (BingoName("Third Column"), 1),
+        (BingoName("Diagonal"), 2),
+        (BingoName("Antidiagonal"), 2),
+        (BingoName("First Row"), 1),
+        (BingoName("Second Row"), 1),
+        (BingoName("Fourth Row"), 1),
+        (BingoName("Fifth Row"), 1),
+        (BingoName("First Column"), 1),
+    ]
+    assert bingo_type_stats.incomplete_squares_by_bingo[BingoName("First Column")] == 5
+    assert bingo_type_stats.incomplete_squares_by_bingo[BingoName("Diagonal")] == 2
+
+
+def get_card(*title_authors: tuple[str, str]) -> BingoCard:
+    return BingoCard(
+        squares={
+            SquareName(square_name): (
+                None
+                if title_author is None
+                else BingoSquare(
+                    title=Title(title_author[0]), author=Author(title_author[1]), hard_mode=False
+                )
+            )
+            for square_name, title_author in zip(
+                ("Hidden Gem", "Short Stories"), (*title_authors, None)
+            )
+        },
+        subbed_square_map={},
+    )
+
+
+def test_merged_stats_match_single_pass() -> None:
+    cards = {
+        CardID("1"): get_card(("Good Omens", "Neil Gaiman, Terry Pratchett")),
+        CardID("2"): get_card(("Mort", "Terry Pratchett"), ("Uprooted", "Naomi Novik")),
+        CardID("3"): get_card(("Good Omen", "Neil Gaiman, Terry Pratchett")),
+        CardID("4"): get_card(("Mort", "Terry Pratchett")),
+        CardID("5"): get_card(("Spinning Silver", "Naomi Novik"), ("Mort", "Terry Pratchett")),
+    }
+    book_dedupe_map = {
+        Book("Good Omen /// Neil Gaiman, Terry Pratchett"): Book(
+            "Good Omens /// Neil Gaiman, Terry Pratchett"
+        )
+    }
+    author_data = {
+        Author("Terry Pratchett"): AuthorInfo.model_validate({"gender": "Man"}),
+        Author("Naomi Novik"): AuthorInfo.model_validate({"gender": "Woman"}),
+    }
+
+    card_items = list(cards.items())
+    single_pass = get_partial_bingo_stats(cards, book_dedupe_map, author_data)
+    merged = (
+        get_partial_bingo_stats(dict(card_items[:2]), book_dedupe_map, author_data)
+        .merge(get_partial_bingo_stats(dict(card_items[2:3]), book_dedupe_map, author_data))
+        .merge(get_partial_bingo_stats(dict(card_items[3:]), book_dedupe_map, author_data))
+    )
+
+    single_pass_stats = resolve_bingo_stats(single_pass, CARD_DATA, author_data)
+    merged_stats = resolve_bingo_stats(merged, CARD_DATA, author_data)
+    assert merged_stats.model_dump_json() == single_pass_stats.model_dump_json()
+    assert dict(merged_stats.card_uniques) == {
+        CardID("1"): 0,
+        CardID("2"): 1,
+        CardID("3"): 0,
+        CardID("4"): 0,
+        CardID("5"): 1,
+    }
+    assert list(merged_stats.unique_author_stats.gender_count.items()) == list(
+        single_pass_stats.unique_author_stats.gender_count.items()
+    )
@@ -0,0 +1,83 @@
+from pathlib import Path
+
+from pytest import (
+    fixture,
+    mark,
+)
+from thefuzz import (  # type: ignore[import-untyped]
+    fuzz,
+    process,
+)
+
+from rfantasy_bingo_stats.match_books.candidate_index import NgramIndex
+from rfantasy_bingo_stats.models.defined_types import Author
+from rfantasy_bingo_stats.models.recorded_states import RecordedDupes
+
+DUPE_TEST_FILEPATH = Path(__file__).parent / "test_data" / "resolved_duplicates.json"
+
+
+@fixture(name="recorded_dupes")
+def get_recorded_dupes() -> RecordedDupes:
+    with DUPE_TEST_FILEPATH.open("r", encoding="utf8") as dupe_file:
+        return RecordedDupes.model_validate_json(dupe_file.read())
+
+
+@mark.parametrize("match_score", [70, 80, 90, 95])
+def test_author_candidates_cover_matches(recorded_dupes: RecordedDupes, match_score: int) -> None:
+    all_authors = set(recorded_dupes.author_dupes.keys()).union(
+        *recorded_dupes.author_dupes.values()
+    )
+    choice_index = NgramIndex(all_authors)
+    for author in all_authors:
+        candidates = choice_index.get_candidates(author, match_score)
+        for match, _ in process.extractBests(
+            author, all_authors, score_cutoff=match_score, limit=None
+        ):
+            assert match in candidates
+
+
+@mark.parametrize("match_score", [70, 80, 90, 95])
+def test_book_candidates_cover_matches(recorded_dupes: RecordedDupes, match_score: int) -> None:
+    all_books = set(recorded_dupes.book_dupes.keys()).union(*recorded_dupes.book_dupes.values())
+    choice_index = NgramIndex(all_books)
+    for book in all_books:
+        candidates = choice_index.get_candidates(book, match_score)
+        for match, _ in process.extractBests(
+            book, all_books, score_cutoff=match_score, limit=None
+        ):
+            assert match in candidates
+
+
+def test_added_choices_are_candidates() -> None:
+    choice_index = NgramIndex({Author("Brandon Sanderson")})
+    choice_index.add(Author("Brandon Sandersen"))
+    assert Author("Brandon Sandersen") in choice_index.get_candidates(
+        Author("Brandon Sanderson"), 90
+    )
+    assert choice_index.get_normalized(Author("Brandon Sandersen")) == "brandon sandersen"
+
+
+def test_repeated_words_are_candidates() -> None:
+    # `token_set_ratio` ignores repeated words, so these score 95 despite their lengths
+    choice_index = NgramIndex({Author("abc xyzw"), Author("Travis Baldree Travis Baldree")})
+    assert Author("abc xyzw") in choice_index.get_candidates(Author("abc abc abc"), 90)
+    assert Author("Travis Baldree Travis Baldree") in choice_index.get_candidates(
+        Author("Brigands Breadknives Travis Baldree"), 90
+    )
+
+
+@mark.parametrize(
+    ("query", "choice", "match_score"),
+    [
+        ("Mcaya Dene", "Maya Deane", 90),
+        ("Karen Dvce", "Karen Duve", 90),
+        ("Ryukish0a7", "Ryukishi07", 90),
+        ("Wrbst", "Wurst", 80),
+    ],
+)
+def test_candidates_scoring_exactly_the_cutoff(query: str, choice: str, match_score: int) -> None:
+    # Combined lengths that are multiples of 10 allow a whole number of edits at the cutoff
+    assert fuzz.WRatio(query, choice) == match_score
+    assert Author(choice) in NgramIndex({Author(choice)}).get_candidates(
+        Author(query), match_score
+    )
@@ -0,0 +1,41 @@
+from pathlib import Path
+
+from rfantasy_bingo_stats.data_operations.card_index import (
+    read_card_summaries,
+    read_card_summary,
+    write_card_index,
+)
+from rfantasy_bingo_stats.models.card_summary import (
+    CardSummary,
+    SquareBookUses,
+)
+from rfantasy_bingo_stats.models.defined_types import (
+    Book,
+    CardID,
+    SquareName,
+)
+
+
+def test_cards_read_from_index(tmp_path: Path) -> None:
+    index_filepath = tmp_path / "card_index.jsonl"
+    offsets_filepath = tmp_path / "card_index_offsets.json"
+    card_summaries = [
+        CardSummary(
+            card_id=CardID(card_num),
+            square_books=(
+                SquareBookUses(
+                    square_name=SquareName("Hidden Gem"),
+                    book=Book(f"Book {card_num} /// Ann Leckie"),
+                    total_uses=int(card_num),
+                    square_uses=1,
+                ),
+            ),
+        )
+        for card_num in ("1", "2", "3")
+    ]
+
+    write_card_index(card_summaries, index_filepath, offsets_filepath)
+
+    assert read_card_summary(CardID("2"), index_filepath, offsets_filepath) == card_summaries[1]
+    assert read_card_summary(CardID("3"), index_filepath, offsets_filepath) == card_summaries[2]
+    assert list(read_card_summaries(index_filepath)) == card_summaries
@@ -0,0 +1,43 @@
+from pathlib import Path
+
+from rfantasy_bingo_stats.data_operations.decision_journal import (
+    attach_journal,
+    replay_journal,
+)
+from rfantasy_bingo_stats.models.defined_types import (
+    Author,
+    Book,
+)
+from rfantasy_bingo_stats.models.recorded_ignores import RecordedIgnores
+from rfantasy_bingo_stats.models.recorded_states import RecordedDupes
+
+DUPES_JSON = """
+{
+    "author_dupes": {"Robin Hobb": ["Robin Hob"], "Naomi Novik": []},
+    "book_dupes": {"Assassin's Apprentice /// Robin Hobb": []}
+}
+"""
+IGNORES_JSON = '{"ignored_author_dupes": {}, "ignored_book_dupes": {}}'
+
+
+def test_replay_matches_journaled_changes(tmp_path: Path) -> None:
+    journal_filepath = tmp_path / "journal.jsonl"
+    recorded_dupes = RecordedDupes.model_validate_json(DUPES_JSON)
+    recorded_ignores = RecordedIgnores.model_validate_json(IGNORES_JSON)
+    attach_journal(recorded_dupes, recorded_ignores, journal_filepath)
+
+    recorded_dupes.author_groups.add_dupes(Author("Robin Hobb"), {Author("Robbin Hobb")})
+    recorded_dupes.author_groups.merge_canonical(Author("Naomi Novik"), Author("Naomi  Novik"))
+    recorded_dupes.author_groups.remove_dupe(Author("Robin Hob"))
+    recorded_dupes.book_groups.add_canonical(Book("Uprooted /// Naomi Novik"))
+    recorded_ignores.author_ignores.ignore(Author("Robin Hobb"), {Author("Robin Hob")})
+
+    replayed_dupes = RecordedDupes.model_validate_json(DUPES_JSON)
+    replayed_ignores = RecordedIgnores.model_validate_json(IGNORES_JSON)
+    assert replay_journal(replayed_dupes, replayed_ignores, journal_filepath) == 5
+
+    assert replayed_dupes.model_dump_json() == recorded_dupes.model_dump_json()
+    assert replayed_ignores.model_dump_json() == recorded_ignores.model_dump_json()
+    # Replaying over a snapshot that already includes the changes leaves it unchanged
+    replay_journal(replayed_dupes, replayed_ignores, journal_filepath)
+    assert replayed_dupes.model_dump_json() == recorded_dupes.model_dump_json()
@@ -0,0 +1,79 @@
+from collections import defaultdict
+
+from pytest import MonkeyPatch
+
+from rfantasy_bingo_stats.models.defined_types import Author
+from rfantasy_bingo_stats.models.dupe_groups import DupeGroups
+from rfantasy_bingo_stats.models.recorded_states import handle_overlaps
+
+
+def test_merge_updates_canonicals() -> None:
+    author_groups = DupeGroups(
+        defaultdict(
+            set,
+            {
+                Author("Robin Hobb"): {Author("Robin Hob")},
+                Author("Robin Hobbs"): {Author("Robbin Hobbs")},
+            },
+        )
+    )
+
+    author_groups.merge_canonical(Author("Robin Hobbs"), Author("Robin Hobb"))
+
+    assert not author_groups.is_canonical(Author("Robin Hobbs"))
+    for dupe in (Author("Robin Hob"), Author("Robin Hobbs"), Author("Robbin Hobbs")):
+        assert author_groups.get_canonical(dupe) == Author("Robin Hobb")
+
+
+def test_add_dupe_from_other_group() -> None:
+    dupes = defaultdict(
+        set,
+        {
+            Author("N. K. Jemisin"): {Author("NK Jemisin")},
+            Author("N.K. Jemisin"): {Author("N.K Jemisin")},
+        },
+    )
+    author_groups = DupeGroups(dupes)
+
+    author_groups.add_dupes(Author("N. K. Jemisin"), {Author("N.K Jemisin")})
+
+    assert dupes == {
+        Author("N. K. Jemisin"): {
+            Author("NK Jemisin"),
+            Author("N.K. Jemisin"),
+            Author("N.K Jemisin"),
+        }
+    }
+    assert author_groups.get_canonical(Author("N.K. Jemisin")) == Author("N. K. Jemisin")
+
+
+def test_handle_overlaps(monkeypatch: MonkeyPatch) -> None:
+    dupes = defaultdict(
+        set,
+        {
+            Author("Ursula K. Le Guin"): {Author("Ursula K Le Guin"), Author("Ursula K. Le Guin")},
+            Author("Ursula K. LeGuin"): {Author("Ursula Le Guin"), Author("Ursula K Le Guin")},
+            Author("Ursula LeGuin"): {Author("Ursula K. LeGuin")},
+            Author("Ann Leckie"): {Author("Anne Leckie")},
+        },
+    )
+    prompts: list[str] = []
+
+    def choose_first(prompt: str) -> str:
+        prompts.append(prompt)
+        return "0"
+
+    monkeypatch.setattr("builtins.input", choose_first)
+
+    handle_overlaps(dupes)
+
+    assert len(prompts) == 1
+    assert dupes == {
+        Author("Ursula K. Le Guin"): {
+            Author("Ursula K Le Guin"),
+            Author("Ursula K. LeGuin"),
+            Author("Ursula Le Guin"),
+            Author("Ursula LeGuin"),
+        },
+        Author("Ann Leckie"): {Author("Anne Leckie")},
+    }
@@ -0,0 +1,48 @@
+import random
+import string
+
+from rapidfuzz.distance import Levenshtein
+
+from rfantasy_bingo_stats.match_books.candidate_index import normalize_choice
+from rfantasy_bingo_stats.match_books.edit_distance import (
+    BkTree,
+    EditDistanceBlocks,
+)
+from rfantasy_bingo_stats.match_books.match_scorer import MatchScorer
+from rfantasy_bingo_stats.models.defined_types import Author
+
+
+def test_bk_tree_matches_exhaustive_search() -> None:
+    rng = random.Random(12)
+    authors = frozenset(
+        Author("".join(rng.choices(string.ascii_lowercase[:4] + " ", k=rng.randint(3, 9))))
+        for _ in range(300)
+    )
+    bk_tree = BkTree(authors)
+
+    for query in tuple(authors)[:30]:
+        for max_edits in range(4):
+            assert bk_tree.get_within(query, max_edits) == {
+                author
+                for author in authors
+                if Levenshtein.distance(normalize_choice(query), normalize_choice(author))
+                <= max_edits
+            }
+
+
+def test_edit_distance_blocks_limit_matches() -> None:
+    authors = frozenset(
+        {
+            Author("Brandon Sanderson"),
+            Author("Brandon Sandersn"),
+            Author("brandon sandersen"),
+            Author("Sanderson, Brandon"),
+        }
+    )
+    match_scorer = MatchScorer(authors, 85, EditDistanceBlocks(authors, 1))
+
+    assert dict(match_scorer.get_matches(Author("Brandon Sanderson"))).keys() == {
+        Author("Brandon Sanderson"),
+        Author("Brandon Sandersn"),
+        Author("brandon sandersen"),
+    }
@@ -0,0 +1,48 @@
+from collections import defaultdict
+
+from rfantasy_bingo_stats.match_books.exact_match import (
+    get_match_key,
+    merge_exact_matches,
+)
+from rfantasy_bingo_stats.models.defined_types import (
+    Author,
+    Book,
+)
+from rfantasy_bingo_stats.models.dupe_groups import DupeGroups
+from rfantasy_bingo_stats.models.ignored_matches import IgnoredMatches
+
+
+def test_match_key() -> None:
+    assert get_match_key(Author("Kōbō  Abe")) == get_match_key(Author("kobo abe"))
+    assert get_match_key(Book("The Hero’s Journey /// Jo Walton")) == get_match_key(
+        Book("hero's journey /// JO WALTON")
+    )
+    # Only a leading "The" on the title is dropped
+    assert get_match_key(Author("The Brothers Grimm")) != get_match_key(Author("Brothers Grimm"))
+
+
+def test_merge_exact_matches() -> None:
+    dupes = defaultdict(set, {Author("Ursula K. Le Guin"): {Author("Ursula K Le Guin")}})
+    author_groups = DupeGroups(dupes)
+    all_matches_to_ignore = IgnoredMatches(
+        defaultdict(set, {Author("ANN LECKIE"): {Author("Ann Leckie")}})
+    )
+
+    new_canonicals = merge_exact_matches(
+        {
+            Author("ursula k le guin"),
+            Author("Naomi Novik"),
+            Author("Naomi  Novik"),
+            Author("naomi novik"),
+            Author("Ann Leckie"),
+            Author("ANN LECKIE"),
+        },
+        author_groups,
+        all_matches_to_ignore,
+    )
+
+    assert new_canonicals == {Author("Naomi Novik")}
+    assert dupes == {
+        Author("Ursula K. Le Guin"): {Author("Ursula K Le Guin"), Author("ursula k le guin")},
+        Author("Naomi Novik"): {Author("Naomi  Novik"), Author("naomi novik")},
+    }
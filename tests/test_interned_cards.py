@@ -0,0 +1,85 @@
+import numpy as np
+
+from rfantasy_bingo_stats.calculate_statistics.interned_cards import (
+    NO_ID,
+    count_in_order,
+    count_pairs_in_order,
+    get_square_masks,
+    intern_cards,
+)
+from rfantasy_bingo_stats.models.bingo_card import (
+    BingoCard,
+    BingoSquare,
+)
+from rfantasy_bingo_stats.models.defined_types import (
+    Author,
+    Book,
+    CardID,
+    SquareName,
+    Title,
+)
+
+
+def test_counted_in_order_of_first_appearance() -> None:
+    keys, counts = count_in_order(np.array([5, 2, 5, 9, 2, 5]))
+    assert keys.tolist() == [5, 2, 9]
+    assert counts.tolist() == [3, 2, 1]
+
+    first_ids, second_ids, counts = count_pairs_in_order(
+        np.array([1, 0, 1, 1]), np.array([2, 2, 0, 2]), 3
+    )
+    assert first_ids.tolist() == [1, 0, 1]
+    assert second_ids.tolist() == [2, 2, 0]
+    assert counts.tolist() == [2, 1, 1]
+
+    masks = get_square_masks(np.array([[True, False, True], [False, False, False]]))
+    assert masks.tolist() == [0b101, 0]
+
+
+def test_cards_interned() -> None:
+    cards = {
+        CardID("1"): BingoCard(
+            squares={
+                SquareName("Hidden Gem"): BingoSquare(
+                    title=Title("Good Omens"),
+                    author=Author("Neil Gaiman, Terry Pratchett"),
+                    hard_mode=True,
+                ),
+                SquareName("Book Club"): None,
+            },
+            subbed_square_map={},
+        ),
+        CardID("2"): BingoCard(
+            squares={
+                SquareName("Hidden Gem"): BingoSquare(
+                    title=Title("Good Omen"),
+                    author=Author("Neil Gaiman, Terry Pratchett"),
+                    hard_mode=False,
+                ),
+            },
+            subbed_square_map={},
+        ),
+    }
+
+    interned = intern_cards(
+        cards,
+        {
+            Book("Good Omen /// Neil Gaiman, Terry Pratchett"): Book(
+                "Good Omens /// Neil Gaiman, Terry Pratchett"
+            )
+        },
+        square_count=2,
+    )
+
+    assert interned.books.values == [Book("Good Omens /// Neil Gaiman, Terry Pratchett")]
+    assert interned.authors.values == [Author("Neil Gaiman"), Author("Terry Pratchett")]
+    assert interned.square_name_ids.tolist() == [[0, 1], [0, NO_ID]]
+    assert interned.book_ids.tolist() == [[0, NO_ID], [0, NO_ID]]
+    assert interned.misspelling_ids.tolist() == [[NO_ID, NO_ID], [0, NO_ID]]
+    assert interned.completed.tolist() == [[True, False], [True, False]]
+    assert interned.hard_mode.tolist() == [[True, False], [False, False]]
+
+    occurrences = interned.get_author_occurrences()
+    assert occurrences.author_ids.tolist() == [0, 1, 0, 1]
+    assert occurrences.book_ids.tolist() == [0, 0, 0, 0]
+    assert occurrences.shared_book.tolist() == [True, True, True, True]
@@ -0,0 +1,61 @@
+from pathlib import Path
+
+from rfantasy_bingo_stats.match_books.match_scorer import MatchScorer
+from rfantasy_bingo_stats.models.defined_types import Author
+from rfantasy_bingo_stats.models.scored_candidates import ScoredCandidates
+
+AUTHORS = frozenset(
+    {
+        Author("Brandon Sanderson"),
+        Author("Brandon Sandersen"),
+        Author("Brandon Sandersn"),
+        Author("Robin Hobb"),
+        Author("Robin Hob"),
+        Author("Ann Leckie"),
+    }
+)
+
+
+def test_prescored_matches_live_scores(tmp_path: Path) -> None:
+    match_scorer = MatchScorer(AUTHORS, 90, None)
+    match_scorer.prescore(AUTHORS, tmp_path / "candidates.json")
+
+    live_scorer = MatchScorer(AUTHORS, 90, None)
+    for author in AUTHORS:
+        assert match_scorer.get_matches(author) == live_scorer.get_matches(author)
+
+
+def test_saved_candidates_reused(tmp_path: Path) -> None:
+    candidate_filepath = tmp_path / "candidates.json"
+    MatchScorer(AUTHORS, 90, None).prescore(AUTHORS, candidate_filepath)
+
+    # Change a saved score to tell saved scores apart from fresh ones
+    scored_candidates = ScoredCandidates.model_validate_json(
+        candidate_filepath.read_text(encoding="utf8")
+    )
+    candidates = dict(scored_candidates.candidates)
+    candidates[Author("Robin Hob")] = ((Author("Robin Hobb"), 99),)
+    candidate_filepath.write_text(
+        scored_candidates.model_copy(update={"candidates": candidates}).model_dump_json(),
+        encoding="utf8",
+    )
+
+    match_scorer = MatchScorer(AUTHORS, 90, None)
+    match_scorer.prescore(AUTHORS, candidate_filepath)
+    assert match_scorer.get_matches(Author("Robin Hob")) == ((Author("Robin Hobb"), 99),)
+
+    # A different pool invalidates the saved scores
+    match_scorer = MatchScorer(AUTHORS | {Author("Anne Leckie")}, 90, None)
+    match_scorer.prescore(AUTHORS, candidate_filepath)
+    assert match_scorer.get_matches(Author("Robin Hob")) == (
+        (Author("Robin Hob"), 100),
+        (Author("Robin Hobb"), 95),
+    )
+
+
+def test_late_choices_scored(tmp_path: Path) -> None:
+    match_scorer = MatchScorer(AUTHORS, 90, None)
+    match_scorer.prescore(AUTHORS, tmp_path / "candidates.json")
+    match_scorer.add_choice(Author("Anne Leckie"))
+
+    assert Author("Anne Leckie") in dict(match_scorer.get_matches(Author("Ann Leckie")))
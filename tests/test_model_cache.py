@@ -0,0 +1,54 @@
+from pathlib import Path
+
+from rfantasy_bingo_stats.data_operations.model_cache import load_validated
+from rfantasy_bingo_stats.models.defined_types import Author
+from rfantasy_bingo_stats.models.recorded_states import RecordedDupes
+
+DUPES_JSON = """
+{
+    "author_dupes": {"Robin Hobb": ["Robin Hob", "Robbin Hobb"]},
+    "book_dupes": {}
+}
+"""
+
+
+def test_cache_reused_until_source_changes(tmp_path: Path) -> None:
+    source_filepath = tmp_path / "dupes.json"
+    cache_filepath = tmp_path / "dupes.pickle"
+    source_filepath.write_text(DUPES_JSON, encoding="utf8")
+    validated_sources: list[bytes] = []
+
+    def validate(source: bytes) -> RecordedDupes:
+        validated_sources.append(source)
+        return RecordedDupes.model_validate_json(source)
+
+    first = load_validated(source_filepath, "RecordedDupes", validate, cache_filepath)
+    cached = load_validated(source_filepath, "RecordedDupes", validate, cache_filepath)
+    assert len(validated_sources) == 1
+    assert cached.model_dump_json() == first.model_dump_json()
+    # Private indexes survive the cache along with the fields
+    assert cached.author_groups.get_canonical(Author("Robbin Hobb")) == Author("Robin Hobb")
+
+    source_filepath.write_text(DUPES_JSON.replace("Robbin", "Robyn"), encoding="utf8")
+    changed = load_validated(source_filepath, "RecordedDupes", validate, cache_filepath)
+    assert len(validated_sources) == 2
+    assert changed.author_groups.get_canonical(Author("Robyn Hobb")) == Author("Robin Hobb")
+
+    # Results validated as another type are never reused
+    load_validated(source_filepath, "OtherDupes", validate, cache_filepath)
+    assert len(validated_sources) == 3
+
+
+def test_unreadable_cache_revalidated(tmp_path: Path) -> None:
+    source_filepath = tmp_path / "dupes.json"
+    cache_filepath = tmp_path / "dupes.pickle"
+    source_filepath.write_text(DUPES_JSON, encoding="utf8")
+    cache_filepath.write_bytes(b"not a pickle")
+
+    recorded_dupes = load_validated(
+        source_filepath, "RecordedDupes", RecordedDupes.model_validate_json, cache_filepath
+    )
+    assert recorded_dupes.author_groups.is_dupe(Author("Robbin Hobb"))
+    assert load_validated(
+        source_filepath, "RecordedDupes", RecordedDupes.model_validate_json, cache_filepath
+    ).author_groups.is_dupe(Author("Robbin Hobb"))
@@ -0,0 +1,44 @@
+from rfantasy_bingo_stats.match_books.match_scorer import MatchScorer
+from rfantasy_bingo_stats.match_books.prefetch import MatchPrefetcher
+from rfantasy_bingo_stats.models.defined_types import Author
+
+AUTHORS = frozenset(
+    {
+        Author("Robin Hobb"),
+        Author("Robin Hob"),
+        Author("Ann Leckie"),
+        Author("Anne Leckie"),
+        Author("Naomi Novik"),
+    }
+)
+
+
+def test_scan_skips_removed_items() -> None:
+    unscanned_authors = set(AUTHORS)
+    scanned_authors = []
+    with MatchPrefetcher(MatchScorer(AUTHORS, 85, None), 2) as match_prefetcher:
+        for author in match_prefetcher.scan(unscanned_authors):
+            scanned_authors.append(author)
+            if author == Author("Ann Leckie"):
+                unscanned_authors.discard(Author("Anne Leckie"))
+
+    assert scanned_authors == [
+        Author("Ann Leckie"),
+        Author("Naomi Novik"),
+        Author("Robin Hob"),
+        Author("Robin Hobb"),
+    ]
+    assert len(unscanned_authors) == 0
+
+
+def test_new_choices_invalidate_prefetched_matches() -> None:
+    live_scorer = MatchScorer(AUTHORS, 85, None)
+    with MatchPrefetcher(MatchScorer(AUTHORS, 85, None), 2) as match_prefetcher:
+        match_prefetcher.prefetch([Author("Robin Hob"), Author("Ann Leckie")])
+        match_prefetcher.add_choice(Author("Robin Hobbe"))
+        live_scorer.add_choice(Author("Robin Hobbe"))
+
+        assert Author("Robin Hobbe") in dict(match_prefetcher.get_matches(Author("Robin Hob")))
+        assert match_prefetcher.get_matches(Author("Ann Leckie")) == live_scorer.get_matches(
+            Author("Ann Leckie")
+        )
@@ -0,0 +1,32 @@
+from collections import Counter
+
+from rfantasy_bingo_stats.models.defined_types import Author
+from rfantasy_bingo_stats.scripts.utils import RankIndex
+
+
+def test_values_ranked_by_count() -> None:
+    rank_index = RankIndex(
+        Counter(
+            {
+                Author("Martha Wells"): 2,
+                Author("Ann Leckie"): 5,
+                Author("N. K. Jemisin"): 2,
+                Author("Becky Chambers"): 1,
+            }
+        )
+    )
+
+    assert rank_index.values == (
+        Author("Ann Leckie"),
+        Author("Martha Wells"),
+        Author("N. K. Jemisin"),
+        Author("Becky Chambers"),
+    )
+    assert rank_index.places.tolist() == [1, 2, 2, 3]
+
+    rank = rank_index.get_rank(Author("N. K. Jemisin"))
+    assert rank is not None
+    assert (rank.count, rank.place) == (2, 2)
+    assert rank.count_percentile == 90.0
+    assert rank.place_percentile == 50.0
+    assert rank_index.get_rank(Author("Ursula K. Le Guin")) is None
@@ -0,0 +1,66 @@
+from pathlib import Path
+
+from rfantasy_bingo_stats.data_operations.state_store import StateStore
+from rfantasy_bingo_stats.models.author_info import (
+    AuthorInfo,
+    Gender,
+)
+from rfantasy_bingo_stats.models.defined_types import (
+    Author,
+    Book,
+)
+from rfantasy_bingo_stats.models.recorded_ignores import RecordedIgnores
+from rfantasy_bingo_stats.models.recorded_states import RecordedDupes
+
+DUPES_JSON = """
+{
+    "author_dupes": {"Robin Hobb": ["Robin Hob"], "Naomi Novik": [], "Robin Hobbs": ["Robbin Hobbs"]},
+    "book_dupes": {"Assassin's Apprentice /// Robin Hobb": []}
+}
+"""
+IGNORES_JSON = """
+{
+    "ignored_author_dupes": {"Ann Leckie": ["Anne Leckie"], "Naomi Novik": []},
+    "ignored_book_dupes": {}
+}
+"""
+
+
+def test_point_updates_match_changes(tmp_path: Path) -> None:
+    state_store = StateStore(tmp_path / "state.sqlite")
+    state_store.save_states(
+        RecordedDupes.model_validate_json(DUPES_JSON),
+        RecordedIgnores.model_validate_json(IGNORES_JSON),
+    )
+
+    recorded_dupes, recorded_ignores = state_store.load_states()
+    assert (
+        recorded_dupes.model_dump_json()
+        == RecordedDupes.model_validate_json(DUPES_JSON).model_dump_json()
+    )
+    assert (
+        recorded_ignores.model_dump_json()
+        == RecordedIgnores.model_validate_json(IGNORES_JSON).model_dump_json()
+    )
+
+    state_store.attach(recorded_dupes, recorded_ignores)
+    recorded_dupes.author_groups.merge_canonical(Author("Robin Hobbs"), Author("Robin Hobb"))
+    recorded_dupes.author_groups.add_dupes(Author("Naomi Novik"), {Author("Naomi  Novik")})
+    recorded_dupes.author_groups.remove_dupe(Author("Robin Hob"))
+    recorded_dupes.book_groups.add_canonical(Book("Uprooted /// Naomi Novik"))
+    recorded_ignores.author_ignores.ignore(Author("Robin Hobb"), {Author("Robin Hob")})
+
+    reloaded_dupes, reloaded_ignores = StateStore(tmp_path / "state.sqlite").load_states()
+    assert reloaded_dupes.model_dump_json() == recorded_dupes.model_dump_json()
+    assert reloaded_ignores.model_dump_json() == recorded_ignores.model_dump_json()
+
+
+def test_info_updates(tmp_path: Path) -> None:
+    state_store = StateStore(tmp_path / "state.sqlite")
+    author_info = {Author("Robin Hob"): AuthorInfo(gender=Gender.W)}
+    state_store.update_info("author_info", {}, author_info)
+    assert state_store.load_author_info() == author_info
+
+    renamed_info = {Author("Robin Hobb"): AuthorInfo(gender=Gender.W)}
+    state_store.update_info("author_info", author_info, renamed_info)
+    assert state_store.load_author_info() == renamed_info
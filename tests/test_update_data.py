@@ -0,0 +1,86 @@
+from pathlib import Path
+
+import pandas
+
+from rfantasy_bingo_stats.data_operations.update_data import (
+    update_bingo_authors,
+    update_bingo_books,
+)
+from rfantasy_bingo_stats.models.defined_types import (
+    Author,
+    AuthorCol,
+    Book,
+    HardModeCol,
+    TitleAuthorHMCols,
+    TitleCol,
+)
+
+ALL_COLS: tuple[TitleAuthorHMCols, ...] = (
+    (TitleCol("SQUARE 1: TITLE"), AuthorCol("SQUARE 1: AUTHOR"), HardModeCol("")),
+    (TitleCol("SQUARE 2: TITLE"), AuthorCol("SQUARE 2: AUTHOR"), HardModeCol("")),
+)
+
+
+def get_data() -> pandas.DataFrame:
+    return pandas.DataFrame(
+        {
+            "CARD": ["1", "2", "3"],
+            "SQUARE 1: TITLE": ["Uprooted", "Uprooted", None],
+            "SQUARE 1: AUTHOR": ["Naomi Novik", "Naomi Novick", None],
+            "SQUARE 2: TITLE": ["Assassins Apprentice", "Uprooted", "Piranesi"],
+            "SQUARE 2: AUTHOR": ["Robin Hob", "Naomi Novick", "Susanna Clarke"],
+        }
+    ).set_index("CARD")
+
+
+def test_update_bingo_authors(tmp_path: Path) -> None:
+    updated_data, author_dedupes = update_bingo_authors(
+        get_data(),
+        {
+            Author("Naomi Novik"): {Author("Naomi Novick")},
+            Author("Robin Hobb"): {Author("Robin Hob")},
+        },
+        ALL_COLS,
+        tmp_path / "updated.csv",
+    )
+
+    assert updated_data["SQUARE 1: AUTHOR"].tolist() == ["Naomi Novik", "Naomi Novik", None]
+    assert updated_data["SQUARE 2: AUTHOR"].tolist() == [
+        "Robin Hobb",
+        "Naomi Novik",
+        "Susanna Clarke",
+    ]
+    assert dict(author_dedupes) == {
+        Book("Uprooted /// Naomi Novik"): frozenset({Book("Uprooted /// Naomi Novick")}),
+        Book("Assassins Apprentice /// Robin Hobb"): frozenset(
+            {Book("Assassins Apprentice /// Robin Hob")}
+        ),
+    }
+    assert (tmp_path / "updated.csv").exists()
+
+
+def test_update_bingo_books(tmp_path: Path) -> None:
+    updated_data = update_bingo_books(
+        get_data(),
+        {
+            Book("Assassin's Apprentice /// Robin Hobb"): {
+                Book("Assassins Apprentice /// Robin Hob")
+            },
+            Book("Uprooted /// Naomi Novik"): {Book("Uprooted /// Naomi Novick")},
+        },
+        ALL_COLS,
+        tmp_path / "updated.csv",
+    )
+
+    assert updated_data["SQUARE 1: TITLE"].tolist() == ["Uprooted", "Uprooted", None]
+    assert updated_data["SQUARE 1: AUTHOR"].tolist() == ["Naomi Novik", "Naomi Novik", None]
+    assert updated_data["SQUARE 2: TITLE"].tolist() == [
+        "Assassin's Apprentice",
+        "Uprooted",
+        "Piranesi",
+    ]
+    assert updated_data["SQUARE 2: AUTHOR"].tolist() == [
+        "Robin Hobb",
+        "Naomi Novik",
+        "Susanna Clarke",
+    ]